@@ -32,6 +32,8 @@ Package includes script that configures Sensu checks, entities, and namespaces u
 %install
 %{py3_install "--record=INSTALLED_FILES" }
 install --directory %{buildroot}/%{_localstatedir}/log/argo-scg/
+install --directory %{buildroot}/%{_sharedstatedir}/argo-scg/
+install --directory %{buildroot}/%{_localstatedir}/cache/argo-scg/
 
 
 %clean
@@ -45,3 +47,5 @@ rm -rf $RPM_BUILD_ROOT
 %{python3_sitelib}/%{underscore %{name}}/*.py
 
 %attr(0755,root,root) %dir %{_localstatedir}/log/argo-scg/
+%attr(0755,root,root) %dir %{_sharedstatedir}/argo-scg/
+%attr(0755,root,root) %dir %{_localstatedir}/cache/argo-scg/
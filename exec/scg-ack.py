@@ -4,6 +4,7 @@ import argparse
 from argo_scg.config import Config
 from argo_scg.exceptions import SensuException, ConfigException
 from argo_scg.sensu import Sensu
+from argo_scg.session import configure_session
 from argo_scg.utils import namespace4tenant
 
 CONFFILE = "/etc/argo-scg/scg.conf"
@@ -32,13 +33,15 @@ def main():
 
     try:
         config = Config(config_file=args.conf)
+        configure_session(**config.get_http_settings())
 
         namespaces = config.get_namespaces()
 
         sensu = Sensu(
             url=config.get_sensu_url(),
             token=config.get_sensu_token(),
-            namespaces=namespaces
+            namespaces=namespaces,
+            page_size=config.get_sensu_page_size()
         )
 
         sensu.create_silencing_entry(
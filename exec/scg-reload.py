@@ -1,21 +1,328 @@
 #!/usr/bin/env python3
 import argparse
+import concurrent.futures
 import json
+import logging
 import sys
+import threading
 
+from argo_scg.cache import ResponseCache
 from argo_scg.config import Config, AgentConfig
 from argo_scg.exceptions import SensuException, ConfigException, \
     PoemException, WebApiException, GeneratorException
-from argo_scg.generator import ConfigurationGenerator, ConfigurationMerger
-from argo_scg.logger import get_logger
+from argo_scg.generator import ConfigurationGenerator, ConfigurationMerger, \
+    get_cache_stats, stamp_hash
+from argo_scg.logger import get_logger, LOGNAME
 from argo_scg.poem import Poem
 from argo_scg.sensu import Sensu
+from argo_scg.session import configure_session
+from argo_scg.state import State, STATE_VERSION, get_digest
 from argo_scg.utils import namespace4tenant
 from argo_scg.webapi import WebApi
 
 CONFFILE = "/etc/argo-scg/scg.conf"
 
 
+def generate_configuration(namespace, tenant, inputs, settings, stream=False):
+    generator = ConfigurationGenerator(
+        metrics=inputs["metrics"],
+        metric_profiles=inputs["metric_profiles"],
+        topology=inputs["topology"],
+        profiles=settings["metricprofiles"][tenant],
+        attributes=inputs["attributes"],
+        secrets_file=settings["secrets"][tenant],
+        default_ports=inputs["default_ports"],
+        tenant=tenant,
+        default_agent=inputs["default_agent"],
+        skipped_metrics=settings["skipped_metrics"][tenant],
+        agents_config=inputs["agents_config"]
+    )
+
+    checks = generator.iter_checks(
+        publish=settings["publish"][tenant], namespace=namespace
+    )
+    entities = generator.iter_entities(
+        namespace=namespace, workers=settings["generator_workers"]
+    )
+
+    return {
+        "checks": checks if stream else list(checks),
+        "entities": entities if stream else list(entities),
+        "internal_services": generator.generate_internal_services(),
+        "metric_overrides": generator.get_metric_parameter_overrides(),
+        "attribute_overrides": generator.get_host_attribute_overrides()
+    }
+
+
+def load_topology(filename):
+    with open(filename) as f:
+        return json.load(f)
+
+
+def prefetch_namespace(namespace, tenants, sensu, settings, cache, executor):
+    # all the data needed for generation is requested at once, so that the
+    # calls to POEM, Web-API and Sensu for all the tenants of the namespace
+    # overlap; it is requested only when the namespace is being synced, so
+    # that the data of at most as many namespaces as are synced in parallel
+    # is kept in memory
+
+    # Sensu objects are fetched once per run and kept up to date with the
+    # changes made during it, so the run starts with a fresh state
+    sensu.invalidate_snapshot(namespace=namespace)
+    agents = executor.submit(sensu.get_agents, namespace=namespace)
+
+    prefetched = dict()
+    for tenant in tenants:
+        webapi = WebApi(
+            url=settings["webapi_url"],
+            token=settings["webapi_tokens"][tenant],
+            tenant=tenant,
+            topo_groups_filter=settings["topo_groups_filter"][tenant] or None,
+            topo_endpoints_filter=settings["topo_endpoints_filter"][tenant] or
+            None,
+            cache=cache
+        )
+
+        poem = Poem(
+            url=settings["poem_urls"][tenant],
+            token=settings["poem_tokens"][tenant],
+            tenant=tenant,
+            cache=cache
+        )
+
+        if settings["local_topology"][tenant]:
+            topology = executor.submit(
+                load_topology, settings["local_topology"][tenant]
+            )
+
+        else:
+            topology = executor.submit(webapi.get_topology)
+
+        prefetched.update({tenant: {
+            "topology": topology,
+            "metrics": executor.submit(
+                poem.get_metrics_configurations, compact=True
+            ),
+            "metric_profiles": executor.submit(
+                webapi.get_metric_profiles
+            ),
+            "attributes": executor.submit(poem.get_metric_overrides),
+            "default_ports": executor.submit(poem.get_default_ports),
+            "agents": agents
+        }})
+
+    return prefetched
+
+
+def sync_namespace(
+        namespace, tenants, sensu, settings, state, cache, executor,
+        full=False
+):
+    logger = logging.getLogger(LOGNAME)
+    if threading.current_thread() is not threading.main_thread():
+        threading.current_thread().name = namespace
+
+    writer = None
+    try:
+        prefetched = prefetch_namespace(
+            namespace=namespace, tenants=tenants, sensu=sensu,
+            settings=settings, cache=cache, executor=executor
+        )
+
+        namespace_secrets = ""
+        namespace_publish_bool = False
+        tenants_checks = dict()
+        tenants_entities = dict()
+        tenants_internal_services = dict()
+        tenants_metric_overrides = dict()
+        tenants_attribute_overrides = dict()
+        for tenant in tenants:
+            if settings["publish"][tenant]:
+                namespace_publish_bool = settings["publish"][tenant]
+
+            if namespace_secrets:
+                if settings["secrets"][tenant] != namespace_secrets:
+                    logger.warning(
+                        f"{namespace}: Secrets file not unique across "
+                        f"tenants"
+                    )
+
+            else:
+                namespace_secrets = settings["secrets"][tenant]
+
+            # results are collected in the order in which they used to be
+            # fetched, so the first failing request aborts the namespace
+            fetched = dict(
+                (key, future.result()) for key, future in
+                prefetched.pop(tenant).items()
+            )
+
+            if settings["agents_configurations"][tenant]:
+                agent_config = AgentConfig(
+                    file=settings["agents_configurations"][tenant]
+                )
+                custom_agent_config = agent_config.get_custom_subs()
+
+            else:
+                custom_agent_config = None
+
+            inputs = {
+                "metrics": fetched["metrics"],
+                "metric_profiles": fetched["metric_profiles"],
+                "topology": fetched["topology"],
+                "attributes": fetched["attributes"],
+                "default_ports": fetched["default_ports"],
+                "default_agent": [
+                    item["metadata"]["name"] for item in fetched["agents"]
+                ],
+                "agents_config": custom_agent_config
+            }
+
+            # the generated configuration depends only on the inputs, the
+            # tenant settings and the version of the generator, so it is
+            # reused while none of them change; Sensu is still synced with
+            # it on every run
+            digest = get_digest({
+                "version": STATE_VERSION,
+                "namespace": namespace,
+                "inputs": inputs,
+                "settings": dict(
+                    (key, settings[key][tenant]) for key in [
+                        "metricprofiles", "secrets", "publish",
+                        "skipped_metrics"
+                    ]
+                )
+            })
+
+            configuration = None
+            if not full:
+                configuration = state.get(tenant=tenant, digest=digest)
+
+            if configuration:
+                logger.debug(
+                    f"{namespace}: Inputs of tenant {tenant} unchanged, "
+                    f"using stored configuration"
+                )
+
+            elif len(tenants) == 1:
+                # configuration of a single tenant is not merged with any
+                # other, so checks and entities are spooled to the disk
+                # instead of being kept in memory; they are generated
+                # completely before Sensu is synced, so a generation error
+                # leaves Sensu untouched
+                writer = state.writer(tenant=tenant, digest=digest)
+                configuration = writer.spool(generate_configuration(
+                    namespace=namespace, tenant=tenant, inputs=inputs,
+                    settings=settings, stream=True
+                ))
+
+            else:
+                configuration = generate_configuration(
+                    namespace=namespace, tenant=tenant, inputs=inputs,
+                    settings=settings
+                )
+                state.store(
+                    tenant=tenant, digest=digest, output=configuration
+                )
+
+            tenants_checks.update({tenant: configuration["checks"]})
+            tenants_entities.update({tenant: configuration["entities"]})
+            tenants_internal_services.update({
+                tenant: configuration["internal_services"]
+            })
+            tenants_metric_overrides.update({
+                tenant: configuration["metric_overrides"]
+            })
+            tenants_attribute_overrides.update({
+                tenant: configuration["attribute_overrides"]
+            })
+
+        if len(tenants) > 1:
+            merger = ConfigurationMerger(
+                checks=tenants_checks,
+                entities=tenants_entities,
+                internal_services=tenants_internal_services,
+                metricoverrides4agents=tenants_metric_overrides,
+                attributeoverrides4agents=tenants_attribute_overrides
+            )
+
+            checks = merger.merge_checks()
+            entities = merger.merge_entities()
+            metric_parameter_overrides = \
+                merger.merge_metric_parameter_overrides()
+            host_attribute_overrides = \
+                merger.merge_attribute_overrides()
+            internal_services = merger.merge_internal_services()
+
+        else:
+            checks = tenants_checks[tenants[0]]
+            entities = tenants_entities[tenants[0]]
+            metric_parameter_overrides = tenants_metric_overrides[
+                tenants[0]
+            ]
+            host_attribute_overrides = tenants_attribute_overrides[
+                tenants[0]
+            ]
+            internal_services = tenants_internal_services[tenants[0]]
+
+        sensu.add_daily_filter(namespace=namespace)
+        sensu.handle_slack_handler(
+            secrets_file=namespace_secrets, namespace=namespace
+        )
+        sensu.add_reduce_alerts_pipeline(namespace=namespace)
+
+        if namespace_publish_bool:
+            sensu.handle_publisher_handler(namespace=namespace)
+            sensu.add_hard_state_filter(namespace=namespace)
+            sensu.add_hard_state_pipeline(namespace=namespace)
+
+        # checks and entities carry the hash of their final configuration,
+        # so the unchanged ones are recognised without comparing them
+        sensu.handle_checks(
+            checks=(stamp_hash(check) for check in checks),
+            namespace=namespace
+        )
+        sensu.add_cpu_check(namespace=namespace)
+        sensu.add_memory_check(namespace=namespace)
+
+        if namespace != "default":
+            sensu.handle_proxy_entities(
+                entities=(stamp_hash(entity) for entity in entities),
+                namespace=namespace
+            )
+
+        sensu.handle_agents(
+            metric_parameters_overrides=metric_parameter_overrides,
+            host_attributes_overrides=host_attribute_overrides,
+            services=internal_services,
+            namespace=namespace
+        )
+
+        if writer:
+            writer.commit()
+
+        logger.info(f"{namespace}: All synced!")
+
+    except json.decoder.JSONDecodeError as e:
+        logger.error(f"{namespace}: Error reading JSON: {str(e)}")
+        logger.warning(f"{namespace}: Skipping configuration...")
+
+    except (
+            WebApiException, PoemException, GeneratorException,
+            SensuException
+    ):
+        logger.warning(f"{namespace}: Skipping configuration...")
+
+    except Exception as e:
+        logger.warning(
+            f"{namespace}: {str(e)} Skipping configuration..."
+        )
+
+    finally:
+        if writer:
+            writer.close()
+
+
 def main():
     parser = argparse.ArgumentParser(
         "Sync data from POEM and Web-API with Sensu"
@@ -26,31 +333,57 @@ def main():
     parser.add_argument(
         "-t", "--tenant", dest="tenant", type=str, help="tenant name"
     )
+    parser.add_argument(
+        "-w", "--workers", dest="workers", type=int, default=1,
+        help="number of namespaces synced in parallel"
+    )
+    parser.add_argument(
+        "-f", "--full", dest="full", action="store_true",
+        help="regenerate configuration even if inputs are unchanged"
+    )
+    parser.add_argument(
+        "-d", "--debug", dest="debug", action="store_true",
+        help="log per-endpoint HTTP request statistics"
+    )
     args = parser.parse_args()
 
-    logger = get_logger()
+    if args.workers < 1:
+        parser.error("Number of workers must be a positive integer")
+
+    logger = get_logger(thread_names=args.workers > 1, debug=args.debug)
 
     logger.info("Started")
 
     try:
         config = Config(config_file=args.conf)
 
+        http_settings = config.get_http_settings()
+        session = configure_session(**http_settings)
+
         sensu_url = config.get_sensu_url()
         sensu_token = config.get_sensu_token()
-        webapi_url = config.get_webapi_url()
-        webapi_tokens = config.get_webapi_tokens()
-        topo_groups_filter = config.get_topology_groups_filter()
-        topo_endpoints_filter = config.get_topology_endpoints_filter()
-        poem_urls = config.get_poem_urls()
-        poem_tokens = config.get_poem_tokens()
-        metricprofiles = config.get_metricprofiles()
-        local_topology = config.get_topology()
-        secrets = config.get_secrets()
-        publish_bool = config.publish()
-        skipped_metrics = config.get_skipped_metrics()
-        agents_configurations = config.get_agents_configurations()
+        settings = {
+            "webapi_url": config.get_webapi_url(),
+            "webapi_tokens": config.get_webapi_tokens(),
+            "topo_groups_filter": config.get_topology_groups_filter(),
+            "topo_endpoints_filter": config.get_topology_endpoints_filter(),
+            "poem_urls": config.get_poem_urls(),
+            "poem_tokens": config.get_poem_tokens(),
+            "metricprofiles": config.get_metricprofiles(),
+            "local_topology": config.get_topology(),
+            "secrets": config.get_secrets(),
+            "publish": config.publish(),
+            "skipped_metrics": config.get_skipped_metrics(),
+            "agents_configurations": config.get_agents_configurations(),
+            "generator_workers": config.get_generator_workers()
+        }
 
         namespaces = config.get_namespaces()
+        state = State(directory=config.get_state_dir())
+        cache = ResponseCache(
+            directory=config.get_cache_dir(),
+            max_stale=config.get_cache_max_stale()
+        )
 
         if args.tenant:
             if args.tenant not in config.get_tenants():
@@ -62,180 +395,54 @@ def main():
                     namespace4tenant(args.tenant, namespaces): [args.tenant]
                 }
 
-        sensu = Sensu(url=sensu_url, token=sensu_token, namespaces=namespaces)
+        sensu = Sensu(
+            url=sensu_url, token=sensu_token, namespaces=namespaces,
+            concurrency=config.get_sensu_concurrency(),
+            page_size=config.get_sensu_page_size()
+        )
 
         if not args.tenant:
             sensu.handle_namespaces()
 
-        for namespace, tenants in namespaces.items():
-            try:
-                namespace_secrets = ""
-                namespace_publish_bool = False
-                tenants_checks = dict()
-                tenants_entities = dict()
-                tenants_internal_services = dict()
-                tenants_metric_overrides = dict()
-                tenants_attribute_overrides = dict()
-                for tenant in tenants:
-                    if publish_bool[tenant]:
-                        namespace_publish_bool = publish_bool[tenant]
-
-                    if namespace_secrets:
-                        if secrets[tenant] != namespace_secrets:
-                            logger.warning(
-                                f"{namespace}: Secrets file not unique across "
-                                f"tenants"
-                            )
-
-                    else:
-                        namespace_secrets = secrets[tenant]
-
-                    webapi = WebApi(
-                        url=webapi_url,
-                        token=webapi_tokens[tenant],
-                        tenant=tenant,
-                        topo_groups_filter=topo_groups_filter[tenant] if
-                        topo_groups_filter[tenant] else None,
-                        topo_endpoints_filter=topo_endpoints_filter[tenant] if
-                        topo_endpoints_filter[tenant] else None
-                    )
-
-                    poem = Poem(
-                        url=poem_urls[tenant],
-                        token=poem_tokens[tenant],
-                        tenant=tenant
-                    )
-
-                    if local_topology[tenant]:
-                        with open(local_topology[tenant]) as f:
-                            topology = json.load(f)
-
-                    else:
-                        topology = webapi.get_topology()
-
-                    if agents_configurations[tenant]:
-                        agent_config = AgentConfig(
-                            file=agents_configurations[tenant]
-                        )
-                        custom_agent_config = agent_config.get_custom_subs()
-
-                    else:
-                        custom_agent_config = None
-
-                    generator = ConfigurationGenerator(
-                        metrics=poem.get_metrics_configurations(),
-                        metric_profiles=webapi.get_metric_profiles(),
-                        topology=topology,
-                        profiles=metricprofiles[tenant],
-                        attributes=poem.get_metric_overrides(),
-                        secrets_file=secrets[tenant],
-                        default_ports=poem.get_default_ports(),
-                        tenant=tenant,
-                        default_agent=[
-                            item["metadata"]["name"] for item in
-                            sensu.get_agents(namespace=namespace)
-                        ],
-                        skipped_metrics=skipped_metrics[tenant],
-                        agents_config=custom_agent_config
-                    )
-
-                    tenants_checks.update({
-                        tenant: generator.generate_checks(
-                            publish=publish_bool[tenant],
-                            namespace=namespace
-                        )
-                    })
-
-                    tenants_entities.update({
-                        tenant: generator.generate_entities(namespace=namespace)
-                    })
-
-                    tenants_internal_services.update({
-                        tenant: generator.generate_internal_services()
-                    })
-
-                    tenants_metric_overrides.update({
-                        tenant: generator.get_metric_parameter_overrides()
-                    })
-
-                    tenants_attribute_overrides.update({
-                        tenant: generator.get_host_attribute_overrides()
-                    })
-
-                if len(tenants) > 1:
-                    merger = ConfigurationMerger(
-                        checks=tenants_checks,
-                        entities=tenants_entities,
-                        internal_services=tenants_internal_services,
-                        metricoverrides4agents=tenants_metric_overrides,
-                        attributeoverrides4agents=tenants_attribute_overrides
-                    )
-
-                    checks = merger.merge_checks()
-                    entities = merger.merge_entities()
-                    metric_parameter_overrides = \
-                        merger.merge_metric_parameter_overrides()
-                    host_attribute_overrides = \
-                        merger.merge_attribute_overrides()
-                    internal_services = merger.merge_internal_services()
-
-                else:
-                    checks = tenants_checks[tenants[0]]
-                    entities = tenants_entities[tenants[0]]
-                    metric_parameter_overrides = tenants_metric_overrides[
-                        tenants[0]
+        # prefetching uses no more threads than there are pooled
+        # connections, so that no connection is discarded after use
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=http_settings["pool_size"],
+                thread_name_prefix="prefetch"
+        ) as prefetch_executor:
+            if args.workers > 1:
+                with concurrent.futures.ThreadPoolExecutor(
+                        max_workers=args.workers
+                ) as executor:
+                    futures = [
+                        executor.submit(
+                            sync_namespace, namespace=namespace,
+                            tenants=tenants, sensu=sensu, settings=settings,
+                            state=state, cache=cache,
+                            executor=prefetch_executor, full=args.full
+                        ) for namespace, tenants in namespaces.items()
                     ]
-                    host_attribute_overrides = tenants_attribute_overrides[
-                        tenants[0]
-                    ]
-                    internal_services = tenants_internal_services[tenants[0]]
-
-                sensu.add_daily_filter(namespace=namespace)
-                sensu.handle_slack_handler(
-                    secrets_file=namespace_secrets, namespace=namespace
-                )
-                sensu.add_reduce_alerts_pipeline(namespace=namespace)
-
-                if namespace_publish_bool:
-                    sensu.handle_publisher_handler(namespace=namespace)
-                    sensu.add_hard_state_filter(namespace=namespace)
-                    sensu.add_hard_state_pipeline(namespace=namespace)
-
-                sensu.handle_checks(checks=checks, namespace=namespace)
-                sensu.add_cpu_check(namespace=namespace)
-                sensu.add_memory_check(namespace=namespace)
+                    concurrent.futures.wait(futures)
 
-                if namespace != "default":
-                    sensu.handle_proxy_entities(
-                        entities=entities, namespace=namespace
+            else:
+                for namespace, tenants in namespaces.items():
+                    sync_namespace(
+                        namespace=namespace, tenants=tenants, sensu=sensu,
+                        settings=settings, state=state, cache=cache,
+                        executor=prefetch_executor, full=args.full
                     )
 
-                sensu.handle_agents(
-                    metric_parameters_overrides=metric_parameter_overrides,
-                    host_attributes_overrides=host_attribute_overrides,
-                    services=internal_services,
-                    namespace=namespace
-                )
-
-                logger.info(f"{namespace}: All synced!")
-
-            except json.decoder.JSONDecodeError as e:
-                logger.error(f"{namespace}: Error reading JSON: {str(e)}")
-                logger.warning(f"{namespace}: Skipping configuration...")
-                continue
-
-            except (
-                    WebApiException, PoemException, GeneratorException,
-                    SensuException
-            ):
-                logger.warning(f"{namespace}: Skipping configuration...")
-                continue
-
-            except Exception as e:
-                logger.warning(
-                    f"{namespace}: {str(e)} Skipping configuration..."
-                )
-                continue
+        for endpoint, stat in session.stats.get().items():
+            logger.debug(
+                f"{endpoint}: {stat['count']} requests in "
+                f"{stat['time']:.2f} s"
+            )
+
+        for helper, info in get_cache_stats().items():
+            logger.debug(
+                f"{helper}: {info.hits} cache hits, {info.misses} misses, "
+                f"{info.currsize}/{info.maxsize} cached"
+            )
 
         logger.info("Done")
 
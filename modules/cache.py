@@ -0,0 +1,123 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+import requests
+
+CACHEDIR = "/var/cache/argo-scg"
+STALE_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _hash(value):
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+class CachedResponse:
+    def __init__(self, entry):
+        self.status_code = 200
+        self.reason = "OK"
+        self.ok = True
+        self.headers = dict()
+        self.text = entry["body"]
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class ResponseCache:
+    def __init__(self, directory=CACHEDIR, max_stale=3600):
+        self.directory = directory
+        self.max_stale = max_stale
+        self.logger = logging.getLogger("argo-scg.cache")
+
+    def _get_filename(self, url, token):
+        return os.path.join(
+            self.directory, f"{_hash(f'{url} {_hash(token)}')}.json"
+        )
+
+    def _read(self, filename):
+        try:
+            with open(filename) as f:
+                return json.load(f)
+
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, filename, entry):
+        # each write gets its own temporary file, since the same response may
+        # be cached by several threads at the same time
+        tmp_filename = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                    mode="w", dir=self.directory, suffix=".tmp", delete=False
+            ) as f:
+                tmp_filename = f.name
+                json.dump(entry, f)
+
+            os.replace(tmp_filename, filename)
+
+        except OSError as e:
+            self.logger.warning(f"Error caching {entry['url']}: {e}")
+            if tmp_filename:
+                try:
+                    os.remove(tmp_filename)
+
+                except OSError:
+                    pass
+
+    def _is_usable(self, entry):
+        return entry is not None and \
+            time.time() - entry["validated"] <= self.max_stale
+
+    def get(self, session, url, headers, token):
+        filename = self._get_filename(url=url, token=token)
+        entry = self._read(filename)
+
+        headers = dict(headers)
+        if entry:
+            if entry.get("etag"):
+                headers.update({"If-None-Match": entry["etag"]})
+
+            if entry.get("last_modified"):
+                headers.update({"If-Modified-Since": entry["last_modified"]})
+
+        try:
+            response = session.get(url, headers=headers)
+
+        except requests.exceptions.RequestException as e:
+            if self._is_usable(entry):
+                self.logger.warning(
+                    f"{url}: {str(e)}: Using cached response"
+                )
+                return CachedResponse(entry)
+
+            raise
+
+        if response.status_code == 304 and entry:
+            entry.update({"validated": time.time()})
+            self._write(filename, entry)
+            return CachedResponse(entry)
+
+        if response.ok:
+            self._write(filename, {
+                "url": url,
+                "token": _hash(token),
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "validated": time.time(),
+                "body": response.text
+            })
+
+        elif response.status_code in STALE_STATUSES and \
+                self._is_usable(entry):
+            self.logger.warning(
+                f"{url}: {response.status_code} {response.reason}: "
+                f"Using cached response"
+            )
+            return CachedResponse(entry)
+
+        return response
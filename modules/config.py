@@ -52,6 +52,78 @@ class Config(_Config):
         except (configparser.NoSectionError, configparser.NoOptionError) as err:
             raise ConfigException(err)
 
+    def _get_general_number(self, option, default, number_type):
+        try:
+            return number_type(self.conf.get("GENERAL", option))
+
+        except (configparser.NoSectionError, configparser.NoOptionError):
+            return default
+
+        except ValueError:
+            raise ConfigException(
+                f"Option {option} in section GENERAL must be a number"
+            )
+
+    def get_http_settings(self):
+        return {
+            "pool_size": self._get_general_number("http_pool_size", 10, int),
+            "timeout": self._get_general_number("http_timeout", 60, float),
+            "retries": self._get_general_number("http_retries", 3, int),
+            "backoff_factor": self._get_general_number(
+                "http_backoff_factor", 0.5, float
+            )
+        }
+
+    def get_sensu_concurrency(self):
+        concurrency = self._get_general_number("sensu_concurrency", 1, int)
+
+        if concurrency < 1:
+            raise ConfigException(
+                "Option sensu_concurrency in section GENERAL must be a "
+                "positive number"
+            )
+
+        return concurrency
+
+    def get_sensu_page_size(self):
+        page_size = self._get_general_number("sensu_page_size", 500, int)
+
+        if page_size < 0:
+            raise ConfigException(
+                "Option sensu_page_size in section GENERAL must not be a "
+                "negative number"
+            )
+
+        return page_size
+
+    def get_generator_workers(self):
+        workers = self._get_general_number("generator_workers", 1, int)
+
+        if workers < 1:
+            raise ConfigException(
+                "Option generator_workers in section GENERAL must be a "
+                "positive number"
+            )
+
+        return workers
+
+    def get_state_dir(self):
+        try:
+            return self.conf.get("GENERAL", "state_dir")
+
+        except (configparser.NoSectionError, configparser.NoOptionError):
+            return "/var/lib/argo-scg"
+
+    def get_cache_dir(self):
+        try:
+            return self.conf.get("GENERAL", "cache_dir")
+
+        except (configparser.NoSectionError, configparser.NoOptionError):
+            return "/var/cache/argo-scg"
+
+    def get_cache_max_stale(self):
+        return self._get_general_number("cache_max_stale", 3600, int)
+
     def _get_tenants(self):
         tenants = list()
         for section in self.conf.sections():
@@ -1,8 +1,15 @@
+import concurrent.futures
+import functools
+import hashlib
+import json
 import logging
+import multiprocessing
 import os
+import threading
 from urllib.parse import urlparse
 
 from argo_scg.exceptions import GeneratorException
+from argo_scg.metric import MetricSpec
 
 hardcoded_attributes = {
     "NAGIOS_HOST_CERT": "/etc/sensu/certs/hostcert.pem",
@@ -17,15 +24,33 @@ HARD_STATE_PIPELINE = {
     "api_version": "core/v2"
 }
 
+PARTITIONS_PER_WORKER = 4
 
+HASH_ANNOTATION = "argo-scg/hash"
+
+# helpers below are called with the same few values for every endpoint, so
+# their results are kept in bounded caches
+HELPER_CACHE_SIZE = 4096
+
+_partition_generator = None
+
+# hits and misses of the helpers' caches in worker processes, which are
+# added to the ones in this process when reporting statistics
+_worker_cache_stats = dict()
+_worker_cache_stats_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=HELPER_CACHE_SIZE)
 def create_attribute_env(item):
     return item.upper().replace(".", "_").replace("-", "_")
 
 
+@functools.lru_cache(maxsize=HELPER_CACHE_SIZE)
 def create_label(item):
     return item.lower().replace(".", "_").replace("-", "_")
 
 
+@functools.lru_cache(maxsize=HELPER_CACHE_SIZE)
 def is_attribute_secret(item):
     if item.endswith("_TOKEN") or item.endswith("_LOGIN") or \
             item.endswith("_SALT") or item.endswith("_ID") or \
@@ -38,7 +63,95 @@ def is_attribute_secret(item):
         return False
 
 
-def generate_adhoc_check(command, subscriptions, namespace="default"):
+_parse_url = functools.lru_cache(maxsize=HELPER_CACHE_SIZE)(urlparse)
+
+
+def _get_process_cache_stats():
+    return dict((helper.__name__, helper.cache_info()) for helper in [
+        create_label, create_attribute_env, is_attribute_secret, _parse_url,
+        ConfigurationGenerator._create_metric_parameter_label,
+        ConfigurationGenerator._get_single_endpoint_url,
+        ConfigurationGenerator._handle_endpoint_url
+    ])
+
+
+def _add_worker_cache_stats(stats):
+    with _worker_cache_stats_lock:
+        for name, (worker_hits, worker_misses) in stats.items():
+            hits, misses = _worker_cache_stats.get(name, (0, 0))
+            _worker_cache_stats.update({
+                name: (hits + worker_hits, misses + worker_misses)
+            })
+
+
+def get_cache_stats():
+    # caches of worker processes are gone together with the processes, so
+    # only their hits and misses are added; sizes are the ones in this
+    # process
+    stats = dict()
+    with _worker_cache_stats_lock:
+        for name, info in _get_process_cache_stats().items():
+            hits, misses = _worker_cache_stats.get(name, (0, 0))
+            stats.update({
+                name: info._replace(
+                    hits=info.hits + hits, misses=info.misses + misses
+                )
+            })
+
+    return stats
+
+
+def get_hash(item):
+    # hash of the desired state of a check or an entity, independent of the
+    # order of keys and of subscriptions and handlers
+    metadata = dict(item["metadata"])
+    annotations = dict(metadata.get("annotations") or dict())
+    annotations.pop(HASH_ANNOTATION, None)
+    metadata.update({"annotations": annotations})
+
+    canonical = dict(item)
+    canonical.update({"metadata": metadata})
+    for key in ["subscriptions", "handlers"]:
+        if isinstance(canonical.get(key), list):
+            canonical.update({key: sorted(canonical[key])})
+
+    return hashlib.sha256(
+        json.dumps(canonical, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def stamp_hash(item):
+    metadata = dict(item["metadata"])
+    annotations = dict(metadata.get("annotations") or dict())
+    annotations.update({HASH_ANNOTATION: get_hash(item)})
+    metadata.update({"annotations": annotations})
+
+    stamped = dict(item)
+    stamped.update({"metadata": metadata})
+
+    return stamped
+
+
+def _init_partition_worker(generator):
+    global _partition_generator
+    _partition_generator = generator
+
+
+def _generate_partition_entities(partition, namespace):
+    # statistics of the worker's caches are passed back with the entities,
+    # since they are not shared with the parent process
+    entities = list(_partition_generator._generate_entities(
+        items4names=partition, namespace=namespace
+    ))
+    return entities, os.getpid(), dict(
+        (name, (info.hits, info.misses)) for name, info in
+        _get_process_cache_stats().items()
+    )
+
+
+def generate_adhoc_check(
+        command, subscriptions, namespace="default", name="adhoc-check"
+):
     return {
         "command": command,
         "subscriptions": subscriptions,
@@ -47,7 +160,7 @@ def generate_adhoc_check(command, subscriptions, namespace="default"):
         "timeout": 900,
         "publish": False,
         "metadata": {
-            "name": "adhoc-check",
+            "name": name,
             "namespace": namespace
         },
         "round_robin": False
@@ -97,7 +210,7 @@ class ConfigurationGenerator:
 
         self.subscriptions = [f"entity:{sorted_agents[0]}"]
 
-        metrics_list = list()
+        metrics4names = dict()
         internal_metrics = list()
         metrics_with_endpoint_url = dict()
         list_metrics_with_endpoint_url = list()
@@ -110,96 +223,139 @@ class ConfigurationGenerator:
         metrics_with_servicesite_name = list()
         metrics_with_non_fallback_urls = dict()
         metrics_with_site_bdii = dict()
-        for metric in metrics:
-            for key, value in metric.items():
-                metrics_names_set.add(key)
-                if key in metrics_in_profiles_set:
-                    metrics_list.append(metric)
-
-                    if "PORT" in value["attribute"]:
-                        metrics_with_ports.append({
-                            "metric": key,
-                            "attr_val": value["attribute"]["PORT"]
-                        })
 
-                    if "PATH" in value["attribute"]:
-                        metrics_with_path.append({
-                            "metric": key,
-                            "attr_val": value["attribute"]["PATH"]
-                        })
+        # metrics are either configurations as fetched from POEM, a list of
+        # single-key dicts, or metric specs indexed by their names
+        if isinstance(metrics, dict):
+            metric_items = list(metrics.items())
 
-                    if "SSL" in value["attribute"]:
-                        metrics_with_ssl.append(key)
+        else:
+            metric_items = [
+                (key, value) for metric in metrics
+                for key, value in metric.items()
+            ]
 
-                    if "internal" in value["tags"]:
-                        internal_metrics.append(key)
+        for key, value in metric_items:
+            metrics_names_set.add(key)
+            if key in metrics_in_profiles_set:
+                if not isinstance(value, MetricSpec):
+                    try:
+                        value = MetricSpec(key, value)
 
-                    for attribute, attr_val in value["attribute"].items():
-                        if attribute == "URL":
-                            list_metrics_with_endpoint_url.append(key)
-                            metrics_with_endpoint_url.update({
-                                key: {
-                                    "attribute": attribute,
-                                    "value": attr_val
-                                }
-                            })
+                    except KeyError as e:
+                        self.logger.warning(
+                            f"{tenant}: Skipping metric {key}: "
+                            f"Missing key {str(e)}"
+                        )
+                        continue
 
-                        if attribute == "SITE_BDII":
-                            label = create_label(
-                                attr_val.lstrip("-").lstrip("-")
-                            )
-                            metrics_with_site_bdii.update({
-                                key: {
-                                    "label": f"{label}__site_bdii",
-                                    "value": attr_val
-                                }
-                            })
+                    except TypeError as e:
+                        self.logger.warning(
+                            f"{tenant}: Skipping metric {key}: {str(e)}"
+                        )
+                        continue
 
-                        if attribute in self.non_fallback_urls:
-                            metrics_with_non_fallback_urls.update({
-                                key: {
-                                    "attribute": attribute,
-                                    "value": attr_val
-                                }
-                            })
+                metrics4names.setdefault(key, value)
 
-                        elif attribute.endswith("_URL") and not (
-                                attribute.endswith("GOCDB_SERVICE_URL")
-                        ):
-                            metrics_with_url.update({key: attribute})
-
-                    for param, param_value in value["parameter"].items():
-                        if self.hostalias_var in param_value:
-                            metrics_with_hostalias.append({
-                                "metric": key,
-                                "parameter": param,
-                                "label": self._create_metric_parameter_label(
-                                    key, param
-                                ),
-                                "value": param_value
-                            })
+                if "PORT" in value["attribute"]:
+                    metrics_with_ports.append({
+                        "metric": key,
+                        "attr_val": value["attribute"]["PORT"]
+                    })
 
-                        if self.servicesite_name_var in param_value:
-                            metrics_with_servicesite_name.append({
-                                "metric": key,
-                                "parameter": param,
-                                "label": self._create_metric_parameter_label(
-                                    key, param
-                                ),
-                                "value": param_value
-                            })
+                if "PATH" in value["attribute"]:
+                    metrics_with_path.append({
+                        "metric": key,
+                        "attr_val": value["attribute"]["PATH"]
+                    })
+
+                if "SSL" in value["attribute"]:
+                    metrics_with_ssl.append(key)
+
+                if "internal" in value["tags"]:
+                    internal_metrics.append(key)
+
+                for attribute, attr_val in value["attribute"].items():
+                    if attribute == "URL":
+                        list_metrics_with_endpoint_url.append(key)
+                        metrics_with_endpoint_url.update({
+                            key: {
+                                "attribute": attribute,
+                                "value": attr_val
+                            }
+                        })
+
+                    if attribute == "SITE_BDII":
+                        label = create_label(
+                            attr_val.lstrip("-").lstrip("-")
+                        )
+                        metrics_with_site_bdii.update({
+                            key: {
+                                "label": f"{label}__site_bdii",
+                                "value": attr_val
+                            }
+                        })
+
+                    if attribute in self.non_fallback_urls:
+                        metrics_with_non_fallback_urls.update({
+                            key: {
+                                "attribute": attribute,
+                                "value": attr_val
+                            }
+                        })
+
+                    elif attribute.endswith("_URL") and not (
+                            attribute.endswith("GOCDB_SERVICE_URL")
+                    ):
+                        metrics_with_url.update({key: attribute})
+
+                for param, param_value in value["parameter"].items():
+                    if self.hostalias_var in param_value:
+                        metrics_with_hostalias.append({
+                            "metric": key,
+                            "parameter": param,
+                            "label": self._create_metric_parameter_label(
+                                key, param
+                            ),
+                            "value": param_value
+                        })
+
+                    if self.servicesite_name_var in param_value:
+                        metrics_with_servicesite_name.append({
+                            "metric": key,
+                            "parameter": param,
+                            "label": self._create_metric_parameter_label(
+                                key, param
+                            ),
+                            "value": param_value
+                        })
+
+        self.metrics4names = metrics4names
 
-        self.metrics = metrics_list
         self.metrics_without_configuration = metrics_in_profiles_set.difference(
             metrics_names_set
         )
         self.metrics_with_hostalias = metrics_with_hostalias
+        self.hostaliases4metrics = self._index_by_key(
+            metrics_with_hostalias, "metric"
+        )
         self.metrics_with_servicesite_name = metrics_with_servicesite_name
+        self.servicesite_names4metrics = self._index_by_key(
+            metrics_with_servicesite_name, "metric"
+        )
         self.metrics_with_endpoint_url = metrics_with_endpoint_url
         self.metrics_with_non_fallback_urls = metrics_with_non_fallback_urls
         self.metrics_with_site_bdii = metrics_with_site_bdii
         self.internal_metrics = internal_metrics
         self.topology = topology
+        self.topology4servicetypes = self._index_by_key(topology, "service")
+        self.tags4servicetypes = None
+        self.hostnames4metrics = None
+        self.entities4metrics = None
+        self.hostnames4servicetypes = None
+        self.entities4servicetypes = None
+        self.attributes_overridden_all_endpoints = dict()
+        self.topology4sites = self._index_by_key(topology, "group")
         self.secrets = secrets_file
         self.default_ports = default_ports
 
@@ -209,9 +365,20 @@ class ConfigurationGenerator:
         self.metrics_with_parameter_overrides = [
             metric["metric"] for metric in self.metric_parameter_overrides
         ]
+        self.metric_parameter_overrides4metrics = self._index_by_key(
+            self.metric_parameter_overrides, "metric"
+        )
         self.host_attribute_overrides = self._read_host_attribute_overrides(
             attributes
         )
+        self.host_attribute_overrides4attributes = self._index_by_key(
+            self.host_attribute_overrides, "attribute"
+        )
+        self.host_attribute_overrides4hostnames = dict()
+        for index, item in enumerate(self.host_attribute_overrides):
+            self.host_attribute_overrides4hostnames.setdefault(
+                item["hostname"], []
+            ).append(index)
         self.servicetypes4metrics = self._get_servicetypes4metrics()
         self.metrics4servicetypes = self._get_metrics4servicetypes()
         self.extensions = self._get_extensions()
@@ -233,6 +400,10 @@ class ConfigurationGenerator:
                     "attr_val": metric["attr_val"]
                 })
 
+        self.servicetypes_with_port4servicetypes = self._index_by_key(
+            self.servicetypes_with_port, "service"
+        )
+
         self.servicetypes_with_path = list()
         for metric in metrics_with_path:
             sts = self.servicetypes4metrics[metric["metric"]]
@@ -243,6 +414,10 @@ class ConfigurationGenerator:
                     "attr_val": metric["attr_val"]
                 })
 
+        self.servicetypes_with_path4servicetypes = self._index_by_key(
+            self.servicetypes_with_path, "service"
+        )
+
         self.servicetypes_with_SSL = list()
         for metric in metrics_with_ssl:
             self.servicetypes_with_SSL.extend(
@@ -267,6 +442,14 @@ class ConfigurationGenerator:
                 self.servicetypes4metrics[metric]
             )
 
+    @staticmethod
+    def _index_by_key(items, key):
+        index = dict()
+        for item in items:
+            index.setdefault(item.get(key), []).append(item)
+
+        return index
+
     @staticmethod
     def _read_global_attributes(input_attrs):
         attrs = dict()
@@ -315,78 +498,102 @@ class ConfigurationGenerator:
     def get_host_attribute_overrides(self):
         return self.host_attribute_overrides
 
-    def _get_single_endpoint_url(self, url):
+    @staticmethod
+    @functools.lru_cache(maxsize=HELPER_CACHE_SIZE)
+    def _get_single_endpoint_url(url):
         if "," in url:
             url = url.split(",")[0].strip()
 
-        return self._handle_endpoint_url(url)
+        return ConfigurationGenerator._handle_endpoint_url(url)
+
+    def _get_host_attribute_overrides4entity(self, hostname, entity_name):
+        indexes = sorted(
+            self.host_attribute_overrides4hostnames.get(hostname, []) +
+            self.host_attribute_overrides4hostnames.get(entity_name, [])
+        )
+
+        return [self.host_attribute_overrides[i] for i in indexes]
 
     def _get_metrics4attribute(self, attribute):
         metrics_with_attribute = list()
-        for metric in self.metrics:
-            for name, config in metric.items():
-                if attribute in config["attribute"]:
-                    metrics_with_attribute.append(name)
+        for name, config in self.metrics4names.items():
+            if attribute in config["attribute"]:
+                metrics_with_attribute.append(name)
 
         return metrics_with_attribute
 
     @staticmethod
+    @functools.lru_cache(maxsize=HELPER_CACHE_SIZE)
     def _create_metric_parameter_label(metric, parameter):
         return f"{create_label(metric)}_" \
                f"{parameter.strip('-').strip('-').replace('-', '_')}"
 
-    def _is_extension_present_all_endpoints(self, services, extension):
-        is_present = True
-        endpoints = [
-            endpoint for endpoint in self.topology
-            if endpoint["service"] in services
-        ]
+    def _count_extension(self, services, extension):
+        # number of endpoints of each service type carrying each tag, built
+        # on the first lookup and shared by all the following ones
+        if self.tags4servicetypes is None:
+            tags4servicetypes = dict()
+            for service, endpoints in self.topology4servicetypes.items():
+                for endpoint in endpoints:
+                    for tag in endpoint["tags"]:
+                        key = (service, tag)
+                        tags4servicetypes[key] = \
+                            tags4servicetypes.get(key, 0) + 1
+
+            self.tags4servicetypes = tags4servicetypes
+
+        with_extension = 0
+        endpoints = 0
+        for service in set(services):
+            with_extension += self.tags4servicetypes.get(
+                (service, extension), 0
+            )
+            endpoints += len(self.topology4servicetypes.get(service, []))
 
-        for endpoint in endpoints:
-            if extension not in endpoint["tags"]:
-                is_present = False
-                break
+        return with_extension, endpoints
 
-        return is_present
+    def _is_extension_present_all_endpoints(self, services, extension):
+        with_extension, endpoints = self._count_extension(
+            services=services, extension=extension
+        )
 
-    def _is_extension_present_any_endpoint(self, services, extension):
-        is_present = False
-        endpoints = [
-            endpoint for endpoint in self.topology if
-            endpoint["service"] in services
-        ]
+        return with_extension == endpoints
 
-        for endpoint in endpoints:
-            if extension in endpoint["tags"]:
-                is_present = True
-                break
+    def _is_extension_present_any_endpoint(self, services, extension):
+        with_extension, _ = self._count_extension(
+            services=services, extension=extension
+        )
 
-        return is_present
+        return with_extension > 0
 
     def _is_attribute_overridden_all_endpoints(self, attribute):
-        hostnames4metric = self._get_hostnames4metrics()
-        hostnames_with_overridden_attributes = set()
-        hostnames_with_metrics = set()
-        for item in self.host_attribute_overrides:
-            if item["attribute"] == attribute:
+        # the answer depends only on the topology and the overrides, so it is
+        # computed once for each attribute
+        if attribute not in self.attributes_overridden_all_endpoints:
+            hostnames4metric = self._get_hostnames4metrics()
+            hostnames_with_overridden_attributes = set()
+            hostnames_with_metrics = set()
+            for item in self.host_attribute_overrides4attributes.get(
+                    attribute, []
+            ):
                 hostnames_with_overridden_attributes.add(item["hostname"])
                 for metric in item["metrics"]:
-                    hostnames_with_metrics.update(set(hostnames4metric[metric]))
+                    hostnames_with_metrics.update(hostnames4metric[metric])
 
-        return len(set(hostnames_with_metrics).difference(
-            set(hostnames_with_overridden_attributes)
-        )) == 0
+            self.attributes_overridden_all_endpoints.update({
+                attribute: hostnames_with_metrics.issubset(
+                    hostnames_with_overridden_attributes
+                )
+            })
+
+        return self.attributes_overridden_all_endpoints[attribute]
 
     def _is_parameter_default(self, metric_name, parameter):
         is_default = False
 
-        for metric in self.metrics:
-            for name, configuration in metric.items():
-                if name == metric_name:
-                    if parameter not in configuration["parameter"]:
-                        is_default = True
-
-                    break
+        if metric_name in self.metrics4names:
+            if parameter not in self.metrics4names[metric_name]["parameter"]:
+                is_default = True
 
         return is_default
 
@@ -426,66 +633,84 @@ class ConfigurationGenerator:
         else:
             return item["hostname"]
 
+    def _get_all_servicetypes(self):
+        # service types of all the metrics in the profiles, including the ones
+        # whose metrics are all skipped
+        servicetypes = set(self.servicetypes)
+        for metric_servicetypes in self.servicetypes4metrics.values():
+            servicetypes.update(metric_servicetypes)
+
+        return servicetypes
+
+    # the following maps are built from the topology on the first use and
+    # reused for the lifetime of the generator
     def _get_hostnames4metrics(self):
-        hostnames4metrics = dict()
-        for metric, servicetypes in self.servicetypes4metrics.items():
-            hostnames = list()
-            for servicetype in servicetypes:
-                hostnames.extend([
-                    self._get_hostname(item) for item in self.topology
-                    if item["service"] == servicetype
-                ])
+        if self.hostnames4metrics is None:
+            hostnames4servicetypes = self._get_hostnames4servicetypes()
+            hostnames4metrics = dict()
+            for metric, servicetypes in self.servicetypes4metrics.items():
+                hostnames = set()
+                for servicetype in servicetypes:
+                    hostnames.update(
+                        hostnames4servicetypes.get(servicetype, [])
+                    )
+
+                hostnames4metrics.update({metric: sorted(hostnames)})
 
-            hostnames = sorted(list(set(hostnames)))
-            hostnames4metrics.update({metric: hostnames})
+            self.hostnames4metrics = hostnames4metrics
 
-        return hostnames4metrics
+        return self.hostnames4metrics
 
     def _get_entities4metrics(self):
-        entities4metrics = dict()
-        for metric, servicetypes in self.servicetypes4metrics.items():
-            entities = list()
-            for servicetype in servicetypes:
-                entities.extend([
-                    f"{servicetype}__{item['hostname']}"
-                    for item in self.topology if
-                    item["service"] == servicetype
-                ])
+        if self.entities4metrics is None:
+            entities4servicetypes = self._get_entities4servicetypes()
+            entities4metrics = dict()
+            for metric, servicetypes in self.servicetypes4metrics.items():
+                entities = set()
+                for servicetype in servicetypes:
+                    entities.update(
+                        entities4servicetypes.get(servicetype, [])
+                    )
+
+                entities4metrics.update({metric: sorted(entities)})
 
-            entities = sorted(list(set(entities)))
-            entities4metrics.update({metric: entities})
+            self.entities4metrics = entities4metrics
 
-        return entities4metrics
+        return self.entities4metrics
 
     def _get_hostnames4servicetypes(self):
-        hostnames4servicetypes = dict()
+        if self.hostnames4servicetypes is None:
+            hostnames4servicetypes = dict()
+            for servicetype in self._get_all_servicetypes():
+                hostnames = [
+                    self._get_hostname(item) for item in
+                    self.topology4servicetypes.get(servicetype, [])
+                ]
 
-        for servicetype in self.servicetypes:
-            hostnames = [
-                self._get_hostname(item) for item in self.topology
-                if item["service"] == servicetype
-            ]
+                hostnames4servicetypes.update({
+                    servicetype: sorted(set(hostnames))
+                })
 
-            hostnames4servicetypes.update({
-                servicetype: sorted(list(set(hostnames)))
-            })
+            self.hostnames4servicetypes = hostnames4servicetypes
 
-        return hostnames4servicetypes
+        return self.hostnames4servicetypes
 
     def _get_entities4servicetypes(self):
-        entities4servicetypes = dict()
+        if self.entities4servicetypes is None:
+            entities4servicetypes = dict()
+            for servicetype in self._get_all_servicetypes():
+                entities = [
+                    f"{servicetype}__{item['hostname']}" for item in
+                    self.topology4servicetypes.get(servicetype, [])
+                ]
 
-        for servicetype in self.servicetypes:
-            entities = [
-                f"{servicetype}__{item['hostname']}" for item in self.topology
-                if item["service"] == servicetype
-            ]
+                entities4servicetypes.update({
+                    servicetype: sorted(set(entities))
+                })
 
-            entities4servicetypes.update({
-                servicetype: sorted(list(set(entities)))
-            })
+            self.entities4servicetypes = entities4servicetypes
 
-        return entities4servicetypes
+        return self.entities4servicetypes
 
     def _get_extensions(self):
         extensions = set()
@@ -498,55 +723,49 @@ class ConfigurationGenerator:
 
     def _get_extensions4metrics(self):
         ext_dict = dict()
-        for metric in self.metrics:
-            for name, configuration in metric.items():
-                for attribute, value in configuration["attribute"].items():
-                    if attribute in self.extensions:
-                        if attribute not in ext_dict:
-                            ext_dict.update({attribute: [name]})
+        for name, configuration in self.metrics4names.items():
+            for attribute, value in configuration["attribute"].items():
+                if attribute in self.extensions:
+                    if attribute not in ext_dict:
+                        ext_dict.update({attribute: [name]})
 
-                        else:
-                            metrics = ext_dict[attribute]
-                            metrics.append(name)
-                            ext_dict.update({attribute: metrics})
+                    else:
+                        metrics = ext_dict[attribute]
+                        metrics.append(name)
+                        ext_dict.update({attribute: metrics})
 
         return ext_dict
 
     def _get_attributes4metrics(self):
         attributes = dict()
-        for metric in self.metrics:
-            for name, configuration in metric.items():
-                for attribute, value in configuration["attribute"].items():
-                    if attribute in [
-                        o["attribute"] for o in self.host_attribute_overrides
-                    ]:
-                        if attribute not in attributes:
-                            attributes.update({
-                                attribute: [{
-                                    "metric": name,
-                                    "value": value
-                                }]
-                            })
-
-                        else:
-                            tmp = attributes[attribute]
-                            tmp.append({
+        for name, configuration in self.metrics4names.items():
+            for attribute, value in configuration["attribute"].items():
+                if attribute in self.host_attribute_overrides4attributes:
+                    if attribute not in attributes:
+                        attributes.update({
+                            attribute: [{
                                 "metric": name,
                                 "value": value
-                            })
-                            attributes.update({attribute: tmp})
+                            }]
+                        })
+
+                    else:
+                        tmp = attributes[attribute]
+                        tmp.append({
+                            "metric": name,
+                            "value": value
+                        })
+                        attributes.update({attribute: tmp})
 
         return attributes
 
     def _handle_attributes(self, metric, attrs):
         attributes = ""
         issecret = False
-        overridden_attributes = [
-            item["attribute"] for item in self.host_attribute_overrides
-        ]
+        overridden_attributes = self.host_attribute_overrides4attributes
         overridden_parameters = [
-            item["parameter"] for item in self.metric_parameter_overrides
-            if item["metric"] == metric
+            item["parameter"] for item in
+            self.metric_parameter_overrides4metrics.get(metric, [])
         ]
         special_attributes = ["BDII_DN", "GLUE2_BDII_DN"]
 
@@ -756,10 +975,9 @@ class ConfigurationGenerator:
     def _generate_active_check(
             self, name, configuration, publish, namespace="default"
     ):
-        parameter_overrides = [
-            item for item in self.metric_parameter_overrides
-            if item["metric"] == name
-        ]
+        parameter_overrides = self.metric_parameter_overrides4metrics.get(
+            name, []
+        )
         try:
             path = configuration["config"]["path"]
             if path.endswith("/"):
@@ -768,7 +986,9 @@ class ConfigurationGenerator:
             executable = os.path.join(path, configuration["probe"])
 
             if "NOTIMEOUT" not in configuration["flags"]:
-                parameters = "-t " + configuration["config"]["timeout"]
+                parameters = "-t " + str(self._get_config_number(
+                    configuration, "timeout", "timeout"
+                ))
 
             else:
                 parameters = ""
@@ -848,14 +1068,19 @@ class ConfigurationGenerator:
                 "command": command.strip(),
                 "subscriptions": self._get_subscription(name),
                 "handlers": [],
-                "interval": int(configuration["config"]["interval"]) * 60,
+                "interval": self._get_config_number(
+                    configuration, "interval", "interval"
+                ) * 60,
                 "timeout": 900,
                 "publish": True,
                 "metadata": {
                     "name": name,
                     "namespace": namespace,
                     "annotations": {
-                        "attempts": configuration["config"]["maxCheckAttempts"]
+                        "attempts": str(self._get_config_number(
+                            configuration, "max_check_attempts",
+                            "maxCheckAttempts"
+                        ))
                     },
                     "labels": {
                         "tenants": self.tenant
@@ -914,6 +1139,26 @@ class ConfigurationGenerator:
 
             return None
 
+        except ValueError as e:
+            self.logger.warning(f"{self.tenant}: Skipping check {name}: {e}")
+
+            return None
+
+    @staticmethod
+    def _get_config_number(configuration, attribute, key):
+        # numbers are parsed once in the metric spec, missing or invalid ones
+        # are reported here
+        value = getattr(configuration, attribute)
+        if value is None:
+            config = configuration["config"] if configuration["config"] \
+                else dict()
+            if key not in config:
+                raise KeyError(key)
+
+            raise ValueError(f"Invalid {key} value {config[key]!r}")
+
+        return value
+
     def _get_subscription(self, metric):
         subscription = self.subscriptions
         if self.agents_config:
@@ -926,52 +1171,62 @@ class ConfigurationGenerator:
 
         return subscription
 
-    def generate_checks(self, publish, namespace="default"):
-        checks = list()
-
-        for metric in self.metrics:
-            for name, configuration in metric.items():
-                if name not in self.skipped_metrics:
-                    if self._is_passive(configuration=configuration):
-                        try:
-                            attempts = [
-                                item for item in self.metrics if
-                                configuration["parent"] in item
-                            ][0][configuration["parent"]]["config"][
-                                "maxCheckAttempts"
-                            ]
-                            check = {
-                                "command": "PASSIVE",
-                                "subscriptions": self._get_subscription(metric),
-                                "handlers": [],
-                                "pipelines": [HARD_STATE_PIPELINE],
-                                "cron": "CRON_TZ=Europe/Zagreb 0 0 31 2 *",
-                                "timeout": 900,
-                                "publish": False,
-                                "metadata": {
-                                    "name": name,
-                                    "namespace": namespace,
-                                    "annotations": {"attempts": attempts},
-                                    "labels": {"tenants": self.tenant}
-                                },
-                                "round_robin": False
-                            }
+    def iter_checks(self, publish, namespace="default"):
+        for name, configuration in self.metrics4names.items():
+            if name not in self.skipped_metrics:
+                if self._is_passive(configuration=configuration):
+                    if configuration["parent"] not in self.metrics4names:
+                        self.logger.warning(
+                            f"{self.tenant}: Skipping check generation for "
+                            f"{name} - missing parent"
+                        )
+                        continue
 
-                        except IndexError:
-                            self.logger.warning(
-                                f"{self.tenant}: Skipping check generation for "
-                                f"{name} - missing parent"
-                            )
-                            continue
+                    try:
+                        attempts = str(self._get_config_number(
+                            self.metrics4names[configuration["parent"]],
+                            "max_check_attempts", "maxCheckAttempts"
+                        ))
 
-                    else:
-                        check = self._generate_active_check(
-                            name=name, configuration=configuration,
-                            publish=publish, namespace=namespace
+                    except KeyError as e:
+                        self.logger.warning(
+                            f"{self.tenant}: Skipping check {name}: "
+                            f"Missing key {str(e)} in parent"
                         )
+                        continue
 
-                    if check:
-                        checks.append(check)
+                    except ValueError as e:
+                        self.logger.warning(
+                            f"{self.tenant}: Skipping check {name}: {e} in "
+                            f"parent"
+                        )
+                        continue
+
+                    check = {
+                        "command": "PASSIVE",
+                        "subscriptions": self._get_subscription(name),
+                        "handlers": [],
+                        "pipelines": [HARD_STATE_PIPELINE],
+                        "cron": "CRON_TZ=Europe/Zagreb 0 0 31 2 *",
+                        "timeout": 900,
+                        "publish": False,
+                        "metadata": {
+                            "name": name,
+                            "namespace": namespace,
+                            "annotations": {"attempts": attempts},
+                            "labels": {"tenants": self.tenant}
+                        },
+                        "round_robin": False
+                    }
+
+                else:
+                    check = self._generate_active_check(
+                        name=name, configuration=configuration,
+                        publish=publish, namespace=namespace
+                    )
+
+                if check:
+                    yield check
 
         for metric in self.metrics_without_configuration:
             self.logger.warning(
@@ -979,7 +1234,8 @@ class ConfigurationGenerator:
                 f"Skipping check generation"
             )
 
-        return checks
+    def generate_checks(self, publish, namespace="default"):
+        return list(self.iter_checks(publish=publish, namespace=namespace))
 
     def _get_servicetypes(self):
         service_types = set()
@@ -993,468 +1249,504 @@ class ConfigurationGenerator:
         return service_types
 
     @staticmethod
+    @functools.lru_cache(maxsize=HELPER_CACHE_SIZE)
     def _handle_endpoint_url(url):
         if "&" in url:
             url = f"\"{url}\""
 
         return url
 
-    def generate_entities(self, namespace="default"):
-        try:
-            entities = list()
-            topo_entities = [
-                item for item in self.topology if
-                item["service"] in self.servicetypes
-            ]
-            attributes4metrics = self._get_attributes4metrics()
+    def _create_entity_template(self, service):
+        # everything that depends only on the service type is computed once
+        # and shared by all the endpoints of that service type
+        metrics4servicetype = self.metrics4servicetypes[service]
+        metrics_set = set(metrics4servicetype)
+
+        metrics = list()
+        for metric in metrics4servicetype:
+            non_fallback_url = None
+            if metric in self.metrics_with_non_fallback_urls:
+                metric_attribute = self.metrics_with_non_fallback_urls[metric]
+                key_prefix = create_label(
+                    metric_attribute["value"].strip("-").strip("-")
+                )
+                key_suffix = create_label(metric_attribute["attribute"])
+                non_fallback_url = {
+                    "attribute": metric_attribute["attribute"],
+                    "value": metric_attribute["value"],
+                    "label": f"{key_prefix}__{key_suffix}"
+                }
+
+            label = None
+            if metric not in self.internal_metrics and \
+                    metric not in self.skipped_metrics:
+                label = create_label(metric)
+
+            metrics.append({
+                "name": metric,
+                "label": label,
+                "non_fallback_url": non_fallback_url,
+                "parameter_overrides": [
+                    (o, self._is_parameter_default(metric, o["parameter"]))
+                    for o in self.metric_parameter_overrides4metrics.get(
+                        metric, []
+                    )
+                ],
+                "hostaliases": self.hostaliases4metrics.get(metric, []),
+                "servicesite_names": self.servicesite_names4metrics.get(
+                    metric, []
+                )
+            })
+
+        ext_metrics = [
+            configuration for name, configuration in
+            self.metrics4names.items() if name in metrics_set
+        ]
+
+        return {
+            "metrics_set": metrics_set,
+            "metrics": metrics,
+            "path_labels": [
+                (f"{create_label(entry['metric'])}_path", entry["attr_val"])
+                for entry in self.servicetypes_with_path4servicetypes.get(
+                    service, []
+                )
+            ],
+            "port_labels": [
+                (f"{create_label(entry['metric'])}_port", entry["attr_val"])
+                for entry in self.servicetypes_with_port4servicetypes.get(
+                    service, []
+                )
+            ],
+            "url_metrics": list(metrics_set.intersection(
+                set(self.metrics_with_endpoint_url.keys())
+            )),
+            "attribute_overrides": [
+                o for o in self.host_attribute_overrides
+                if len(set(o["metrics"]).intersection(metrics_set)) > 0
+            ],
+            "ext_metrics": ext_metrics,
+            "extensions_present_in_all": dict(),
+            "ext_attribute_values": dict()
+        }
+
+    def _generate_entity_labels(
+            self, item, entity_name, template, attributes4metrics
+    ):
+        if "hostname" in item["tags"]:
+            hostname = item["tags"]["hostname"]
 
-            skipped_entities = list()
-            for item in topo_entities:
-                types = list()
-                entity_name = f"{item['service']}__{item['hostname']}"
+        else:
+            hostname = item["hostname"]
 
-                if "hostname" in item["tags"]:
-                    hostname = item["tags"]["hostname"]
+        labels = {"hostname": hostname}
 
-                else:
-                    hostname = item["hostname"]
+        if "info_URL" in item["tags"]:
+            labels.update({
+                "info_url": self._handle_endpoint_url(
+                    item["tags"]["info_URL"]
+                )
+            })
+            o = _parse_url(item["tags"]["info_URL"])
+            port = o.port
+
+            if item["service"] in self.servicetypes_with_SSL:
+                if o.scheme == "https":
+                    labels.update({"ssl": "-S --sni"})
+
+            if o.path:
+                path = o.path
+                if o.query:
+                    path = f"{path}?{o.query}"
+                for lbl, attr_val in template["path_labels"]:
+                    labels.update({lbl: f"{attr_val} {path}"})
+
+            if port:
+                for lbl, attr_val in template["port_labels"]:
+                    labels.update({lbl: f"{attr_val} {str(port)}"})
+
+            if item["service"] in [
+                "org.openstack.nova", "org.openstack.swift"
+            ]:
+                if port:
+                    labels.update({"os_keystone_port": str(port)})
+
+                labels.update({"os_keystone_host": o.hostname})
+                labels.update({
+                    "os_keystone_url": self._handle_endpoint_url(
+                        item["tags"]["info_URL"]
+                    )
+                })
+
+        missing_metrics_endpoint_url = list()
+        if "info_service_endpoint_URL" in item["tags"]:
+            labels.update({
+                "endpoint_url":
+                    self._get_single_endpoint_url(
+                        item["tags"]["info_service_endpoint_URL"]
+                    )
+            })
 
-                labels = {"hostname": hostname}
+        else:
+            if item["service"] in self.servicetypes_with_endpointURL:
+                if "info_URL" not in item["tags"]:
+                    for metric in template["url_metrics"]:
+                        parameter_overrides = [
+                            o["parameter"] for o in
+                            self.metric_parameter_overrides4metrics.get(
+                                metric, []
+                            ) if o["hostname"] in [
+                                item["hostname"], entity_name
+                            ]
+                        ]
+                        attr_overrides = [
+                            o["attribute"] for o in
+                            self._get_host_attribute_overrides4entity(
+                                item["hostname"], entity_name
+                            )
+                        ]
+                        if self.metrics_with_endpoint_url[metric][
+                            "value"
+                        ] not in parameter_overrides and \
+                                "URL" not in attr_overrides:
+                            missing_metrics_endpoint_url.append(metric)
 
-                if "info_URL" in item["tags"]:
-                    servicetypes_with_path = [
-                        st for st in self.servicetypes_with_path if
-                        item["service"] == st["service"]
-                    ]
-                    servicetypes_with_port = [
-                        st for st in self.servicetypes_with_port if
-                        item["service"] == st["service"]
-                    ]
+                    if len(missing_metrics_endpoint_url) > 0:
+                        self.logger.warning(
+                            f"{self.tenant}: Entity {entity_name} "
+                            f"missing URL"
+                        )
+
+                else:
                     labels.update({
-                        "info_url": self._handle_endpoint_url(
+                        "endpoint_url": self._handle_endpoint_url(
                             item["tags"]["info_URL"]
                         )
                     })
-                    o = urlparse(item["tags"]["info_URL"])
-                    port = o.port
-
-                    if item["service"] in self.servicetypes_with_SSL:
-                        if o.scheme == "https":
-                            labels.update({"ssl": "-S --sni"})
-
-                    if o.path:
-                        path = o.path
-                        if o.query:
-                            path = f"{path}?{o.query}"
-                        for entry in servicetypes_with_path:
-                            lbl = f"{create_label(entry['metric'])}_path"
-                            val = f"{entry['attr_val']} {path}"
-                            labels.update({lbl: val})
-
-                    if port:
-                        for entry in servicetypes_with_port:
-                            lbl = f"{create_label(entry['metric'])}_port"
-                            val = f"{entry['attr_val']} {str(port)}"
-                            labels.update({lbl: val})
-
-                    if item["service"] in [
-                        "org.openstack.nova", "org.openstack.swift"
-                    ]:
-                        if port:
-                            labels.update({"os_keystone_port": str(port)})
-
-                        labels.update({"os_keystone_host": o.hostname})
-                        labels.update({
-                            "os_keystone_url": self._handle_endpoint_url(
-                                item["tags"]["info_URL"]
-                            )
-                        })
 
-                missing_metrics_endpoint_url = list()
+        if item["service"] in self.servicetypes_with_url:
+            for attr in self.servicetypes_with_url[item["service"]]:
                 if "info_service_endpoint_URL" in item["tags"]:
                     labels.update({
-                        "endpoint_url":
+                        create_label(attr):
                             self._get_single_endpoint_url(
-                                item["tags"]["info_service_endpoint_URL"]
+                                item["tags"][
+                                    "info_service_endpoint_URL"
+                                ]
                             )
                     })
 
-                else:
-                    if item["service"] in self.servicetypes_with_endpointURL:
-                        if "info_URL" not in item["tags"]:
-                            metrics_with_endpoint_url = \
-                                self.metrics_with_endpoint_url.keys()
-                            url_metrics = list(set(
-                                self.metrics4servicetypes[item["service"]]
-                            ).intersection(
-                                set(metrics_with_endpoint_url)
-                            ))
-
-                            for metric in url_metrics:
-                                parameter_overrides = [
-                                    o["parameter"] for o in
-                                    self.metric_parameter_overrides if
-                                    o["metric"] == metric and
-                                    o["hostname"] in [
-                                        item["hostname"], entity_name
-                                    ]
-                                ]
-                                attr_overrides = [
-                                    o["attribute"] for o in
-                                    self.host_attribute_overrides if
-                                    o["hostname"] in [
-                                        item["hostname"], entity_name
-                                    ]
-                                ]
-                                if self.metrics_with_endpoint_url[metric][
-                                    "value"
-                                ] not in parameter_overrides and \
-                                        "URL" not in attr_overrides:
-                                    missing_metrics_endpoint_url.append(metric)
-
-                            if len(missing_metrics_endpoint_url) > 0:
-                                self.logger.warning(
-                                    f"{self.tenant}: Entity {entity_name} "
-                                    f"missing URL"
-                                )
-
-                        else:
-                            labels.update({
-                                "endpoint_url": self._handle_endpoint_url(
-                                    item["tags"]["info_URL"]
-                                )
-                            })
-
-                if item["service"] in self.servicetypes_with_url:
-                    for attr in self.servicetypes_with_url[item["service"]]:
-                        if "info_service_endpoint_URL" in item["tags"]:
-                            labels.update({
-                                create_label(attr):
-                                    self._get_single_endpoint_url(
-                                        item["tags"][
-                                            "info_service_endpoint_URL"
-                                        ]
-                                    )
-                            })
-
-                        elif "info_URL" in item["tags"]:
-                            labels.update({
-                                create_label(attr):
-                                    self._handle_endpoint_url(
-                                        item["tags"]["info_URL"]
-                                    )
-                            })
-
-                        else:
-                            pass
-
-                if item["service"] == "Top-BDII":
-                    labels.update({"bdii_dn": "Mds-Vo-Name=local,O=Grid"})
-                    labels.update({"bdii_type": "bdii_top"})
+                elif "info_URL" in item["tags"]:
                     labels.update({
-                        "glue2_bdii_dn":
-                            "GLUE2DomainID=%s,o=glue" % item["group"]
+                        create_label(attr):
+                            self._handle_endpoint_url(
+                                item["tags"]["info_URL"]
+                            )
                     })
 
-                if item["service"] == "Site-BDII":
-                    labels.update({
-                        "bdii_dn": "Mds-Vo-Name=%s,O=Grid" % item["group"]
-                    })
-                    labels.update({"bdii_type": "bdii_site"})
-                    labels.update({
-                        "glue2_bdii_dn":
-                            "GLUE2DomainID=%s,o=glue" % item["group"]
-                    })
+                else:
+                    pass
+
+        if item["service"] == "Top-BDII":
+            labels.update({"bdii_dn": "Mds-Vo-Name=local,O=Grid"})
+            labels.update({"bdii_type": "bdii_top"})
+            labels.update({
+                "glue2_bdii_dn":
+                    "GLUE2DomainID=%s,o=glue" % item["group"]
+            })
 
-                if "info_HOSTDN" in item["tags"]:
-                    labels.update({"info_hostdn": item["tags"]["info_HOSTDN"]})
+        if item["service"] == "Site-BDII":
+            labels.update({
+                "bdii_dn": "Mds-Vo-Name=%s,O=Grid" % item["group"]
+            })
+            labels.update({"bdii_type": "bdii_site"})
+            labels.update({
+                "glue2_bdii_dn":
+                    "GLUE2DomainID=%s,o=glue" % item["group"]
+            })
 
-                types.append(item["service"])
+        if "info_HOSTDN" in item["tags"]:
+            labels.update({"info_hostdn": item["tags"]["info_HOSTDN"]})
 
-                metrics4servicetype = self.metrics4servicetypes[item["service"]]
+        metrics4servicetype = template["metrics_set"]
+        attribute_overrides = template["attribute_overrides"]
 
-                attribute_overrides = [
-                    o for o in self.host_attribute_overrides
-                    if len(
-                        set(o["metrics"]).intersection(
-                            set(metrics4servicetype)
-                        )
-                    ) > 0
-                ]
+        host_attribute_overrides = [
+            o for o in self._get_host_attribute_overrides4entity(
+                item["hostname"], entity_name
+            ) if len(
+                set(o["metrics"]).intersection(metrics4servicetype)
+            ) > 0
+        ]
 
-                host_attribute_overrides = [
-                    o for o in attribute_overrides
-                    if o["hostname"] in [item["hostname"], entity_name]
-                ]
+        non_fallback_urls_created = list()
+        for metric_template in template["metrics"]:
+            metric = metric_template["name"]
+            metric_parameter_overrides = \
+                metric_template["parameter_overrides"]
 
-                non_fallback_urls_created = list()
-                for metric in metrics4servicetype:
-                    metric_parameter_overrides = [
-                        o for o in self.metric_parameter_overrides
-                        if o["metric"] == metric
+            if metric_template["non_fallback_url"]:
+                metric_attribute = metric_template["non_fallback_url"]
+                non_fallback_urls_created.append(
+                    metric_attribute["attribute"]
+                )
+                value = ""
+                if (f"info_ext_{metric_attribute['attribute']}"
+                        in item["tags"]):
+                    ext_value = item["tags"][
+                        f"info_ext_{metric_attribute['attribute']}"
                     ]
+                    value = f"{metric_attribute['value']} {ext_value}"
 
-                    hostaliases = [
-                        ha for ha in self.metrics_with_hostalias
-                        if ha["metric"] == metric
+                overridden_attribute = [
+                    a for a in host_attribute_overrides
+                    if a["attribute"] == metric_attribute[
+                        "attribute"
                     ]
+                ]
 
-                    servicesite_metrics = [
-                        ss for ss in self.metrics_with_servicesite_name
-                        if ss["metric"] == metric
-                    ]
+                if len(overridden_attribute) > 0:
+                    value = \
+                        f"{metric_attribute['value']} "\
+                        f"{overridden_attribute[-1]['value']}"
 
-                    if metric in self.metrics_with_non_fallback_urls:
-                        metric_attribute = \
-                            self.metrics_with_non_fallback_urls[metric]
-                        non_fallback_urls_created.append(
-                            metric_attribute["attribute"]
-                        )
-                        key_prefix = create_label(
-                            metric_attribute["value"].strip("-").strip("-")
-                        )
-                        key_suffix = create_label(
-                            metric_attribute["attribute"]
-                        )
-                        value = ""
-                        if (f"info_ext_{metric_attribute['attribute']}"
-                                in item["tags"]):
-                            ext_value = item["tags"][
-                                f"info_ext_{metric_attribute['attribute']}"
-                            ]
-                            value = f"{metric_attribute['value']} {ext_value}"
+                labels.update({metric_attribute["label"]: value})
 
-                        overridden_attribute = [
-                            a for a in host_attribute_overrides
-                            if a["attribute"] == metric_attribute[
-                                "attribute"
-                            ]
-                        ]
+            key = metric_template["label"]
+            if key and key not in labels and \
+                    metric not in missing_metrics_endpoint_url:
+                labels.update({key: metric})
 
-                        if len(overridden_attribute) > 0:
-                            value = \
-                                f"{metric_attribute['value']} "\
-                                f"{overridden_attribute[-1]['value']}"
+            for o, is_default in metric_parameter_overrides:
+                if is_default:
+                    label = o["label"]
+                    if o["hostname"] in [item["hostname"], entity_name]:
+                        labels.update({
+                            label: "%s %s" % (
+                                o["parameter"], o["value"]
+                            )
+                        })
+                        break
 
-                        labels.update({f"{key_prefix}__{key_suffix}": value})
+                    else:
+                        labels.update({label: ""})
 
-                    if metric not in self.internal_metrics:
-                        key = create_label(metric)
+                else:
+                    if o["hostname"] in [item["hostname"], entity_name]:
+                        value = o["value"]
+                        if self._is_hostalias_present(o["value"]):
+                            value = self._create_hostalias_value(
+                                o["value"], hostname
+                            )
 
-                        if key not in labels and \
-                                metric not in missing_metrics_endpoint_url and \
-                                metric not in self.skipped_metrics:
-                            labels.update({key: metric})
+                        if self._is_servicesite_name_present(
+                                o["value"]
+                        ):
+                            value = (
+                                self._create_servicesite_name_value(
+                                    o["value"], item["group"]
+                                ))
 
-                    for o in metric_parameter_overrides:
-                        if self._is_parameter_default(metric, o["parameter"]):
-                            label = o["label"]
-                            if o["hostname"] in [item["hostname"], entity_name]:
-                                labels.update({
-                                    label: "%s %s" % (
-                                        o["parameter"], o["value"]
-                                    )
-                                })
-                                break
+                        labels.update({o["label"]: value})
 
-                            else:
-                                labels.update({label: ""})
+            host_metric_parameter_overrides = [
+                o for o, _ in metric_parameter_overrides if
+                o["hostname"] in [item["hostname"], entity_name]
+            ]
+
+            if len(host_metric_parameter_overrides) == 0:
+                for ha in metric_template["hostaliases"]:
+                    label = ha["label"]
+                    value = self._create_hostalias_value(
+                        ha["value"], hostname
+                    )
+                    labels.update({label: value})
+
+                for ss in metric_template["servicesite_names"]:
+                    label = ss["label"]
+                    value = self._create_servicesite_name_value(
+                        ss["value"], item["group"]
+                    )
+                    labels.update({label: value})
+
+        if len(attribute_overrides) > 0:
+            overriding_attributes = set(
+                [o["attribute"] for o in attribute_overrides]
+            ).difference(set([
+                    o["attribute"] for o in host_attribute_overrides
+            ]))
+
+            for o in host_attribute_overrides:
+                if o["label"] not in [
+                    create_label(item) for item
+                    in non_fallback_urls_created
+                ]:
+                    if o["label"] == "url":
+                        labels.update({"endpoint_url": o["value"]})
+
+                    else:
+                        if (self._is_attribute_overridden_all_endpoints(
+                            o["attribute"]
+                        ) or o["attribute"] in self.global_attributes
+                                or o["attribute"] in self.default_ports
+                            or is_attribute_secret(o["attribute"])
+                        ):
+                            labels.update({o["label"]: o["value"]})
 
                         else:
-                            if o["hostname"] in [item["hostname"], entity_name]:
-                                value = o["value"]
-                                if self._is_hostalias_present(o["value"]):
-                                    value = self._create_hostalias_value(
-                                        o["value"], hostname
-                                    )
-
-                                if self._is_servicesite_name_present(
-                                        o["value"]
-                                ):
-                                    value = (
-                                        self._create_servicesite_name_value(
-                                            o["value"], item["group"]
-                                        ))
-
-                                labels.update({o["label"]: value})
-
-                    host_metric_parameter_overrides = [
-                        o for o in metric_parameter_overrides if
-                        o["hostname"] in [item["hostname"], entity_name]
-                    ]
+                            params = attributes4metrics[o["attribute"]]
+                            for param in params:
+                                if param["metric"] in \
+                                        metrics4servicetype:
+                                    labels.update({
+                                        "{}__{}".format(
+                                            param["value"].lstrip(
+                                                "-"
+                                            ).lstrip("-").replace(
+                                                "-", "_"
+                                            ), create_label(
+                                                o["attribute"]
+                                            )
+                                        ): f"{param['value']} "
+                                           f"{o['value']}"
+                                    })
+
+                    # labels.update({
+                    #     label: o["value"]
+                    # })
+
+            for attr in overriding_attributes:
+                if attr not in self.global_attributes and \
+                        is_attribute_secret(attr):
+                    label = f"${create_attribute_env(attr)}"
+                    labels.update({create_label(attr): label})
+
+        for tag, value in item["tags"].items():
+            if (tag.startswith("info_bdii_") and
+                    f"info_ext_{tag[10:]}" not in item["tags"]):
+                labels.update({
+                    create_label(tag[10:]): value
+                })
 
-                    if len(host_metric_parameter_overrides) == 0:
-                        for ha in hostaliases:
-                            label = ha["label"]
-                            value = self._create_hostalias_value(
-                                ha["value"], hostname
-                            )
-                            labels.update({label: value})
+            if tag.startswith("info_ext_"):
+                present_in_all = template[
+                    "extensions_present_in_all"
+                ].get(tag)
+                if present_in_all is None:
+                    present_in_all = \
+                        self._is_extension_present_all_endpoints(
+                            services=[item["service"]], extension=tag
+                        )
+                    template["extensions_present_in_all"].update({
+                        tag: present_in_all
+                    })
 
-                        for ss in servicesite_metrics:
-                            label = ss["label"]
-                            value = self._create_servicesite_name_value(
-                                ss["value"], item["group"]
-                            )
-                            labels.update({label: value})
-
-                if len(attribute_overrides) > 0:
-                    overriding_attributes = set(
-                        [o["attribute"] for o in attribute_overrides]
-                    ).difference(set([
-                            o["attribute"] for o in host_attribute_overrides
-                    ]))
-
-                    for o in host_attribute_overrides:
-                        if o["label"] not in [
-                            create_label(item) for item
-                            in non_fallback_urls_created
-                        ]:
-                            if o["label"] == "url":
-                                labels.update({"endpoint_url": o["value"]})
+                if tag.lower() == "info_ext_port":
+                    labels.update({"port": value})
 
-                            else:
-                                if (self._is_attribute_overridden_all_endpoints(
-                                    o["attribute"]
-                                ) or o["attribute"] in self.global_attributes
-                                        or o["attribute"] in self.default_ports
-                                    or is_attribute_secret(o["attribute"])
-                                ):
-                                    labels.update({o["label"]: o["value"]})
-
-                                else:
-                                    params = attributes4metrics[o["attribute"]]
-                                    for param in params:
-                                        if param["metric"] in \
-                                                metrics4servicetype:
-                                            labels.update({
-                                                "{}__{}".format(
-                                                    param["value"].lstrip(
-                                                        "-"
-                                                    ).lstrip("-").replace(
-                                                        "-", "_"
-                                                    ), create_label(
-                                                        o["attribute"]
-                                                    )
-                                                ): f"{param['value']} "
-                                                   f"{o['value']}"
-                                            })
-
-                            # labels.update({
-                            #     label: o["value"]
-                            # })
-
-                    for attr in overriding_attributes:
-                        if attr not in self.global_attributes and \
-                                is_attribute_secret(attr):
-                            label = f"${create_attribute_env(attr)}"
-                            labels.update({create_label(attr): label})
-
-                for tag, value in item["tags"].items():
-                    if (tag.startswith("info_bdii_") and
-                            f"info_ext_{tag[10:]}" not in item["tags"]):
+                else:
+                    if tag[9:] in self.default_ports:
                         labels.update({
-                            create_label(tag[10:]): value
+                            create_label(tag[9:]): value
                         })
 
-                    if tag.startswith("info_ext_"):
-                        present_in_all = \
-                            self._is_extension_present_all_endpoints(
-                                services=[item["service"]], extension=tag
-                            )
-                        if tag.lower() == "info_ext_port":
-                            labels.update({"port": value})
-
-                        else:
-                            if tag[9:] in self.default_ports:
-                                labels.update({
-                                    create_label(tag[9:]): value
-                                })
+                    elif (tag[9:] in non_fallback_urls_created and
+                          not present_in_all):
+                        continue
 
-                            elif (tag[9:] in non_fallback_urls_created and
-                                  not present_in_all):
-                                continue
+                    elif present_in_all or tag.endswith("_URL"):
+                        if value in ["0", "1"]:
+                            value = ""
 
-                            elif present_in_all or tag.endswith("_URL"):
-                                if value in ["0", "1"]:
-                                    value = ""
+                        labels.update({
+                            create_label(tag[9:]): value
+                        })
 
-                                labels.update({
-                                    create_label(tag[9:]): value
-                                })
+                    else:
+                        attribute = tag[9:]
+                        if attribute not in template[
+                            "ext_attribute_values"
+                        ]:
+                            template["ext_attribute_values"].update({
+                                attribute: [
+                                    configuration["attribute"][
+                                        attribute
+                                    ] for configuration in template[
+                                        "ext_metrics"
+                                    ] if attribute in
+                                    configuration["attribute"]
+                                ]
+                            })
 
-                            else:
-                                metrics = list()
-                                for metric in self.metrics:
-                                    for name, configuration in metric.items():
-                                        if name in self.metrics4servicetypes[
-                                            item["service"]
-                                        ]:
-                                            metrics.append(metric)
-
-                                for metric in metrics:
-                                    for name, configuration in metric.items():
-                                        if tag[9:] in \
-                                                configuration["attribute"]:
-                                            if value in ["0", "1"]:
-                                                value = ""
-
-                                            labels.update({
-                                                "{}__{}".format(
-                                                    configuration["attribute"][
-                                                        tag[9:]
-                                                    ].lstrip("-").lstrip(
-                                                        "-"
-                                                    ).replace("-", "_"),
-                                                    tag[9:].lower()
-                                                ): "{} {}".format(
-                                                    configuration["attribute"][
-                                                        tag[9:]
-                                                    ], value
-                                                )
-                                            })
+                        for attr_value in template[
+                            "ext_attribute_values"
+                        ][attribute]:
+                            if value in ["0", "1"]:
+                                value = ""
 
-                try:
-                    ngi = item["ngi"]
+                            labels.update({
+                                "{}__{}".format(
+                                    attr_value.lstrip("-").lstrip(
+                                        "-"
+                                    ).replace("-", "_"),
+                                    attribute.lower()
+                                ): f"{attr_value} {value}"
+                            })
 
-                except KeyError:
-                    ngi = ""
+        try:
+            ngi = item["ngi"]
 
-                labels.update({
-                    "service": item["service"],
-                    "site": item["group"],
-                    "ngi": ngi,
-                    "tenants": self.tenant
-                })
+        except KeyError:
+            ngi = ""
+
+        labels.update({
+            "service": item["service"],
+            "site": item["group"],
+            "ngi": ngi,
+            "tenants": self.tenant
+        })
+
+        site_bdii_entries = [
+            i for i in self.topology4sites[item["group"]]
+            if i["service"] == "Site-BDII"
+        ]
 
-                site_entries = [
-                    i for i in self.topology if i["group"] == item["group"]
-                ]
-                site_bdii_entries = [
-                    i for i in site_entries if i["service"] == "Site-BDII"
-                ]
+        if item["service"] in self.servicetypes_with_site_bdii:
+            if len(site_bdii_entries) > 0:
+                for metric, config in (
+                        self.metrics_with_site_bdii.items()
+                ):
+                    label = config["label"]
+                    value = (f"{config['value']} "
+                             f"{site_bdii_entries[0]['hostname']}")
+                    labels.update({label: value})
+
+        return labels
+
+    def _generate_entities(self, items4names, namespace):
+        attributes4metrics = self._get_attributes4metrics()
+        templates = dict()
+
+        for entity_name, items in items4names:
+            entity = None
+            for item in items:
+                if item["service"] not in templates:
+                    templates.update({
+                        item["service"]:
+                            self._create_entity_template(item["service"])
+                    })
 
-                if item["service"] in self.servicetypes_with_site_bdii:
-                    if len(site_bdii_entries) > 0:
-                        for metric, config in (
-                                self.metrics_with_site_bdii.items()
-                        ):
-                            label = config["label"]
-                            value = (f"{config['value']} "
-                                     f"{site_bdii_entries[0]['hostname']}")
-                            labels.update({label: value})
-
-                existing_entities = [
-                    ent for ent in entities if
-                    ent["metadata"]["name"] == entity_name
-                ]
+                labels = self._generate_entity_labels(
+                    item=item, entity_name=entity_name,
+                    template=templates[item["service"]],
+                    attributes4metrics=attributes4metrics
+                )
 
-                if len(existing_entities) > 0:
-                    existing_entity = existing_entities[0]
-                    old_labels = existing_entity["metadata"]["labels"].copy()
+                if entity:
+                    old_labels = entity["metadata"]["labels"].copy()
                     site = set([
                         e.strip() for e in
-                        existing_entity["metadata"]["labels"]["site"].split(",")
+                        entity["metadata"]["labels"]["site"].split(",")
                     ])
                     site.add(labels["site"])
                     if len(old_labels.keys()) >= len(labels.keys()):
@@ -1479,25 +1771,74 @@ class ConfigurationGenerator:
 
                     new_labels["site"] = ",".join(sorted(list(site)))
 
-                    existing_entity["metadata"]["labels"] = new_labels
+                    entity["metadata"]["labels"] = new_labels
 
                 else:
-                    entities.append({
+                    entity = {
                         "entity_class": "proxy",
                         "metadata": {
                             "name": entity_name,
                             "namespace": namespace,
                             "labels": labels
                         }
-                    })
+                    }
 
-            if len(skipped_entities) > 0:
-                self.logger.info(
-                    f"{self.tenant}: Skipped entities generation for entities: "
-                    f"{', '.join(skipped_entities)}: invalid characters"
-                )
+            yield entity
+
+    def iter_entities(self, namespace="default", workers=1):
+        try:
+            # endpoints defining the same entity are grouped, so that each
+            # entity can be yielded as soon as all its endpoints are handled
+            items4names = dict()
+            for item in self.topology:
+                if item["service"] in self.servicetypes:
+                    entity_name = f"{item['service']}__{item['hostname']}"
+                    if entity_name not in items4names:
+                        items4names.update({entity_name: list()})
+
+                    items4names[entity_name].append(item)
+
+            if workers > 1 and len(items4names) > 1:
+                # contiguous partitions of entities are generated in worker
+                # processes and collected in order, so the result is the same
+                # as if they were generated in this process
+                names = list(items4names.keys())
+                size = -(-len(names) // (workers * PARTITIONS_PER_WORKER))
+                partitions = [
+                    [(name, items4names[name]) for name in names[i:i + size]]
+                    for i in range(0, len(names), size)
+                ]
+                # worker processes are not forked, since other threads of
+                # this process may hold locks (e.g. of logging handlers) at
+                # the time of the fork, which would never be released in the
+                # worker
+                stats4workers = dict()
+                try:
+                    with concurrent.futures.ProcessPoolExecutor(
+                            max_workers=workers,
+                            mp_context=multiprocessing.get_context(
+                                "forkserver"
+                            ),
+                            initializer=_init_partition_worker,
+                            initargs=(self,)
+                    ) as executor:
+                        for entities, pid, stats in executor.map(
+                                _generate_partition_entities, partitions,
+                                [namespace] * len(partitions)
+                        ):
+                            # statistics of each worker are cumulative, so
+                            # only the latest ones are kept
+                            stats4workers.update({pid: stats})
+                            yield from entities
+
+                finally:
+                    for stats in stats4workers.values():
+                        _add_worker_cache_stats(stats)
 
-            return entities
+            else:
+                yield from self._generate_entities(
+                    items4names=items4names.items(), namespace=namespace
+                )
 
         except KeyError:
             self.logger.error(
@@ -1508,6 +1849,9 @@ class ConfigurationGenerator:
                 f"{self.tenant}: Error generating entities: faulty topology"
             )
 
+    def generate_entities(self, namespace="default", workers=1):
+        return list(self.iter_entities(namespace=namespace, workers=workers))
+
     def generate_internal_services(self):
         services = list()
         for metric in self.internal_metrics:
@@ -1532,118 +1876,101 @@ class ConfigurationMerger:
         self.attribute_overrides = attributeoverrides4agents
         self.logger = logging.getLogger("argo-scg.generator")
 
+    @staticmethod
+    def _append_label_value(values, value):
+        # earlier values are split into items the moment a new value is
+        # appended, and the items are sorted and joined when merging is done
+        values.extend(item.strip() for item in values.pop().split(","))
+        values.append(value)
+
+    @staticmethod
+    def _join_label_values(items, labels_values):
+        for (index, key), values in labels_values.items():
+            items[index]["metadata"]["labels"][key] = ",".join(sorted(values))
+
     def merge_checks(self):
         merged_checks = list()
+        checks_indices = dict()
+        labels_values = dict()
 
         for tenant, checks in self.checks.items():
-            checks_names = [item["metadata"]["name"] for item in merged_checks]
+            tenant_indices = dict()
             for check in checks:
-                if check["metadata"]["name"] not in checks_names:
+                name = check["metadata"]["name"]
+                if name not in checks_indices:
+                    tenant_indices.setdefault(name, len(merged_checks))
                     merged_checks.append(check)
 
                 else:
-                    check_index = next(
-                        (index for (index, d) in enumerate(merged_checks) if
-                         d["metadata"]["name"] == check["metadata"]["name"]),
-                        None
-                    )
+                    check_index = checks_indices[name]
+                    if (check_index, "tenants") not in labels_values:
+                        labels_values[(check_index, "tenants")] = [
+                            merged_checks[check_index]["metadata"]["labels"][
+                                "tenants"
+                            ]
+                        ]
 
-                    tenants = [
-                        item.strip() for item in merged_checks[check_index][
-                            "metadata"
-                        ]["labels"]["tenants"].split(",")
-                    ]
+                    self._append_label_value(
+                        labels_values[(check_index, "tenants")],
+                        check["metadata"]["labels"]["tenants"]
+                    )
 
-                    tenants.append(check["metadata"]["labels"]["tenants"])
+            checks_indices.update(tenant_indices)
 
-                    merged_checks[check_index]["metadata"]["labels"][
-                        "tenants"
-                    ] = ",".join(sorted(tenants))
+        self._join_label_values(merged_checks, labels_values)
 
         return merged_checks
 
     def merge_entities(self):
         merged_entities = list()
+        entities_indices = dict()
+        labels_values = dict()
+
         for tenant, entities in self.entities.items():
-            entities_names = [
-                item["metadata"]["name"] for item in merged_entities
-            ]
+            tenant_indices = dict()
             for entity in entities:
-                if entity["metadata"]["name"] not in entities_names:
+                name = entity["metadata"]["name"]
+                if name not in entities_indices:
+                    tenant_indices.setdefault(name, len(merged_entities))
                     merged_entities.append(entity)
 
                 else:
-                    entity_index = next(
-                        (index for (index, d) in enumerate(merged_entities) if
-                         d["metadata"]["name"] == entity["metadata"]["name"]),
-                        None
-                    )
+                    entity_index = entities_indices[name]
+                    labels = merged_entities[entity_index]["metadata"][
+                        "labels"
+                    ]
 
                     for key, value in entity["metadata"]["labels"].items():
-                        if key not in merged_entities[entity_index]["metadata"][
-                            "labels"
-                        ]:
-                            merged_entities[entity_index]["metadata"][
-                                "labels"
-                            ].update({key: value})
-
-                    site = [
-                        item.strip() for item in merged_entities[entity_index][
-                            "metadata"
-                        ]["labels"]["site"].split(",")
-                    ]
-                    tenants = [
-                        item.strip() for item in merged_entities[entity_index][
-                            "metadata"
-                        ]["labels"]["tenants"].split(",")
-                    ]
-                    site.append(entity["metadata"]["labels"]["site"])
-                    tenants.append(entity["metadata"]["labels"]["tenants"])
+                        if key not in labels:
+                            labels.update({key: value})
 
-                    merged_entities[entity_index]["metadata"]["labels"][
-                        "site"
-                    ] = ",".join(sorted(site))
-                    merged_entities[entity_index]["metadata"]["labels"][
-                        "tenants"
-                    ] = ",".join(sorted(tenants))
+                    for key in ["site", "tenants"]:
+                        if (entity_index, key) not in labels_values:
+                            labels_values[(entity_index, key)] = [labels[key]]
 
-        return sorted(merged_entities, key=lambda e: e["metadata"]["name"])
+                        self._append_label_value(
+                            labels_values[(entity_index, key)],
+                            entity["metadata"]["labels"][key]
+                        )
 
-    @staticmethod
-    def _metric_parameter_override_exists(override, merged):
-        return len([
-            item for item in merged if (
-                    item["metric"] == override["metric"] and
-                    item["hostname"] == override["hostname"] and
-                    item["parameter"] == override["parameter"]
-            )
-        ]) == 1
+            entities_indices.update(tenant_indices)
 
-    @staticmethod
-    def _metric_parameter_override_identical(override, merged):
-        return len([
-            item for item in merged if (
-                    item["metric"] == override["metric"] and
-                    item["hostname"] == override["hostname"] and
-                    item["parameter"] == override["parameter"] and
-                    item["value"] == override["value"]
-            )
-        ]) == 1
+        self._join_label_values(merged_entities, labels_values)
+
+        return sorted(merged_entities, key=lambda e: e["metadata"]["name"])
 
     def merge_metric_parameter_overrides(self):
         merged_overrides = list()
         if self.metric_overrides:
+            merged = dict()
             for tenant, overrides in self.metric_overrides.items():
                 for override in overrides:
-                    if self._metric_parameter_override_exists(
-                            override, merged_overrides
-                    ):
-                        if self._metric_parameter_override_identical(
-                            override, merged_overrides
-                        ):
-                            continue
-
-                        else:
+                    key = (
+                        override["hostname"], override["metric"],
+                        override["parameter"]
+                    )
+                    if key in merged:
+                        if merged[key]["value"] != override["value"]:
                             self.logger.warning(
                                 f"{tenant}: Discrepancy in "
                                 f"{override['hostname']}/{override['metric']} "
@@ -1651,51 +1978,23 @@ class ConfigurationMerger:
                             )
 
                     else:
+                        merged[key] = override
                         merged_overrides.append(override)
 
         return merged_overrides
 
-    @staticmethod
-    def _attribute_present(override, merged):
-        return len([
-            item for item in merged if (
-                item["hostname"] == override["hostname"] and
-                item["attribute"] == override["attribute"]
-            )
-        ]) == 1
-
-    @staticmethod
-    def _attribute_identical(override, merged):
-        return len([
-            item for item in merged if (
-                    item["hostname"] == override["hostname"] and
-                    item["attribute"] == override["attribute"] and
-                    item["value"] == override["value"]
-            )
-        ]) == 1
-
     def merge_attribute_overrides(self):
         merged_attributes = list()
         if self.attribute_overrides:
+            merged = dict()
+            extended = set()
             for tenant, overrides in self.attribute_overrides.items():
                 for override in overrides:
-                    if self._attribute_present(override, merged_attributes):
-                        if self._attribute_identical(
-                                override, merged_attributes
-                        ):
-                            merged_attribute = [
-                                item for item in merged_attributes if (
-                                        item["hostname"] == override["hostname"]
-                                        and item["attribute"] == override[
-                                            "attribute"
-                                        ]
-                                )
-                            ][0]
-                            metrics = merged_attribute["metrics"]
-                            metrics.extend(override["metrics"])
-                            merged_attributes[
-                                merged_attributes.index(merged_attribute)
-                            ]["metrics"] = sorted(metrics)
+                    key = (override["hostname"], override["attribute"])
+                    if key in merged:
+                        if merged[key]["value"] == override["value"]:
+                            merged[key]["metrics"].extend(override["metrics"])
+                            extended.add(key)
 
                         else:
                             self.logger.warning(
@@ -1706,8 +2005,12 @@ class ConfigurationMerger:
                             )
 
                     else:
+                        merged[key] = override
                         merged_attributes.append(override)
 
+            for key in extended:
+                merged[key]["metrics"] = sorted(merged[key]["metrics"])
+
         return merged_attributes
 
     def merge_internal_services(self):
@@ -5,22 +5,28 @@ LOGFILE = "/var/log/argo-scg/argo-scg.log"
 LOGNAME = "argo-scg"
 
 
-def get_logger():
+def get_logger(thread_names=False, debug=False):
+    level = logging.DEBUG if debug else logging.INFO
     logger = logging.getLogger(LOGNAME)
-    logger.setLevel(logging.INFO)
+    logger.setLevel(level)
+
+    # messages of workers running in parallel are tagged with thread name
+    message = "%(message)s"
+    if thread_names:
+        message = "[%(threadName)s] %(message)s"
 
     # setting up stdout
     stdout = logging.StreamHandler()
-    stdout.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
+    stdout.setFormatter(logging.Formatter(f"%(levelname)s - {message}"))
     logger.addHandler(stdout)
 
     # setting up logging to a file
     logfile = logging.handlers.RotatingFileHandler(
         LOGFILE, maxBytes=512 * 1024, backupCount=5
     )
-    logfile.setLevel(logging.INFO)
+    logfile.setLevel(level)
     logfile.setFormatter(logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        f"%(asctime)s - %(name)s - %(levelname)s - {message}",
         "%Y-%m-%d %H:%M:%S"
     ))
     logger.addHandler(logfile)
@@ -0,0 +1,71 @@
+CONFIGURATION_KEYS = (
+    "tags", "probe", "config", "flags", "dependency", "attribute",
+    "parameter", "file_parameter", "file_attribute", "parent", "docurl"
+)
+
+
+def _to_int(value):
+    try:
+        return int(value)
+
+    except (TypeError, ValueError):
+        return None
+
+
+class MetricSpec:
+    __slots__ = CONFIGURATION_KEYS + (
+        "name", "interval", "timeout", "max_check_attempts"
+    )
+
+    def __init__(self, name, configuration):
+        self.name = name
+        self.tags = frozenset(configuration["tags"])
+        self.probe = configuration["probe"]
+        self.config = configuration["config"]
+        self.flags = frozenset(configuration["flags"])
+        self.dependency = configuration.get("dependency", dict())
+        self.attribute = configuration["attribute"]
+        self.parameter = configuration["parameter"]
+        self.file_parameter = configuration.get("file_parameter", dict())
+        self.file_attribute = configuration.get("file_attribute", dict())
+        self.parent = configuration["parent"]
+        self.docurl = configuration.get("docurl", "")
+
+        config = self.config if self.config else dict()
+        self.interval = _to_int(config.get("interval"))
+        self.timeout = _to_int(config.get("timeout"))
+        self.max_check_attempts = _to_int(config.get("maxCheckAttempts"))
+
+    # metric specs can be used wherever the configurations fetched from POEM
+    # are expected, since their fields are accessible by the same keys
+    def __getitem__(self, key):
+        if key not in CONFIGURATION_KEYS:
+            raise KeyError(key)
+
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in CONFIGURATION_KEYS
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+
+        except KeyError:
+            return default
+
+    def __eq__(self, other):
+        return isinstance(other, MetricSpec) and \
+            self.name == other.name and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"MetricSpec({self.name!r})"
+
+    def to_dict(self):
+        configuration = dict((key, self[key]) for key in CONFIGURATION_KEYS)
+        configuration.update({
+            "tags": sorted(self.tags),
+            "flags": dict((flag, "1") for flag in sorted(self.flags))
+        })
+
+        return configuration
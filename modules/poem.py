@@ -1,18 +1,31 @@
 import logging
 
-import requests
 from argo_scg.exceptions import PoemException
+from argo_scg.metric import MetricSpec
+from argo_scg.session import get_session
 
 
 class Poem:
-    def __init__(self, url, token, tenant):
+    def __init__(self, url, token, tenant, session=None, cache=None):
         self.url = url
         self.token = token
         self.tenant = tenant
+        self.session = session if session else get_session()
+        self.cache = cache
         self.logger = logging.getLogger("argo-scg.poem")
 
+    def _get(self, url, headers):
+        if self.cache:
+            return self.cache.get(
+                session=self.session, url=url, headers=headers,
+                token=self.token
+            )
+
+        else:
+            return self.session.get(url, headers=headers)
+
     def _get_metrics(self):
-        response = requests.get(
+        response = self._get(
             f"{self.url}/api/v2/metrics",
             headers={"x-api-key": self.token}
         )
@@ -34,7 +47,7 @@ class Poem:
             return response.json()
 
     def get_metric_overrides(self):
-        response = requests.get(
+        response = self._get(
             f"{self.url}/api/v2/metricoverrides",
             headers={"x-api-key": self.token}
         )
@@ -55,10 +68,10 @@ class Poem:
         else:
             return response.json()
 
-    def get_metrics_configurations(self):
+    def get_metrics_configurations(self, compact=False):
         metrics = self._get_metrics()
 
-        metric_confs = list()
+        metric_confs = dict() if compact else list()
         for metric in metrics:
             for name, configuration in metric.items():
                 try:
@@ -66,7 +79,14 @@ class Poem:
                             configuration["config"]["path"] == "$USER1$":
                         configuration["config"]["path"] = \
                             "/usr/lib64/nagios/plugins"
-                    metric_confs.append({name: configuration})
+
+                    if compact:
+                        metric_confs.setdefault(
+                            name, MetricSpec(name, configuration)
+                        )
+
+                    else:
+                        metric_confs.append({name: configuration})
 
                 except KeyError as e:
                     self.logger.warning(
@@ -77,7 +97,7 @@ class Poem:
         return metric_confs
 
     def get_default_ports(self):
-        response = requests.get(
+        response = self._get(
             f"{self.url}/api/v2/default_ports",
             headers={"x-api-key": self.token}
         )
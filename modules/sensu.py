@@ -1,25 +1,237 @@
+import asyncio
+import concurrent.futures
 import datetime
+import functools
 import json
 import logging
 import subprocess
+import threading
+import time
 
-import requests
 from argo_scg.exceptions import SensuException, SCGException, SCGWarnException
 from argo_scg.generator import create_attribute_env, create_label, \
-    is_attribute_secret
+    is_attribute_secret, generate_adhoc_check, HASH_ANNOTATION
+from argo_scg.session import get_session
+
+APPLY_BATCH_SIZE = 50
+
+# longer lists of values are not put in selectors, so that the URLs of the
+# requests stay short
+SELECTOR_MAX_VALUES = 100
+
+
+def _merge_patch(item, data):
+    merged = dict(item)
+    for key, value in data.items():
+        if value is None:
+            merged.pop(key, None)
+
+        elif isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_patch(merged[key], value)
+
+        else:
+            merged[key] = value
+
+    return merged
+
+
+class _Snapshot:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = dict()
+
+    @staticmethod
+    def _get_key(kind, item):
+        if kind == "events":
+            return item["entity"]["metadata"]["name"], \
+                item["check"]["metadata"]["name"]
+
+        else:
+            return item["metadata"]["name"]
+
+    def get(self, namespace, kind):
+        with self._lock:
+            try:
+                return list(self._data[(namespace, kind)].values())
+
+            except KeyError:
+                return None
+
+    def load(self, namespace, kind, items):
+        with self._lock:
+            self._data[(namespace, kind)] = dict(
+                (self._get_key(kind, item), item) for item in items
+            )
+
+    # KeyError is raised if the collection is not loaded, None is returned
+    # if the object is not in it
+    def get_item(self, namespace, kind, key):
+        with self._lock:
+            return self._data[(namespace, kind)].get(key)
+
+    # writes are only recorded for collections that have been loaded, a
+    # partially known collection must never be served as the complete one
+    def put(self, namespace, kind, item):
+        with self._lock:
+            if (namespace, kind) in self._data:
+                self._data[(namespace, kind)][self._get_key(kind, item)] = item
+
+    def patch(self, namespace, kind, key, data):
+        with self._lock:
+            items = self._data.get((namespace, kind), dict())
+            if key in items:
+                items[key] = _merge_patch(items[key], data)
+
+    def remove(self, namespace, kind, key):
+        with self._lock:
+            self._data.get((namespace, kind), dict()).pop(key, None)
+
+    def invalidate(self, namespace=None):
+        with self._lock:
+            for key in list(self._data.keys()):
+                if namespace is None or key[0] == namespace:
+                    del self._data[key]
 
 
 class Sensu:
-    def __init__(self, url, token, namespaces):
+    def __init__(
+            self, url, token, namespaces, session=None, concurrency=1,
+            page_size=None
+    ):
         self.url = url
         self.token = token
+        self.session = session if session else get_session()
+        self.concurrency = concurrency
+        self.page_size = page_size
+        self._snapshot = _Snapshot()
         self.non_poem_checks = ["sensu.cpu.usage", "sensu.memory.usage"]
         self.namespaces = namespaces
         self.logger = logging.getLogger("argo-scg.sensu")
 
+    def invalidate_snapshot(self, namespace=None):
+        self._snapshot.invalidate(namespace=namespace)
+
+    def _apply(self, operations):
+        if self.concurrency <= 1 or len(operations) <= 1:
+            for operation in operations:
+                operation()
+
+        else:
+            asyncio.run(self._apply_async(operations))
+
+    def _apply_in_batches(self, operations):
+        # operations may be created lazily, while the configuration is being
+        # generated, so only a batch of them is kept in memory at a time
+        batch = list()
+        for operation in operations:
+            batch.append(operation)
+            if len(batch) >= APPLY_BATCH_SIZE * self.concurrency:
+                self._apply(batch)
+                batch = list()
+
+        self._apply(batch)
+
+    async def _apply_async(self, operations):
+        # requests is blocking, so the operations are run in the threads of
+        # the executor, while the semaphore limits the requests in flight
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(operation):
+            async with semaphore:
+                await loop.run_in_executor(executor, operation)
+
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.concurrency
+        ) as executor:
+            await asyncio.gather(*[run(operation) for operation in operations])
+
+    @staticmethod
+    def _get_error_message(response, msg=""):
+        msg = f"{msg}{response.status_code} {response.reason}"
+
+        try:
+            msg = f"{msg}: {response.json()['message']}"
+
+        except (ValueError, KeyError, TypeError):
+            pass
+
+        return msg
+
+    def _get_pages(self, url, headers, params=None):
+        # collections are fetched page by page if the page size is set; the
+        # token for the next page is given in Sensu-Continue header
+        params = dict(params) if params else dict()
+        if self.page_size:
+            params.update({"limit": self.page_size})
+
+        while True:
+            if params:
+                response = self.session.get(
+                    url, headers=headers, params=params
+                )
+
+            else:
+                response = self.session.get(url, headers=headers)
+
+            yield response
+
+            if not self.page_size or not response.ok or \
+                    not response.headers.get("Sensu-Continue"):
+                break
+
+            params = dict(params)
+            params.update({"continue": response.headers["Sensu-Continue"]})
+
+    @staticmethod
+    def _get_in_selector(field, values):
+        return f"{field} in [{','.join(sorted(values))}]"
+
+    def _iter_collection(
+            self, namespace, kind, headers, error, field_selector=None,
+            label_selector=None, predicate=None
+    ):
+        # selectors only reduce the number of objects sent by Sensu, objects
+        # are always filtered with the predicate, which is also used for the
+        # collection already in the snapshot
+        items = self._snapshot.get(namespace, kind)
+        if items is not None:
+            yield from [
+                item for item in items if predicate is None or predicate(item)
+            ]
+            return
+
+        params = dict()
+        if field_selector:
+            params.update({"fieldSelector": field_selector})
+
+        if label_selector:
+            params.update({"labelSelector": label_selector})
+
+        # the collection is stored in the snapshot only if it has been
+        # fetched completely
+        items = list()
+        for response in self._get_pages(
+                f"{self.url}/api/core/v2/namespaces/{namespace}/{kind}",
+                headers=headers, params=params
+        ):
+            if not response.ok:
+                error(response)
+
+            page = response.json() or list()
+            if not params:
+                items.extend(page)
+
+            for item in page:
+                if predicate is None or predicate(item):
+                    yield item
+
+        if not params:
+            self._snapshot.load(namespace, kind, items)
+
     def _get_namespaces(self):
         exceptions = ["sensu-system"]
-        response = requests.get(
+        response = self.session.get(
             f"{self.url}/api/core/v2/namespaces",
             headers={
                 "Authorization": f"Key {self.token}",
@@ -52,7 +264,7 @@ class Sensu:
 
         for namespace, tenants in self.namespaces.items():
             if namespace not in existing_namespaces:
-                response = requests.put(
+                response = self.session.put(
                     f"{self.url}/api/core/v2/namespaces/{namespace}",
                     headers={
                         "Authorization": f"Key {self.token}",
@@ -88,7 +300,7 @@ class Sensu:
                     f"--namespace {namespace} | sensuctl delete", shell=True
                 )
                 self.logger.info(f"Namespace {namespace} emptied")
-                response = requests.delete(
+                response = self.session.delete(
                     f"{self.url}/api/core/v2/namespaces/{namespace}",
                     headers={"Authorization": f"Key {self.token}"}
                 )
@@ -111,95 +323,141 @@ class Sensu:
                     f"Error cleaning namespace {namespace}: {err.output}"
                 )
 
-    def _get_checks(self, namespace):
-        response = requests.get(
-            f"{self.url}/api/core/v2/namespaces/{namespace}/checks",
+    def _get_object(self, namespace, kind, key, path, error, cached=True):
+        # single objects are looked up in the snapshot if the whole collection
+        # is already there, and fetched directly otherwise
+        if cached:
+            try:
+                return self._snapshot.get_item(namespace, kind, key)
+
+            except KeyError:
+                pass
+
+        response = self.session.get(
+            f"{self.url}/api/core/v2/namespaces/{namespace}/{path}",
             headers={
                 "Authorization": f"Key {self.token}",
                 "Content-Type": "application/json"
             }
         )
 
-        if not response.ok:
-            msg = f"{namespace}: Checks fetch error: " \
-                  f"{response.status_code} {response.reason}"
+        if response.status_code == 404:
+            return None
 
-            try:
-                msg = f"{msg}: {response.json()['message']}"
+        if not response.ok:
+            error(response)
 
-            except (ValueError, KeyError, TypeError):
-                pass
+        return response.json()
 
+    def _iter_checks(self, namespace):
+        def error(response):
+            msg = self._get_error_message(
+                response, f"{namespace}: Checks fetch error: "
+            )
             self.logger.error(msg)
             raise SensuException(msg)
 
-        else:
-            return response.json()
-
-    def _get_events(self, namespace):
-        response = requests.get(
-            f"{self.url}/api/core/v2/namespaces/{namespace}/events",
-            headers={
+        return self._iter_collection(
+            namespace=namespace, kind="checks", headers={
                 "Authorization": f"Key {self.token}",
                 "Content-Type": "application/json"
-            }
+            }, error=error
         )
-        return response
 
-    def _get_event(self, entity, check, namespace):
-        response = self._get_events(namespace=namespace)
-
-        if not response.ok:
-            msg = f"{namespace}: Events fetch error: " \
-                  f"{response.status_code} {response.reason}"
+    def _get_checks(self, namespace):
+        return list(self._iter_checks(namespace=namespace))
+
+    def _iter_events(self, namespace, checks=None):
+        def error(response):
+            raise SensuException(self._get_error_message(
+                response, f"{namespace}: Events fetch error: "
+            ))
+
+        field_selector = None
+        predicate = None
+        if checks is not None:
+            if len(checks) <= SELECTOR_MAX_VALUES:
+                field_selector = self._get_in_selector(
+                    "event.check.name", checks
+                )
 
-            try:
-                msg = f"{msg}: {response.json()['message']}"
+            def predicate(event):
+                return event["check"]["metadata"]["name"] in checks
 
-            except (ValueError, KeyError, TypeError):
-                pass
+        return self._iter_collection(
+            namespace=namespace, kind="events", headers={
+                "Authorization": f"Key {self.token}",
+                "Content-Type": "application/json"
+            }, error=error, field_selector=field_selector,
+            predicate=predicate
+        )
 
-            raise SensuException(msg)
+    # events are never served from the snapshot, since their lookups are used
+    # to poll for new results
+    def _get_event(self, entity, check, namespace):
+        def error(response):
+            raise SensuException(self._get_error_message(
+                response, f"{namespace}: Events fetch error: "
+            ))
+
+        event = self._get_object(
+            namespace=namespace, kind="events", key=(entity, check),
+            path=f"events/{entity}/{check}", error=error, cached=False
+        )
 
-        else:
-            try:
-                return [
-                    event for event in response.json() if
-                    event["entity"]["metadata"]["name"] == entity and
-                    event["check"]["metadata"]["name"] == check
-                ][0]
+        if not event:
+            raise SensuException(
+                f"{namespace}: No event for entity {entity} and check {check}"
+            )
 
-            except IndexError:
-                raise SensuException(
-                    f"{namespace}: No event for entity {entity} and check "
-                    f"{check}"
-                )
+        return event
 
     def get_event_output(self, entity, check, namespace="default"):
         event = self._get_event(entity=entity, check=check, namespace=namespace)
         return event["check"]["output"]
 
-    def _fetch_events(self, namespace):
-        response = self._get_events(namespace=namespace)
+    def wait_for_event(
+            self, entity, check, issued, timeout, namespace="default",
+            interval=0.5, max_interval=8
+    ):
+        # the event is polled with exponentially growing intervals until it
+        # holds the result of the execution issued at the given time
+        start = time.monotonic()
+        delay = interval
+        while True:
+            try:
+                event = self._get_event(
+                    entity=entity, check=check, namespace=namespace
+                )
+                if max(
+                        event["check"].get("issued") or 0,
+                        event["check"].get("executed") or 0
+                ) >= issued:
+                    return event, time.monotonic() - start
 
-        if not response.ok:
-            msg = f"{namespace}: Events fetch error: " \
-                  f"{response.status_code} {response.reason}"
+            except SensuException as e:
+                self.logger.debug(e.msg)
 
-            try:
-                msg = f"{msg}: {response.json()['message']}"
+            remaining = timeout - (time.monotonic() - start)
+            if remaining <= 0:
+                raise SensuException(
+                    f"{namespace}: No result for entity {entity} and check "
+                    f"{check} in {timeout} s"
+                )
 
-            except (ValueError, KeyError, TypeError):
-                pass
+            time.sleep(min(delay, remaining))
+            delay = min(2 * delay, max_interval)
 
-            self.logger.warning(msg)
-            raise SensuException(msg)
+    def _fetch_events(self, namespace, checks=None):
+        try:
+            return list(self._iter_events(namespace=namespace, checks=checks))
 
-        else:
-            return response.json()
+        except SensuException as e:
+            self.logger.warning(e.msg)
+            raise
 
-    def _delete_check(self, check, namespace):
-        response = requests.delete(
+    def _delete_check(self, check, namespace, silenced=True):
+        response = self.session.delete(
             f"{self.url}/api/core/v2/namespaces/{namespace}/checks/{check}",
             headers={"Authorization": f"Key {self.token}"}
         )
@@ -217,7 +475,9 @@ class Sensu:
             raise SCGException(msg)
 
         else:
-            self._delete_silenced_entry(check=check, namespace=namespace)
+            self._snapshot.remove(namespace, "checks", check)
+            if silenced:
+                self._delete_silenced_entry(check=check, namespace=namespace)
 
     def delete_check(self, check, namespace="default"):
         try:
@@ -229,24 +489,43 @@ class Sensu:
         except SCGException as e:
             raise SensuException(str(e))
 
+    def _remove_check(self, check, removed, namespace):
+        try:
+            self._delete_check(check=check, namespace=namespace, silenced=False)
+
+        except SCGException as e:
+            self.logger.warning(str(e))
+
+        else:
+            removed.add(check)
+            self.logger.info(f"{namespace}: Check {check} removed")
+
     def _delete_checks(self, checks, namespace):
-        for check in checks:
-            try:
-                self._delete_check(check=check, namespace=namespace)
+        # names of the checks which were actually removed are returned
+        removed = set()
+        self._apply([
+            functools.partial(
+                self._remove_check, check=check, removed=removed,
+                namespace=namespace
+            ) for check in checks
+        ])
+
+        try:
+            self._delete_silenced_entries(
+                checks=[check for check in checks if check in removed],
+                namespace=namespace
+            )
 
-            except SCGWarnException as e:
-                self.logger.info(f"{namespace}: Check {check} removed")
-                self.logger.warning(f"{namespace}: {str(e)}")
+        except SCGWarnException as e:
+            self.logger.warning(f"{namespace}: {str(e)}")
 
-            except SCGException as e:
-                self.logger.warning(str(e))
-                continue
+        except SensuException as e:
+            self.logger.warning(str(e))
 
-            else:
-                self.logger.info(f"{namespace}: Check {check} removed")
+        return removed
 
-    def _delete_event(self, entity, check, namespace):
-        response = requests.delete(
+    def _delete_event(self, entity, check, namespace, silenced=True):
+        response = self.session.delete(
             f"{self.url}/api/core/v2/namespaces/{namespace}/events/"
             f"{entity}/{check}",
             headers={
@@ -267,9 +546,11 @@ class Sensu:
             raise SCGException(msg)
 
         else:
-            self._delete_silenced_entry(
-                entity=entity, check=check, namespace=namespace
-            )
+            self._snapshot.remove(namespace, "events", (entity, check))
+            if silenced:
+                self._delete_silenced_entry(
+                    entity=entity, check=check, namespace=namespace
+                )
 
     def delete_event(self, entity, check, namespace="default"):
         try:
@@ -281,28 +562,57 @@ class Sensu:
         except SCGException as e:
             raise SensuException(str(e))
 
+    def _remove_event(self, entity, check, removed, namespace):
+        try:
+            self._delete_event(
+                entity=entity, check=check, namespace=namespace,
+                silenced=False
+            )
+
+        except SCGException as e:
+            self.logger.warning(str(e))
+
+        else:
+            removed.add((entity, check))
+            self.logger.info(f"{namespace}: Event {entity}/{check} removed")
+
     def _delete_events(self, events, namespace):
-        for entity, checks in events.items():
-            for check in checks:
-                try:
-                    self._delete_event(
-                        entity=entity, check=check, namespace=namespace
-                    )
+        removed = set()
+        self._apply([
+            functools.partial(
+                self._remove_event, entity=entity, check=check,
+                removed=removed, namespace=namespace
+            ) for entity, checks in events.items() for check in checks
+        ])
 
-                except SCGWarnException as e:
-                    self.logger.info(
-                        f"{namespace}: Event {entity}/{check} removed"
-                    )
-                    self.logger.warning(f"{namespace}: {str(e)}")
+        try:
+            self._delete_silenced_entries(
+                events=[
+                    (entity, check) for entity, checks in events.items()
+                    for check in checks if (entity, check) in removed
+                ],
+                namespace=namespace
+            )
+
+        except SCGWarnException as e:
+            self.logger.warning(f"{namespace}: {str(e)}")
 
+        except SensuException as e:
+            self.logger.warning(str(e))
 
-                except SCGException as e:
-                    self.logger.warning(str(e))
+    @staticmethod
+    def _get_hash(item):
+        annotations = item["metadata"].get("annotations") or dict()
+        return annotations.get(HASH_ANNOTATION)
 
-                else:
-                    self.logger.info(
-                        f"{namespace}: Event {entity}/{check} removed"
-                    )
+    def _is_synced(self, item, existing_item, compare):
+        # objects stamped with the hash of their desired state are compared
+        # only by it, the others field by field
+        digest = self._get_hash(item)
+        if digest is not None:
+            return digest == self._get_hash(existing_item)
+
+        return compare(item, existing_item)
 
     @staticmethod
     def _compare_checks(check1, check2):
@@ -383,32 +693,42 @@ class Sensu:
 
         return equal
 
-    def _get_entities(self, namespace):
-        response = requests.get(
-            f"{self.url}/api/core/v2/namespaces/{namespace}/entities",
-            headers={
+    def _iter_entities(self, namespace, entity_class=None, service_type=None):
+        def error(response):
+            raise SensuException(self._get_error_message(response))
+
+        # entities are listed by class several times while a namespace is
+        # synced, so the whole collection is fetched once into the snapshot
+        # and filtered here instead of being narrowed down by Sensu
+        label_selector = None
+        predicate = None
+        if entity_class:
+            def predicate(entity):
+                return entity["entity_class"] == entity_class
+
+        elif service_type:
+            label_selector = f"service == {service_type}"
+
+            def predicate(entity):
+                return entity["metadata"].get("labels", dict()).get(
+                    "service"
+                ) == service_type
+
+        return self._iter_collection(
+            namespace=namespace, kind="entities", headers={
                 "Authorization": "Key {}".format(self.token),
                 "Content-Type": "application/json"
-            }
+            }, error=error, label_selector=label_selector, predicate=predicate
         )
 
-        if not response.ok:
-            msg = f"{response.status_code} {response.reason}"
-
-            try:
-                msg = f"{msg}: {response.json()['message']}"
-
-            except (ValueError, KeyError, TypeError):
-                pass
-
-            raise SensuException(msg)
-
-        else:
-            return response.json()
+    def _get_entities(self, namespace):
+        return list(self._iter_entities(namespace=namespace))
 
     def _get_proxy_entities(self, namespace):
         try:
-            data = self._get_entities(namespace=namespace)
+            return list(
+                self._iter_entities(namespace=namespace, entity_class="proxy")
+            )
 
         except SensuException as e:
             msg = f"{namespace}: Error fetching proxy entities: " \
@@ -416,13 +736,11 @@ class Sensu:
             self.logger.error(msg)
             raise SensuException(msg)
 
-        return [
-            entity for entity in data if entity["entity_class"] == "proxy"
-        ]
-
     def _get_agents(self, namespace):
         try:
-            data = self._get_entities(namespace=namespace)
+            return list(
+                self._iter_entities(namespace=namespace, entity_class="agent")
+            )
 
         except SensuException as e:
             msg = f"{namespace}: Error fetching agents: " \
@@ -430,69 +748,91 @@ class Sensu:
             self.logger.error(msg)
             raise SensuException(msg)
 
-        return [
-            entity for entity in data if entity["entity_class"] == "agent"
-        ]
-
     def get_agents(self, namespace="default"):
         try:
-            data = self._get_entities(namespace=namespace)
+            return list(
+                self._iter_entities(namespace=namespace, entity_class="agent")
+            )
 
         except SensuException as e:
             msg = f"{namespace}: Error fetching agents: " \
                   f"{str(e).strip('Sensu error: ')}"
             raise SensuException(msg)
 
-        return [
-            entity for entity in data if entity["entity_class"] == "agent"
-        ]
+    def _get_entity(self, entity, namespace):
+        def error(response):
+            raise SensuException(self._get_error_message(
+                response, f"{namespace}: Entities fetch error: "
+            ))
 
-    def is_entity_agent(self, entity, namespace="default"):
-        try:
-            entity_configuration = [
-                e for e in self._get_entities(namespace=namespace)
-                if e["metadata"]["name"] == entity
-            ][0]
+        entity_configuration = self._get_object(
+            namespace=namespace, kind="entities", key=entity,
+            path=f"entities/{entity}", error=error
+        )
 
-        except IndexError:
+        if not entity_configuration:
             raise SensuException(f"No entity {entity} in namespace {namespace}")
 
+        return entity_configuration
+
+    def is_entity_agent(self, entity, namespace="default"):
+        entity_configuration = self._get_entity(
+            entity=entity, namespace=namespace
+        )
+
         if entity_configuration["entity_class"] == "agent":
             return True
 
         else:
             return False
 
-    def _delete_entities(self, entities, namespace):
-        for entity in entities:
-            response = requests.delete(
-                f"{self.url}/api/core/v2/namespaces/{namespace}"
-                f"/entities/{entity}",
-                headers={"Authorization": f"Key {self.token}"}
-            )
+    def _remove_entity(self, entity, removed, namespace):
+        response = self.session.delete(
+            f"{self.url}/api/core/v2/namespaces/{namespace}"
+            f"/entities/{entity}",
+            headers={"Authorization": f"Key {self.token}"}
+        )
 
-            if not response.ok:
-                msg = f"{namespace}: Entity {entity} not removed: " \
-                      f"{response.status_code} {response.reason}"
+        if not response.ok:
+            msg = f"{namespace}: Entity {entity} not removed: " \
+                  f"{response.status_code} {response.reason}"
 
-                try:
-                    msg = f"{msg}: {response.json()['message']}"
+            try:
+                msg = f"{msg}: {response.json()['message']}"
 
-                except (ValueError, TypeError, KeyError):
-                    pass
+            except (ValueError, TypeError, KeyError):
+                pass
 
-                self.logger.warning(msg)
+            self.logger.warning(msg)
 
-            else:
-                try:
-                    self._delete_silenced_entry(
-                        entity=entity, namespace=namespace
-                    )
+        else:
+            self._snapshot.remove(namespace, "entities", entity)
+            removed.add(entity)
+            self.logger.info(f"{namespace}: Entity {entity} removed")
+
+    def _delete_entities(self, entities, namespace):
+        # names of the entities which were actually removed are returned
+        removed = set()
+        self._apply([
+            functools.partial(
+                self._remove_entity, entity=entity, removed=removed,
+                namespace=namespace
+            ) for entity in entities
+        ])
+
+        try:
+            self._delete_silenced_entries(
+                entities=[entity for entity in entities if entity in removed],
+                namespace=namespace
+            )
+
+        except SCGWarnException as e:
+            self.logger.warning(f"{namespace}: {str(e)}")
 
-                except SCGWarnException as e:
-                    self.logger.warning(f"{namespace}: {str(e)}")
+        except SensuException as e:
+            self.logger.warning(str(e))
 
-                self.logger.info(f"{namespace}: Entity {entity} removed")
+        return removed
 
     @staticmethod
     def _compare_entities(entity1, entity2):
@@ -522,7 +862,7 @@ class Sensu:
         return equal
 
     def _put_check(self, check, namespace):
-        response = requests.put(
+        response = self.session.put(
             f"{self.url}/api/core/v2/namespaces/{namespace}/checks/"
             f"{check['metadata']['name']}",
             headers={
@@ -532,6 +872,9 @@ class Sensu:
             data=json.dumps(check)
         )
 
+        if response.ok:
+            self._snapshot.put(namespace, "checks", check)
+
         return response
 
     def put_check(self, check, namespace="default"):
@@ -549,48 +892,105 @@ class Sensu:
 
             raise SensuException(msg)
 
-    def handle_checks(self, checks, namespace="default"):
-        existing_checks = self._get_checks(namespace=namespace)
+    def execute_check(self, check, namespace="default"):
+        response = self.session.post(
+            f"{self.url}/api/core/v2/namespaces/{namespace}/checks/{check}/"
+            f"execute",
+            headers={
+                "Authorization": f"Key {self.token}",
+                "Content-Type": "application/json"
+            },
+            data=json.dumps({"check": check})
+        )
 
-        for check in checks:
-            existing_check = [
-                ec for ec in existing_checks if
-                ec["metadata"]["name"] == check["metadata"]["name"]
-            ]
+        if not response.ok:
+            msg = f"{namespace}: Check {check} not executed: " \
+                  f"{response.status_code} {response.reason}"
+            try:
+                msg = f"{msg}: {response.json()['message']}"
 
-            if len(existing_check) == 0:
-                word = "created"
+            except (ValueError, TypeError, KeyError):
+                pass
 
-            else:
-                word = "updated"
+            raise SensuException(msg)
 
-            if len(existing_check) == 0 or \
-                    not self._compare_checks(check, existing_check[0]):
-                response = self._put_check(check=check, namespace=namespace)
+        # time at which Sensu issued the execution request, local time is
+        # used if it is not in the response
+        try:
+            return int(response.json()["issued"])
 
-                if not response.ok:
-                    msg = f"{namespace}: " \
-                          f"Check {check['metadata']['name']} not {word}: " \
-                          f"{response.status_code} {response.reason}"
-                    try:
-                        msg = f"{msg}: {response.json()['message']}"
+        except (ValueError, TypeError, KeyError):
+            return int(time.time())
 
-                    except (ValueError, TypeError, KeyError):
-                        pass
+    def _sync_check(self, check, word, synced, namespace):
+        response = self._put_check(check=check, namespace=namespace)
 
-                    self.logger.warning(msg)
+        if not response.ok:
+            msg = f"{namespace}: " \
+                  f"Check {check['metadata']['name']} not {word}: " \
+                  f"{response.status_code} {response.reason}"
+            try:
+                msg = f"{msg}: {response.json()['message']}"
+
+            except (ValueError, TypeError, KeyError):
+                pass
+
+            self.logger.warning(msg)
+
+        else:
+            synced.add((check["metadata"]["name"], word))
+            self.logger.info(
+                f"{namespace}: Check {check['metadata']['name']} {word}"
+            )
+
+    def _log_summary(self, kind, counts, start, namespace):
+        self.logger.debug(
+            f"{namespace}: {kind}: " + ", ".join([
+                f"{count} {word}" for word, count in counts.items()
+            ]) + f" in {time.monotonic() - start:.2f} s"
+        )
+
+    def handle_checks(self, checks, namespace="default"):
+        start = time.monotonic()
+        existing_checks = dict(
+            (check["metadata"]["name"], check) for check in
+            self._get_checks(namespace=namespace)
+        )
+        checks_names = set()
+        synced = set()
+        counts = {"created": 0, "updated": 0, "unchanged": 0, "deleted": 0}
+
+        def get_operations():
+            for check in checks:
+                name = check["metadata"]["name"]
+                checks_names.add(name)
+                existing_check = existing_checks.get(name)
+
+                if existing_check is None:
+                    word = "created"
+
+                elif self._is_synced(
+                        check, existing_check, self._compare_checks
+                ):
+                    counts["unchanged"] += 1
+                    continue
 
                 else:
-                    self.logger.info(
-                        f"{namespace}: Check {check['metadata']['name']} {word}"
-                    )
+                    word = "updated"
+
+                yield functools.partial(
+                    self._sync_check, check=check, word=word, synced=synced,
+                    namespace=namespace
+                )
+
+        self._apply_in_batches(get_operations())
+        for _, word in synced:
+            counts[word] += 1
 
         updated_existing_checks = self._get_checks(namespace=namespace)
         checks_tobedeleted = sorted(list(set(
             [check["metadata"]["name"] for check in updated_existing_checks]
-        ).difference(set(
-            [check["metadata"]["name"] for check in checks]
-        ))))
+        ).difference(checks_names)))
 
         checks_tobedeleted = [
             item for item in checks_tobedeleted if
@@ -598,15 +998,19 @@ class Sensu:
         ]
 
         if len(checks_tobedeleted) > 0:
-            self._delete_checks(checks=checks_tobedeleted, namespace=namespace)
+            counts["deleted"] = len(self._delete_checks(
+                checks=checks_tobedeleted, namespace=namespace
+            ))
 
-            after_delete_checks = [
+            after_delete_checks = set(
                 check["metadata"]["name"] for check in self._get_checks(
                     namespace=namespace
                 )
-            ]
+            )
             try:
-                existing_events = self._fetch_events(namespace=namespace)
+                existing_events = self._fetch_events(
+                    namespace=namespace, checks=set(checks_tobedeleted)
+                )
                 events_tobedeleted = dict()
                 for event in existing_events:
                     check = event["check"]["metadata"]["name"]
@@ -627,61 +1031,91 @@ class Sensu:
             except SensuException:
                 pass
 
-    def handle_proxy_entities(self, entities, namespace="default"):
-        existing_entities = self._get_proxy_entities(namespace=namespace)
-        for entity in entities:
-            existing_entity = [
-                ent for ent in existing_entities if
-                ent["metadata"]["name"] == entity["metadata"]["name"]
-            ]
+        self._log_summary(
+            kind="Checks", counts=counts, start=start, namespace=namespace
+        )
 
-            if len(existing_entity) == 0:
-                word = "created"
+    def _sync_proxy_entity(self, entity, word, synced, namespace):
+        response = self.session.put(
+            f"{self.url}/api/core/v2/namespaces/{namespace}/entities/"
+            f"{entity['metadata']['name']}",
+            data=json.dumps(entity),
+            headers={
+                "Authorization": f"Key {self.token}",
+                "Content-Type": "application/json"
+            }
+        )
 
-            else:
-                word = "updated"
-
-            if len(existing_entity) == 0 or \
-                    not self._compare_entities(entity, existing_entity[0]):
-                response = requests.put(
-                    f"{self.url}/api/core/v2/namespaces/{namespace}/entities/"
-                    f"{entity['metadata']['name']}",
-                    data=json.dumps(entity),
-                    headers={
-                        "Authorization": f"Key {self.token}",
-                        "Content-Type": "application/json"
-                    }
-                )
+        if not response.ok:
+            msg = f"{namespace}: Proxy entity " \
+                  f"{entity['metadata']['name']} not {word}: " \
+                  f"{response.status_code} {response.reason}"
 
-                if not response.ok:
-                    msg = f"{namespace}: Proxy entity " \
-                          f"{entity['metadata']['name']} not {word}: " \
-                          f"{response.status_code} {response.reason}"
+            try:
+                msg = f"{msg}: {response.json()['message']}"
 
-                    try:
-                        msg = f"{msg}: {response.json()['message']}"
+            except (ValueError, TypeError, KeyError):
+                pass
 
-                    except (ValueError, TypeError, KeyError):
-                        pass
+            self.logger.warning(msg)
 
-                    self.logger.warning(msg)
+        else:
+            self._snapshot.put(namespace, "entities", entity)
+            synced.add((entity["metadata"]["name"], word))
+            self.logger.info(
+                f"{namespace}: Entity {entity['metadata']['name']} {word}"
+            )
+
+    def handle_proxy_entities(self, entities, namespace="default"):
+        start = time.monotonic()
+        existing_entities = dict(
+            (entity["metadata"]["name"], entity) for entity in
+            self._get_proxy_entities(namespace=namespace)
+        )
+        entities_names = set()
+        synced = set()
+        counts = {"created": 0, "updated": 0, "unchanged": 0, "deleted": 0}
+
+        def get_operations():
+            for entity in entities:
+                name = entity["metadata"]["name"]
+                entities_names.add(name)
+                existing_entity = existing_entities.get(name)
+
+                if existing_entity is None:
+                    word = "created"
+
+                elif self._is_synced(
+                        entity, existing_entity, self._compare_entities
+                ):
+                    counts["unchanged"] += 1
+                    continue
 
                 else:
-                    self.logger.info(
-                        f"{namespace}: Entity {entity['metadata']['name']} "
-                        f"{word}"
-                    )
+                    word = "updated"
+
+                yield functools.partial(
+                    self._sync_proxy_entity, entity=entity, word=word,
+                    synced=synced, namespace=namespace
+                )
+
+        self._apply_in_batches(get_operations())
+        for _, word in synced:
+            counts[word] += 1
 
-        entities_tobedeleted = list(set(
-            [entity["metadata"]["name"] for entity in existing_entities]
-        ).difference(set(
-            [entity["metadata"]["name"] for entity in entities]
-        )))
+        entities_tobedeleted = list(
+            set(existing_entities.keys()).difference(entities_names)
+        )
 
         if len(entities_tobedeleted):
-            self._delete_entities(
+            counts["deleted"] = len(self._delete_entities(
                 entities=entities_tobedeleted, namespace=namespace
-            )
+            ))
+
+        self._log_summary(
+            kind="Proxy entities", counts=counts, start=start,
+            namespace=namespace
+        )
 
     def handle_agents(
             self,
@@ -740,7 +1174,7 @@ class Sensu:
                     })
 
                 if send_data:
-                    response = requests.patch(
+                    response = self.session.patch(
                         f"{self.url}/api/core/v2/namespaces/"
                         f"{namespace}/entities/{agent['metadata']['name']}",
                         data=json.dumps(send_data),
@@ -763,6 +1197,10 @@ class Sensu:
                         self.logger.error(msg)
 
                     else:
+                        self._snapshot.patch(
+                            namespace, "entities", agent["metadata"]["name"],
+                            send_data
+                        )
                         if "subscriptions" in send_data:
                             self.logger.info(
                                 f"{namespace}: {agent['metadata']['name']} "
@@ -779,7 +1217,11 @@ class Sensu:
             self.logger.warning(f"{namespace}: Agents not handled...")
 
     def _get_handlers(self, namespace):
-        response = requests.get(
+        handlers = self._snapshot.get(namespace, "handlers")
+        if handlers is not None:
+            return handlers
+
+        response = self.session.get(
             f"{self.url}/api/core/v2/namespaces/{namespace}/handlers",
             headers={
                 "Authorization": f"Key {self.token}",
@@ -801,7 +1243,9 @@ class Sensu:
             raise SensuException(msg)
 
         else:
-            return response.json()
+            handlers = response.json()
+            self._snapshot.load(namespace, "handlers", handlers)
+            return handlers
 
     def _handle_handler(self, name, data, namespace="default"):
         existing_handler = [
@@ -811,7 +1255,7 @@ class Sensu:
 
         print_name = name if name.endswith("handler") else f"{name}-handler"
         if len(existing_handler) == 0:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.url}/api/core/v2/namespaces/{namespace}/handlers",
                 headers={
                     "Authorization": f"Key {self.token}",
@@ -834,11 +1278,12 @@ class Sensu:
                 raise SensuException(msg)
 
             else:
+                self._snapshot.put(namespace, "handlers", data)
                 self.logger.info(f"{namespace}: {print_name} created")
 
         else:
             if existing_handler[0]["command"] != data["command"]:
-                response = requests.patch(
+                response = self.session.patch(
                     f"{self.url}/api/core/v2/namespaces/{namespace}/handlers/"
                     f"{name}",
                     headers={
@@ -861,6 +1306,10 @@ class Sensu:
                     self.logger.warning(msg)
 
                 else:
+                    self._snapshot.patch(
+                        namespace, "handlers", name,
+                        {"command": data["command"]}
+                    )
                     self.logger.info(f"{namespace}: {print_name} updated")
 
     def handle_publisher_handler(self, namespace="default"):
@@ -895,7 +1344,11 @@ class Sensu:
         )
 
     def _get_filters(self, namespace):
-        response = requests.get(
+        filters = self._snapshot.get(namespace, "filters")
+        if filters is not None:
+            return filters
+
+        response = self.session.get(
             f"{self.url}/api/core/v2/namespaces/{namespace}/filters",
             headers={
                 "Authorization": f"Key {self.token}"
@@ -916,30 +1369,34 @@ class Sensu:
             raise SensuException(msg)
 
         else:
-            return response.json()
+            filters = response.json()
+            self._snapshot.load(namespace, "filters", filters)
+            return filters
 
     def _add_filter(self, name, expressions, namespace="default"):
         filters = self._get_filters(namespace=namespace)
         filters_names = [f["metadata"]["name"] for f in filters]
 
+        data = {
+            "metadata": {
+                "name": name,
+                "namespace": namespace
+            },
+            "action": "allow",
+            "expressions": expressions
+        }
+
         response = None
         added = False
         if name not in filters_names:
             added = True
-            response = requests.post(
+            response = self.session.post(
                 f"{self.url}/api/core/v2/namespaces/{namespace}/filters",
                 headers={
                     "Authorization": f"Key {self.token}",
                     "Content-Type": "application/json"
                 },
-                data=json.dumps({
-                    "metadata": {
-                        "name": name,
-                        "namespace": namespace
-                    },
-                    "action": "allow",
-                    "expressions": expressions
-                })
+                data=json.dumps(data)
             )
 
         else:
@@ -947,7 +1404,7 @@ class Sensu:
                 f for f in filters if f["metadata"]["name"] == name
             ][0]
             if the_filter["expressions"] != expressions:
-                response = requests.patch(
+                response = self.session.patch(
                     f"{self.url}/api/core/v2/namespaces/{namespace}/"
                     f"filters/{name}",
                     headers={
@@ -984,9 +1441,15 @@ class Sensu:
             else:
                 if added:
                     operation = "created"
+                    self._snapshot.put(namespace, "filters", data)
 
                 else:
                     operation = "updated"
+                    self._snapshot.patch(
+                        namespace, "filters", name,
+                        {"expressions": expressions}
+                    )
+
                 self.logger.info(
                     f"{namespace}: {name} filter {operation}"
                 )
@@ -1018,7 +1481,11 @@ class Sensu:
         )
 
     def _get_pipelines(self, namespace):
-        response = requests.get(
+        pipelines = self._snapshot.get(namespace, "pipelines")
+        if pipelines is not None:
+            return pipelines
+
+        response = self.session.get(
             f"{self.url}/api/core/v2/namespaces/{namespace}/pipelines",
             headers={
                 "Authorization": f"Key {self.token}"
@@ -1039,29 +1506,33 @@ class Sensu:
             raise SensuException(msg)
 
         else:
-            return response.json()
+            pipelines = response.json()
+            self._snapshot.load(namespace, "pipelines", pipelines)
+            return pipelines
 
     def _add_pipeline(self, name, workflows, namespace="default"):
         pipelines = self._get_pipelines(namespace=namespace)
         pipelines_names = [p["metadata"]["name"] for p in pipelines]
 
+        data = {
+            "metadata": {
+                "name": name,
+                "namespace": namespace
+            },
+            "workflows": workflows
+        }
+
         response = None
         added = False
         if name not in pipelines_names:
             added = True
-            response = requests.post(
+            response = self.session.post(
                 f"{self.url}/api/core/v2/namespaces/{namespace}/pipelines",
                 headers={
                     "Authorization": f"Key {self.token}",
                     "Content-Type": "application/json"
                 },
-                data=json.dumps({
-                    "metadata": {
-                        "name": name,
-                        "namespace": namespace
-                    },
-                    "workflows": workflows
-                })
+                data=json.dumps(data)
             )
 
         else:
@@ -1069,7 +1540,7 @@ class Sensu:
                 p for p in pipelines if p["metadata"]["name"] == name
             ][0]
             if the_pipeline["workflows"] != workflows:
-                response = requests.patch(
+                response = self.session.patch(
                     f"{self.url}/api/core/v2/namespaces/{namespace}/pipelines/"
                     f"{name}",
                     headers={
@@ -1105,8 +1576,13 @@ class Sensu:
             else:
                 if added:
                     operation = "created"
+                    self._snapshot.put(namespace, "pipelines", data)
+
                 else:
                     operation = "updated"
+                    self._snapshot.patch(
+                        namespace, "pipelines", name, {"workflows": workflows}
+                    )
 
                 self.logger.info(f"{namespace}: {name} pipeline {operation}")
 
@@ -1209,7 +1685,7 @@ class Sensu:
         added = False
         if name not in checks_names:
             added = True
-            response = requests.post(
+            response = self.session.post(
                 f"{self.url}/api/core/v2/namespaces/{namespace}/checks",
                 data=json.dumps(data),
                 headers={
@@ -1231,7 +1707,7 @@ class Sensu:
                     or "annotations" not in check["metadata"] \
                     or check["metadata"]["annotations"] != \
                     data["metadata"]["annotations"]:
-                response = requests.put(
+                response = self.session.put(
                     f"{self.url}/api/core/v2/namespaces/{namespace}/checks/"
                     f"{name}",
                     data=json.dumps(data),
@@ -1248,6 +1724,7 @@ class Sensu:
                 operation = "updated"
 
             if response.ok:
+                self._snapshot.put(namespace, "checks", data)
                 self.logger.info(f"{namespace}: Check {name} {operation}")
 
             else:
@@ -1270,40 +1747,95 @@ class Sensu:
         self._add_asset_check(name="sensu.memory.usage", namespace=namespace)
 
     def _get_check(self, check, namespace):
-        try:
-            return [
-                c for c in self._get_checks(namespace=namespace)
-                if c["metadata"]["name"] == check
-            ][0]
-
-        except IndexError:
-            raise SensuException(f"No check {check} in namespace {namespace}")
+        def error(response):
+            msg = self._get_error_message(
+                response, f"{namespace}: Checks fetch error: "
+            )
+            self.logger.error(msg)
+            raise SensuException(msg)
 
-    def get_check_run(self, entity, check, namespace="default"):
-        check_configuration = self._get_check(check=check, namespace=namespace)
+        check_configuration = self._get_object(
+            namespace=namespace, kind="checks", key=check,
+            path=f"checks/{check}", error=error
+        )
 
-        try:
-            entity_configuration = [
-                e for e in self._get_entities(namespace=namespace) if
-                e["metadata"]["name"] == entity
-            ][0]
+        if not check_configuration:
+            raise SensuException(f"No check {check} in namespace {namespace}")
 
-        except IndexError:
-            raise SensuException(f"No entity {entity} in namespace {namespace}")
+        return check_configuration
 
-        is_check_run = \
+    @staticmethod
+    def _is_check_run(check_configuration, entity_configuration):
+        return \
             entity_configuration["entity_class"] == "agent" and \
             len(set(check_configuration["subscriptions"]).intersection(
                 set(entity_configuration["subscriptions"])
             )) > 0 and "proxy_requests" not in check_configuration or \
-            create_label(check) in entity_configuration["metadata"]["labels"]
+            create_label(check_configuration["metadata"]["name"]) in \
+            entity_configuration["metadata"]["labels"]
+
+    def get_check_run(self, entity, check, namespace="default"):
+        check_configuration = self._get_check(check=check, namespace=namespace)
+        entity_configuration = self._get_entity(
+            entity=entity, namespace=namespace
+        )
 
-        if not is_check_run:
+        if not self._is_check_run(check_configuration, entity_configuration):
             raise SensuException(
                 f"No event with entity {entity} and check {check} in "
                 f"namespace {namespace}"
             )
 
+        return self._render_check_run(
+            check_configuration=check_configuration,
+            entity_configuration=entity_configuration
+        )
+
+    def get_check_runs(
+            self, check, entities=None, service_type=None, namespace="default"
+    ):
+        # commands for multiple entities are rendered from a single fetch of
+        # the check; entities given by name are looked up one by one, and the
+        # ones which do not exist or do not run the check are reported as
+        # errors, while the ones of the given service type which do not run
+        # the check are skipped
+        check_configuration = self._get_check(check=check, namespace=namespace)
+        runs = dict()
+        errors = dict()
+        if service_type:
+            entity_configurations = self._iter_entities(
+                namespace=namespace, service_type=service_type
+            )
+
+        else:
+            entity_configurations = list()
+            for entity in entities:
+                try:
+                    entity_configurations.append(
+                        self._get_entity(entity=entity, namespace=namespace)
+                    )
+
+                except SensuException as e:
+                    errors.update({entity: e.msg})
+
+        for entity_configuration in entity_configurations:
+            entity = entity_configuration["metadata"]["name"]
+            if self._is_check_run(check_configuration, entity_configuration):
+                runs.update({entity: self._render_check_run(
+                    check_configuration=check_configuration,
+                    entity_configuration=entity_configuration
+                )})
+
+            elif not service_type:
+                errors.update({
+                    entity: f"No event with entity {entity} and check {check} "
+                            f"in namespace {namespace}"
+                })
+
+        return runs, errors
+
+    @staticmethod
+    def _render_check_run(check_configuration, entity_configuration):
         list_command = []
         tmp = ""
         for c in check_configuration["command"]:
@@ -1356,6 +1888,83 @@ class Sensu:
             "subscriptions"
         ]
 
+    def _run_adhoc_check(
+            self, name, entity, command, timeout, subscriptions, agent,
+            created, results, namespace
+    ):
+        try:
+            self.put_check(
+                check=generate_adhoc_check(
+                    command=command, subscriptions=subscriptions,
+                    namespace=namespace, name=name
+                ),
+                namespace=namespace
+            )
+            created.update({name: None})
+            issued = self.execute_check(check=name, namespace=namespace)
+            created.update({name: agent})
+            event, elapsed = self.wait_for_event(
+                entity=agent, check=name, issued=issued, timeout=timeout,
+                namespace=namespace
+            )
+            results.update({entity: (event["check"]["output"], elapsed)})
+
+        # any error is recorded for the entity, so that it does not affect
+        # the ad-hoc checks of the other entities
+        except Exception as e:
+            results.update({entity: (str(e), None)})
+
+    def run_adhoc_checks(
+            self, check, runs, namespace="default", prefix="adhoc-check"
+    ):
+        # each entity gets its own ad-hoc check, run at most concurrency at a
+        # time; agents run it themselves, proxy entities on the first agent,
+        # the ad-hoc checks and their events are removed once all are done
+        proxy_subscriptions = self.get_check_subscriptions(
+            check=check, namespace=namespace
+        )
+        agents = [
+            agent["metadata"]["name"] for agent in
+            self.get_agents(namespace=namespace)
+        ]
+        if not agents:
+            raise SensuException(f"{namespace}: No agents")
+
+        # ad-hoc checks which have been created, mapped to the agent running
+        # them once they are executed
+        created = dict()
+        results = dict()
+        operations = list()
+        for i, (entity, (command, timeout)) in enumerate(sorted(runs.items())):
+            if entity in agents:
+                agent = entity
+                subscriptions = [f"entity:{entity}"]
+
+            else:
+                agent = agents[0]
+                subscriptions = proxy_subscriptions
+
+            operations.append(functools.partial(
+                self._run_adhoc_check, name=f"{prefix}-{i}", entity=entity,
+                command=command, timeout=timeout, subscriptions=subscriptions,
+                agent=agent, created=created, results=results,
+                namespace=namespace
+            ))
+
+        try:
+            self._apply(operations)
+
+        finally:
+            events = dict()
+            for name, agent in created.items():
+                if agent:
+                    events.setdefault(agent, list()).append(name)
+
+            self._delete_events(events=events, namespace=namespace)
+            self._delete_checks(checks=list(created), namespace=namespace)
+
+        return results
+
     def create_silencing_entry(self, check, entity, namespace="default"):
         try:
             self._get_event(entity=entity, check=check, namespace=namespace)
@@ -1367,17 +1976,18 @@ class Sensu:
             )
 
         else:
-            response = requests.post(
+            data = {
+                "metadata": {
+                    "name": f"entity:{entity}:{check}",
+                    "namespace": namespace
+                },
+                "expire_on_resolve": True,
+                "check": check,
+                "subscription": f"entity:{entity}"
+            }
+            response = self.session.post(
                 f"{self.url}/api/core/v2/namespaces/{namespace}/silenced",
-                data=json.dumps({
-                    "metadata": {
-                        "name": f"entity:{entity}:{check}",
-                        "namespace": namespace
-                    },
-                    "expire_on_resolve": True,
-                    "check": check,
-                    "subscription": f"entity:{entity}"
-                }),
+                data=json.dumps(data),
                 headers={
                     "Authorization": f"Key {self.token}",
                     "Content-Type": "application/json"
@@ -1396,51 +2006,54 @@ class Sensu:
 
                 raise SensuException(msg)
 
-    def _get_silenced_entries(self, namespace="default"):
-        response = requests.get(
-            f"{self.url}/api/core/v2/namespaces/{namespace}/silenced",
-            headers={
-                "Authorization": f"Key {self.token}"
-            }
-        )
-
-        if not response.ok:
-            msg = f"{namespace}: Silenced entries fetch error: " \
-                  f"{response.status_code} {response.reason}"
-
-            try:
-                msg = f"{msg}: {response.json()['message']}"
+            else:
+                self._snapshot.put(namespace, "silenced", data)
 
-            except (ValueError, KeyError, TypeError):
-                pass
+    def _iter_silenced_entries(self, namespace="default"):
+        def error(response):
+            raise SensuException(self._get_error_message(
+                response, f"{namespace}: Silenced entries fetch error: "
+            ))
 
-            raise SensuException(msg)
+        return self._iter_collection(
+            namespace=namespace, kind="silenced", headers={
+                "Authorization": f"Key {self.token}"
+            }, error=error
+        )
 
-        else:
-            return response.json()
+    def _get_silenced_entries(self, namespace="default"):
+        return list(self._iter_silenced_entries(namespace=namespace))
 
-    def _delete_silenced_entry(
-            self, entity=None, check=None, namespace="default"
+    def _delete_silenced_entries(
+            self, entities=None, checks=None, events=None, namespace="default"
     ):
-        silenced_entries = self._get_silenced_entries(namespace=namespace)
-
-        if entity:
-            silenced_entries = [
-                item for item in silenced_entries if
-                item["metadata"]["name"].startswith(f"entity:{entity}:")
-            ]
-
-        if check:
-            silenced_entries = [
-                item for item in silenced_entries
-                if item["metadata"]["name"].endswith(f":{check}")
-            ]
-
-        failed_delete = list()
-        for entry in silenced_entries:
-            response = requests.delete(
+        entities = set(entities) if entities else set()
+        checks = set(checks) if checks else set()
+        events = set(events) if events else set()
+
+        if not entities and not checks and not events:
+            return
+
+        # silenced entries created for the entities are named
+        # entity:<entity>:<check>, so they are matched by the name parts
+        silenced_entries = list()
+        for item in self._get_silenced_entries(namespace=namespace):
+            name = item["metadata"]["name"]
+            subscription, _, check = name.rpartition(":")
+            entity = None
+            if subscription.startswith("entity:"):
+                entity = subscription[len("entity:"):]
+
+            if check in checks or entity in entities or \
+                    (entity, check) in events:
+                silenced_entries.append(name)
+
+        failed_delete = dict()
+
+        def delete(name):
+            response = self.session.delete(
                 f"{self.url}/api/core/v2/namespaces/{namespace}"
-                f"/silenced/{entry['metadata']['name']}",
+                f"/silenced/{name}",
                 headers={"Authorization": f"Key {self.token}"}
             )
 
@@ -1453,7 +2066,14 @@ class Sensu:
                 except (ValueError, KeyError, TypeError):
                     pass
 
-                failed_delete.append(f"{entry['metadata']['name']} ({msg})")
+                failed_delete[name] = msg
+
+            else:
+                self._snapshot.remove(namespace, "silenced", name)
+
+        self._apply([
+            functools.partial(delete, name) for name in silenced_entries
+        ])
 
         if len(failed_delete) > 0:
             final_msg = "Silenced"
@@ -1463,12 +2083,30 @@ class Sensu:
             else:
                 word = "entries"
 
-            final_msg = (
-                f"{final_msg} {word} {', '.join(failed_delete)} not removed"
-            )
+            failed = [
+                f"{name} ({failed_delete[name]})" for name in silenced_entries
+                if name in failed_delete
+            ]
+
+            final_msg = f"{final_msg} {word} {', '.join(failed)} not removed"
 
             raise SCGWarnException(final_msg)
 
+    def _delete_silenced_entry(
+            self, entity=None, check=None, namespace="default"
+    ):
+        if entity and check:
+            self._delete_silenced_entries(
+                events=[(entity, check)], namespace=namespace
+            )
+
+        else:
+            self._delete_silenced_entries(
+                entities=[entity] if entity else None,
+                checks=[check] if check else None,
+                namespace=namespace
+            )
+
 
 class MetricOutput:
     def __init__(self, data):
@@ -1571,11 +2209,15 @@ class SensuCtl:
         self.namespace = namespace
         self.tenant = tenant
 
-    def _get_events(self):
-        output = subprocess.check_output([
+    def _get_events(self, field_selector=None):
+        command = [
             "sensuctl", "event", "list", "--format", "json", "--namespace",
             self.namespace
-        ]).decode("utf-8")
+        ]
+        if field_selector:
+            command.extend(["--field-selector", field_selector])
+
+        output = subprocess.check_output(command).decode("utf-8")
         data = json.loads(output)
 
         return data
@@ -1666,7 +2308,18 @@ class SensuCtl:
                 return False
 
     def filter_events(self, status=None, service_type=None, agent=False):
-        events = self._get_events()
+        # the selectors only narrow down what sensuctl fetches, events are
+        # still filtered below
+        selectors = list()
+        if agent:
+            selectors.append("event.entity.entity_class == agent")
+
+        if status is not None and status < 3:
+            selectors.append(f"event.check.status == {status}")
+
+        events = self._get_events(
+            field_selector=" && ".join(selectors) if selectors else None
+        )
 
         if agent:
             events = [
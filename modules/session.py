@@ -0,0 +1,99 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_endpoint(method, url):
+    o = urlparse(url)
+    path = o.path
+    elements = path.split("/")
+    # Sensu objects are grouped by the collection they belong to, so that
+    # e.g. all the entity updates in a namespace are counted together
+    if path.startswith("/api/core/v2/namespaces/") and len(elements) > 7:
+        path = "/".join(elements[:7] + ["{name}"])
+
+    return f"{method.upper()} {o.netloc}{path}"
+
+
+class RequestStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = dict()
+
+    def add(self, endpoint, elapsed):
+        with self._lock:
+            if endpoint not in self._stats:
+                self._stats.update({endpoint: {"count": 0, "time": 0.}})
+
+            self._stats[endpoint]["count"] += 1
+            self._stats[endpoint]["time"] += elapsed
+
+    def get(self):
+        with self._lock:
+            return dict(
+                (endpoint, stat.copy()) for endpoint, stat in
+                sorted(self._stats.items(), key=lambda s: -s[1]["time"])
+            )
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+class Session(requests.Session):
+    def __init__(
+            self, pool_size=10, timeout=60, retries=3, backoff_factor=0.5
+    ):
+        super().__init__()
+        self.timeout = timeout
+        self.stats = RequestStats()
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=RETRY_STATUSES,
+                raise_on_status=False
+            )
+        )
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        start = time.monotonic()
+        try:
+            return super().request(method, url, **kwargs)
+
+        finally:
+            self.stats.add(
+                _get_endpoint(method, url), time.monotonic() - start
+            )
+
+
+def configure_session(**kwargs):
+    global _session
+    with _session_lock:
+        _session = Session(**kwargs)
+
+    return _session
+
+
+def get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = Session()
+
+    return _session
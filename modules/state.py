@@ -0,0 +1,201 @@
+import collections.abc
+import hashlib
+import itertools
+import json
+import logging
+import os
+
+from argo_scg.metric import MetricSpec
+
+STATEDIR = "/var/lib/argo-scg"
+
+# part of the digest of the stored configuration; it has to be bumped with
+# every change of the generated configuration, so that the configuration
+# stored by an earlier version is not reused after an upgrade
+STATE_VERSION = 1
+
+
+def _serialize(value):
+    if isinstance(value, MetricSpec):
+        return value.to_dict()
+
+    raise TypeError(
+        f"Object of type {type(value).__name__} is not JSON serializable"
+    )
+
+
+def get_digest(data):
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, default=_serialize).encode("utf-8")
+    ).hexdigest()
+
+
+class StateWriter:
+    def __init__(self, state, tenant, digest):
+        self.state = state
+        self.tenant = tenant
+        self.digest = digest
+        self.output = dict()
+        self.streams = dict()
+        self.failed = False
+        self.logger = logging.getLogger("argo-scg.state")
+
+    def _get_stream_filename(self, key):
+        return f"{self.state._get_filename(self.tenant)}.{key}.tmp"
+
+    def _fail(self, e):
+        if not self.failed:
+            self.logger.warning(f"{self.tenant}: Error storing state: {e}")
+
+        self.failed = True
+
+    def _spool(self, key, items):
+        # items are written to the disk one per line, and the ones which
+        # cannot be written are kept in memory, so that the sync does not
+        # depend on the state directory
+        self.streams.update({key: (0, list())})
+        f = None
+        try:
+            os.makedirs(self.state.directory, exist_ok=True)
+            f = open(self._get_stream_filename(key), "w")
+
+        except OSError as e:
+            self._fail(e)
+
+        written = 0
+        kept = list()
+        try:
+            for item in items:
+                if f and not kept:
+                    try:
+                        f.write(f"{json.dumps(item)}\n")
+                        f.flush()
+                        written += 1
+                        continue
+
+                    except (OSError, TypeError, ValueError) as e:
+                        self._fail(e)
+
+                kept.append(item)
+
+        finally:
+            if f:
+                f.close()
+
+        self.streams.update({key: (written, kept)})
+
+    def _read(self, key):
+        written, kept = self.streams[key]
+        if written:
+            with open(self._get_stream_filename(key)) as f:
+                for line in itertools.islice(f, written):
+                    yield json.loads(line)
+
+        yield from kept
+
+    def spool(self, output):
+        # streamed values are consumed completely before anything is
+        # returned, so that an error while generating them is raised before
+        # any of the items is used; they are kept on the disk and read back
+        # one by one, so the whole configuration is never kept in memory
+        spooled = dict()
+        for key, value in output.items():
+            if isinstance(value, collections.abc.Iterator):
+                self._spool(key, value)
+                spooled.update({key: self._read(key)})
+
+            else:
+                self.output.update({key: value})
+                spooled.update({key: value})
+
+        return spooled
+
+    def commit(self):
+        if self.failed:
+            self.close()
+            return
+
+        filename = self.state._get_filename(self.tenant)
+        tmp_filename = f"{filename}.tmp"
+        try:
+            os.makedirs(self.state.directory, exist_ok=True)
+            with open(tmp_filename, "w") as f:
+                f.write(f'{{"digest": {json.dumps(self.digest)}, "output": {{')
+                items = [
+                    (key, json.dumps(value)) for key, value in
+                    self.output.items()
+                ]
+                for key in self.streams.keys():
+                    items.append((key, None))
+
+                for i, (key, value) in enumerate(items):
+                    f.write(f'{", " if i else ""}{json.dumps(key)}: ')
+                    if value is None:
+                        f.write("[")
+                        with open(self._get_stream_filename(key)) as stream:
+                            for j, line in enumerate(stream):
+                                f.write(f'{", " if j else ""}{line.strip()}')
+
+                        f.write("]")
+
+                    else:
+                        f.write(value)
+
+                f.write("}}")
+
+            os.replace(tmp_filename, filename)
+
+        except (OSError, TypeError, ValueError) as e:
+            self._fail(e)
+
+        self.close()
+
+    def close(self):
+        for key in self.streams.keys():
+            try:
+                os.remove(self._get_stream_filename(key))
+
+            except OSError:
+                pass
+
+
+class State:
+    def __init__(self, directory=STATEDIR):
+        self.directory = directory
+        self.logger = logging.getLogger("argo-scg.state")
+
+    def _get_filename(self, tenant):
+        return os.path.join(self.directory, f"{tenant}.json")
+
+    def get(self, tenant, digest):
+        try:
+            with open(self._get_filename(tenant)) as f:
+                data = json.load(f)
+
+        except FileNotFoundError:
+            return None
+
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"{tenant}: Error reading stored state: {e}")
+            return None
+
+        if not isinstance(data, dict) or data.get("digest") != digest:
+            return None
+
+        return data.get("output")
+
+    def store(self, tenant, digest, output):
+        filename = self._get_filename(tenant)
+        tmp_filename = f"{filename}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_filename, "w") as f:
+                json.dump({"digest": digest, "output": output}, f)
+
+            os.replace(tmp_filename, filename)
+
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"{tenant}: Error storing state: {e}")
+
+    def writer(self, tenant, digest):
+        return StateWriter(state=self, tenant=tenant, digest=digest)
@@ -1,23 +1,35 @@
 import logging
 
-import requests
 from argo_scg.exceptions import WebApiException
+from argo_scg.session import get_session
 
 
 class WebApi:
     def __init__(
             self, url, token, tenant, topo_groups_filter=None,
-            topo_endpoints_filter=None
+            topo_endpoints_filter=None, session=None, cache=None
     ):
         self.url = url
         self.token = token
         self.tenant = tenant
+        self.session = session if session else get_session()
+        self.cache = cache
         self.groups_filter = topo_groups_filter
         self.endpoints_filter = topo_endpoints_filter
         self.logger = logging.getLogger("argo-scg.webapi")
 
+    def _get(self, url, headers):
+        if self.cache:
+            return self.cache.get(
+                session=self.session, url=url, headers=headers,
+                token=self.token
+            )
+
+        else:
+            return self.session.get(url, headers=headers)
+
     def get_metric_profiles(self):
-        response = requests.get(
+        response = self._get(
             f"{self.url}/api/v2/metric_profiles",
             headers={"Accept": "application/json", "x-api-key": self.token}
         )
@@ -45,7 +57,7 @@ class WebApi:
         if self.groups_filter:
             url = f"{url}?{self.groups_filter}"
 
-        response = requests.get(
+        response = self._get(
             url,
             headers={
                 "Accept": "application/json",
@@ -76,7 +88,7 @@ class WebApi:
         url = f"{self.url}/api/v2/topology/endpoints"
         if self.endpoints_filter:
             url = f"{url}?{self.endpoints_filter}"
-        response = requests.get(
+        response = self._get(
             url,
             headers={
                 "Accept": "application/json",
@@ -107,24 +119,15 @@ class WebApi:
         endpoints = self._get_topology_endpoints()
         groups = self._get_topology_groups()
 
-        for endpoint in endpoints:
-            try:
-                ngi = [
-                    group for group in groups if
-                    group["subgroup"] == endpoint["group"]
-                ][0]["group"]
+        ngis = dict()
+        for group in groups:
+            ngis.setdefault(group["subgroup"], group["group"])
 
-            except IndexError:
-                ngi = ""
-
-            endpoint.update({"ngi": ngi})
-
-        if self.groups_filter:
-            eligible_sites = [group["subgroup"] for group in groups]
+        topology = list()
+        for endpoint in endpoints:
+            endpoint.update({"ngi": ngis.get(endpoint["group"], "")})
 
-            endpoints = [
-                endpoint for endpoint in endpoints if
-                endpoint["group"] in eligible_sites
-            ]
+            if not self.groups_filter or endpoint["group"] in ngis:
+                topology.append(endpoint)
 
-        return endpoints
+        return topology
@@ -0,0 +1,71 @@
+import copy
+import logging
+import os
+import timeit
+
+from argo_scg.generator import ConfigurationGenerator
+
+from test_generator import mock_metrics, mock_metric_profiles, \
+    mock_topology, mock_attributes, mock_default_ports
+
+ENDPOINTS = 50000
+
+
+def generate_topology():
+    topology = list()
+    i = 0
+    while len(topology) < ENDPOINTS:
+        for item in mock_topology:
+            endpoint = copy.deepcopy(item)
+            endpoint["hostname"] = f"host{i}.{item['hostname']}"
+            endpoint["group"] = f"{item['group']}{i % 500}"
+            topology.append(endpoint)
+
+        i += 1
+
+    return topology[:ENDPOINTS]
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    topology = generate_topology()
+    profiles = [profile["name"] for profile in mock_metric_profiles]
+
+    def create_generator():
+        return ConfigurationGenerator(
+            metrics=copy.deepcopy(mock_metrics),
+            profiles=profiles,
+            metric_profiles=copy.deepcopy(mock_metric_profiles),
+            topology=topology,
+            attributes=mock_attributes,
+            secrets_file="",
+            default_ports=mock_default_ports,
+            tenant="TENANT",
+            default_agent=["sensu-agent.example.com"]
+        )
+
+    print(f"{ENDPOINTS} endpoints, {os.cpu_count()} CPUs")
+    expected = None
+    serial = None
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        generator = create_generator()
+        start = timeit.default_timer()
+        entities = generator.generate_entities(
+            namespace="tenant", workers=workers
+        )
+        elapsed = timeit.default_timer() - start
+
+        if expected is None:
+            expected = entities
+            serial = elapsed
+
+        assert entities == expected
+
+        print(
+            f"{workers} worker(s): {elapsed:.2f} s "
+            f"({serial / elapsed:.2f}x), {len(entities)} entities"
+        )
+
+
+if __name__ == "__main__":
+    main()
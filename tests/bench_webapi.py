@@ -0,0 +1,85 @@
+import copy
+import random
+import timeit
+from unittest.mock import patch
+
+from argo_scg.webapi import WebApi
+
+ENDPOINTS = 30000
+GROUPS = 5000
+
+
+def generate_topology():
+    random.seed(0)
+    groups = [
+        {"group": f"NGI{i % 50}", "subgroup": f"SITE{i}", "type": "NGI"}
+        for i in range(GROUPS)
+    ]
+    endpoints = [
+        {
+            "group": f"SITE{random.randrange(GROUPS + GROUPS // 10)}",
+            "hostname": f"host{i}.example.com",
+            "service": "web.check",
+            "type": "SITES",
+            "tags": {"monitored": "1"}
+        } for i in range(ENDPOINTS)
+    ]
+    return endpoints, groups
+
+
+def get_topology_scan(webapi, endpoints, groups):
+    for endpoint in endpoints:
+        try:
+            ngi = [
+                group for group in groups if
+                group["subgroup"] == endpoint["group"]
+            ][0]["group"]
+
+        except IndexError:
+            ngi = ""
+
+        endpoint.update({"ngi": ngi})
+
+    if webapi.groups_filter:
+        eligible_sites = [group["subgroup"] for group in groups]
+
+        endpoints = [
+            endpoint for endpoint in endpoints if
+            endpoint["group"] in eligible_sites
+        ]
+
+    return endpoints
+
+
+def main():
+    endpoints, groups = generate_topology()
+    webapi = WebApi(
+        url="https://web-api.com", token="t0k3n", tenant="TENANT",
+        topo_groups_filter="tags=certification:Certified"
+    )
+
+    with patch(
+            "argo_scg.webapi.WebApi._get_topology_endpoints",
+            return_value=copy.deepcopy(endpoints)
+    ), patch(
+        "argo_scg.webapi.WebApi._get_topology_groups", return_value=groups
+    ):
+        start = timeit.default_timer()
+        topology = webapi.get_topology()
+        indexed = timeit.default_timer() - start
+
+    start = timeit.default_timer()
+    expected = get_topology_scan(
+        webapi, copy.deepcopy(endpoints), groups
+    )
+    scan = timeit.default_timer() - start
+
+    assert topology == expected
+
+    print(f"{ENDPOINTS} endpoints, {GROUPS} groups")
+    print(f"list scan: {scan:.3f} s")
+    print(f"dict join: {indexed:.3f} s ({scan / indexed:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
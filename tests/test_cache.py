@@ -0,0 +1,267 @@
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch, call
+
+import requests
+from argo_scg.cache import ResponseCache
+from argo_scg.poem import Poem
+from argo_scg.session import Session
+
+from utils import MockResponse
+
+LOGNAME = "argo-scg.cache"
+DUMMY_LOG = [f"INFO:{LOGNAME}:dummy"]
+
+mock_ports = [
+    {"name": "BDII_PORT", "value": "2170"},
+    {"name": "GRAM_PORT", "value": "2119"}
+]
+
+URL = "https://poem.mock.url/api/v2/default_ports"
+
+
+def _log_dummy():
+    logger = logging.getLogger(LOGNAME)
+    logger.info("dummy")
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = ResponseCache(
+            directory=os.path.join(self.directory, "cache"), max_stale=600
+        )
+        self.session = Session()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @patch("argo_scg.session.Session.get")
+    def test_first_request(self, mock_get):
+        mock_get.return_value = MockResponse(
+            mock_ports, status_code=200, headers={"ETag": '"abc"'}
+        )
+        response = self.cache.get(
+            session=self.session, url=URL, headers={"x-api-key": "t0k3n"},
+            token="t0k3n"
+        )
+        mock_get.assert_called_once_with(URL, headers={"x-api-key": "t0k3n"})
+        self.assertTrue(response.ok)
+        self.assertEqual(response.json(), mock_ports)
+
+    @patch("argo_scg.session.Session.get")
+    def test_conditional_request(self, mock_get):
+        mock_get.side_effect = [
+            MockResponse(
+                mock_ports, status_code=200, headers={
+                    "ETag": '"abc"',
+                    "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"
+                }
+            ),
+            MockResponse(None, status_code=304)
+        ]
+        for _ in range(2):
+            response = self.cache.get(
+                session=self.session, url=URL,
+                headers={"x-api-key": "t0k3n"}, token="t0k3n"
+            )
+            self.assertTrue(response.ok)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json(), mock_ports)
+
+        mock_get.assert_has_calls([
+            call(URL, headers={"x-api-key": "t0k3n"}),
+            call(URL, headers={
+                "x-api-key": "t0k3n",
+                "If-None-Match": '"abc"',
+                "If-Modified-Since": "Wed, 21 Oct 2026 07:28:00 GMT"
+            })
+        ])
+
+    @patch("argo_scg.session.Session.get")
+    def test_cache_keyed_by_token(self, mock_get):
+        mock_get.return_value = MockResponse(
+            mock_ports, status_code=200, headers={"ETag": '"abc"'}
+        )
+        self.cache.get(
+            session=self.session, url=URL, headers={"x-api-key": "t0k3n"},
+            token="t0k3n"
+        )
+        self.cache.get(
+            session=self.session, url=URL, headers={"x-api-key": "t0k3n2"},
+            token="t0k3n2"
+        )
+        mock_get.assert_has_calls([
+            call(URL, headers={"x-api-key": "t0k3n"}),
+            call(URL, headers={"x-api-key": "t0k3n2"})
+        ])
+        self.assertEqual(len(os.listdir(self.cache.directory)), 2)
+        for filename in os.listdir(self.cache.directory):
+            with open(os.path.join(self.cache.directory, filename)) as f:
+                self.assertNotIn("t0k3n", f.read())
+
+    @patch("argo_scg.session.Session.get")
+    def test_updated_resource(self, mock_get):
+        mock_get.side_effect = [
+            MockResponse(
+                mock_ports, status_code=200, headers={"ETag": '"abc"'}
+            ),
+            MockResponse(
+                mock_ports[:1], status_code=200, headers={"ETag": '"def"'}
+            ),
+            MockResponse(None, status_code=304)
+        ]
+        responses = [
+            self.cache.get(
+                session=self.session, url=URL,
+                headers={"x-api-key": "t0k3n"}, token="t0k3n"
+            ).json() for _ in range(3)
+        ]
+        self.assertEqual(
+            responses, [mock_ports, mock_ports[:1], mock_ports[:1]]
+        )
+        self.assertEqual(
+            mock_get.call_args_list[2],
+            call(URL, headers={"x-api-key": "t0k3n", "If-None-Match": '"def"'})
+        )
+
+    @patch("argo_scg.session.Session.get")
+    def test_stale_response_on_error(self, mock_get):
+        mock_get.side_effect = [
+            MockResponse(mock_ports, status_code=200),
+            MockResponse(None, status_code=503),
+            requests.exceptions.ConnectionError("Connection refused")
+        ]
+        self.cache.get(
+            session=self.session, url=URL, headers={"x-api-key": "t0k3n"},
+            token="t0k3n"
+        )
+        with self.assertLogs(LOGNAME) as log:
+            for _ in range(2):
+                response = self.cache.get(
+                    session=self.session, url=URL,
+                    headers={"x-api-key": "t0k3n"}, token="t0k3n"
+                )
+                self.assertTrue(response.ok)
+                self.assertEqual(response.json(), mock_ports)
+
+        self.assertEqual(
+            log.output, [
+                f"WARNING:{LOGNAME}:{URL}: 503 BAD REQUEST: "
+                f"Using cached response",
+                f"WARNING:{LOGNAME}:{URL}: Connection refused: "
+                f"Using cached response"
+            ]
+        )
+
+    @patch("argo_scg.session.Session.get")
+    def test_too_stale_response_on_error(self, mock_get):
+        mock_get.side_effect = [
+            MockResponse(mock_ports, status_code=200),
+            MockResponse(None, status_code=503),
+            requests.exceptions.ConnectionError("Connection refused")
+        ]
+        self.cache.get(
+            session=self.session, url=URL, headers={"x-api-key": "t0k3n"},
+            token="t0k3n"
+        )
+        with patch("time.time", return_value=time.time() + 601):
+            response = self.cache.get(
+                session=self.session, url=URL,
+                headers={"x-api-key": "t0k3n"}, token="t0k3n"
+            )
+            self.assertFalse(response.ok)
+            self.assertEqual(response.status_code, 503)
+
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                self.cache.get(
+                    session=self.session, url=URL,
+                    headers={"x-api-key": "t0k3n"}, token="t0k3n"
+                )
+
+    @patch("argo_scg.session.Session.get")
+    def test_client_error_not_served_from_cache(self, mock_get):
+        mock_get.side_effect = [
+            MockResponse(mock_ports, status_code=200),
+            MockResponse({"detail": "Unauthorized"}, status_code=401)
+        ]
+        self.cache.get(
+            session=self.session, url=URL, headers={"x-api-key": "t0k3n"},
+            token="t0k3n"
+        )
+        with self.assertLogs(LOGNAME) as log:
+            _log_dummy()
+            response = self.cache.get(
+                session=self.session, url=URL,
+                headers={"x-api-key": "t0k3n"}, token="t0k3n"
+            )
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(log.output, DUMMY_LOG)
+
+    @patch("argo_scg.session.Session.get")
+    def test_cache_directory_not_writable(self, mock_get):
+        with open(self.cache.directory, "w") as f:
+            f.write("")
+
+        mock_get.return_value = MockResponse(mock_ports, status_code=200)
+        with self.assertLogs(LOGNAME) as log:
+            response = self.cache.get(
+                session=self.session, url=URL,
+                headers={"x-api-key": "t0k3n"}, token="t0k3n"
+            )
+
+        self.assertEqual(response.json(), mock_ports)
+        self.assertEqual(len(log.output), 1)
+        self.assertTrue(
+            log.output[0].startswith(f"WARNING:{LOGNAME}:Error caching {URL}")
+        )
+
+    @patch("argo_scg.session.Session.get")
+    def test_concurrent_writes(self, mock_get):
+        mock_get.return_value = MockResponse(
+            mock_ports, status_code=200, headers={"ETag": '"abc"'}
+        )
+
+        def get():
+            self.cache.get(
+                session=self.session, url=URL,
+                headers={"x-api-key": "t0k3n"}, token="t0k3n"
+            )
+
+        threads = [threading.Thread(target=get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(os.listdir(self.cache.directory)), 1)
+        mock_get.return_value = MockResponse(None, status_code=304)
+        response = self.cache.get(
+            session=self.session, url=URL, headers={"x-api-key": "t0k3n"},
+            token="t0k3n"
+        )
+        self.assertEqual(response.json(), mock_ports)
+
+    @patch("argo_scg.session.Session.get")
+    def test_poem_with_cache(self, mock_get):
+        mock_get.side_effect = [
+            MockResponse(mock_ports, status_code=200, headers={"ETag": "1"}),
+            MockResponse(None, status_code=304)
+        ]
+        poem = Poem(
+            url="https://poem.mock.url", token="t0k3n", tenant="TENANT",
+            cache=self.cache
+        )
+        self.assertEqual(poem.get_default_ports(), mock_ports)
+        self.assertEqual(poem.get_default_ports(), mock_ports)
+        self.assertEqual(
+            mock_get.call_args_list[1],
+            call(URL, headers={"x-api-key": "t0k3n", "If-None-Match": "1"})
+        )
@@ -158,6 +158,46 @@ metricprofiles = PROFILE4
 publish = false
 """
 
+config_file_http_settings = """[GENERAL]
+sensu_url = http://sensu.mock.url/
+sensu_token = s3ns8t0k3n
+webapi_url = https://web-api.mock.url/
+http_pool_size = 32
+http_timeout = 30
+http_retries = 5
+http_backoff_factor = 1
+sensu_concurrency = 32
+sensu_page_size = 100
+generator_workers = 4
+state_dir = /tmp/argo-scg
+cache_dir = /tmp/argo-scg-cache
+cache_max_stale = 600
+
+[TENANT1]
+poem_url = https://tenant1.poem.mock.url/
+poem_token = p03mtok3n
+webapi_token = w3b4p1t0k3n
+metricprofiles = PROFILE1
+publish = false
+"""
+
+config_file_http_settings_invalid = """[GENERAL]
+sensu_url = http://sensu.mock.url/
+sensu_token = s3ns8t0k3n
+webapi_url = https://web-api.mock.url/
+http_retries = three
+sensu_concurrency = 0
+sensu_page_size = -1
+generator_workers = -1
+
+[TENANT1]
+poem_url = https://tenant1.poem.mock.url/
+poem_token = p03mtok3n
+webapi_token = w3b4p1t0k3n
+metricprofiles = PROFILE1
+publish = false
+"""
+
 agents_config_ok = """[AGENTS]
 sensu-agent1.argo.eu = webdav, xrootd
 sensu-agent2.argo.eu = ARC-CE
@@ -531,6 +571,151 @@ class ConfigTests(unittest.TestCase):
             }
         )
 
+    def test_get_http_settings(self):
+        with open(config_file_name, "w") as f:
+            f.write(config_file_http_settings)
+
+        config = Config(config_file=config_file_name)
+
+        self.assertEqual(
+            config.get_http_settings(), {
+                "pool_size": 32,
+                "timeout": 30.,
+                "retries": 5,
+                "backoff_factor": 1.
+            }
+        )
+
+    def test_get_http_settings_default(self):
+        self.assertEqual(
+            self.config.get_http_settings(), {
+                "pool_size": 10,
+                "timeout": 60.,
+                "retries": 3,
+                "backoff_factor": 0.5
+            }
+        )
+
+    def test_get_http_settings_invalid_value(self):
+        with open(config_file_name, "w") as f:
+            f.write(config_file_http_settings_invalid)
+
+        config = Config(config_file=config_file_name)
+
+        with self.assertRaises(ConfigException) as context:
+            config.get_http_settings()
+
+        self.assertEqual(
+            context.exception.__str__(),
+            "Configuration file error: "
+            "Option http_retries in section GENERAL must be a number"
+        )
+
+    def test_get_sensu_concurrency(self):
+        with open(config_file_name, "w") as f:
+            f.write(config_file_http_settings)
+
+        config = Config(config_file=config_file_name)
+
+        self.assertEqual(config.get_sensu_concurrency(), 32)
+
+    def test_get_sensu_concurrency_default(self):
+        self.assertEqual(self.config.get_sensu_concurrency(), 1)
+
+    def test_get_sensu_concurrency_invalid_value(self):
+        with open(config_file_name, "w") as f:
+            f.write(config_file_http_settings_invalid)
+
+        config = Config(config_file=config_file_name)
+
+        with self.assertRaises(ConfigException) as context:
+            config.get_sensu_concurrency()
+
+        self.assertEqual(
+            context.exception.__str__(),
+            "Configuration file error: "
+            "Option sensu_concurrency in section GENERAL must be a positive "
+            "number"
+        )
+
+    def test_get_sensu_page_size(self):
+        with open(config_file_name, "w") as f:
+            f.write(config_file_http_settings)
+
+        config = Config(config_file=config_file_name)
+
+        self.assertEqual(config.get_sensu_page_size(), 100)
+
+    def test_get_sensu_page_size_default(self):
+        self.assertEqual(self.config.get_sensu_page_size(), 500)
+
+    def test_get_sensu_page_size_invalid_value(self):
+        with open(config_file_name, "w") as f:
+            f.write(config_file_http_settings_invalid)
+
+        config = Config(config_file=config_file_name)
+
+        with self.assertRaises(ConfigException) as context:
+            config.get_sensu_page_size()
+
+        self.assertEqual(
+            context.exception.__str__(),
+            "Configuration file error: "
+            "Option sensu_page_size in section GENERAL must not be a negative "
+            "number"
+        )
+
+    def test_get_generator_workers(self):
+        with open(config_file_name, "w") as f:
+            f.write(config_file_http_settings)
+
+        config = Config(config_file=config_file_name)
+
+        self.assertEqual(config.get_generator_workers(), 4)
+
+    def test_get_generator_workers_default(self):
+        self.assertEqual(self.config.get_generator_workers(), 1)
+
+    def test_get_generator_workers_invalid_value(self):
+        with open(config_file_name, "w") as f:
+            f.write(config_file_http_settings_invalid)
+
+        config = Config(config_file=config_file_name)
+
+        with self.assertRaises(ConfigException) as context:
+            config.get_generator_workers()
+
+        self.assertEqual(
+            context.exception.__str__(),
+            "Configuration file error: "
+            "Option generator_workers in section GENERAL must be a positive "
+            "number"
+        )
+
+    def test_get_state_dir(self):
+        with open(config_file_name, "w") as f:
+            f.write(config_file_http_settings)
+
+        config = Config(config_file=config_file_name)
+
+        self.assertEqual(config.get_state_dir(), "/tmp/argo-scg")
+
+    def test_get_state_dir_default(self):
+        self.assertEqual(self.config.get_state_dir(), "/var/lib/argo-scg")
+
+    def test_get_cache_settings(self):
+        with open(config_file_name, "w") as f:
+            f.write(config_file_http_settings)
+
+        config = Config(config_file=config_file_name)
+
+        self.assertEqual(config.get_cache_dir(), "/tmp/argo-scg-cache")
+        self.assertEqual(config.get_cache_max_stale(), 600)
+
+    def test_get_cache_settings_default(self):
+        self.assertEqual(self.config.get_cache_dir(), "/var/cache/argo-scg")
+        self.assertEqual(self.config.get_cache_max_stale(), 3600)
+
 
 class AgentConfigTests(unittest.TestCase):
     def setUp(self):
@@ -1,10 +1,14 @@
 import copy
 import logging
+import multiprocessing
 import unittest
+from unittest.mock import patch
 
 from argo_scg.exceptions import GeneratorException
 from argo_scg.generator import ConfigurationGenerator, generate_adhoc_check, \
-    ConfigurationMerger
+    ConfigurationMerger, create_label, get_cache_stats, get_hash, stamp_hash, \
+    HASH_ANNOTATION
+from argo_scg.metric import MetricSpec
 
 mock_metrics = [
     {
@@ -4818,6 +4822,71 @@ class CheckConfigurationTests(unittest.TestCase):
             ]
         )
 
+    def test_generate_checks_configuration_with_malformed_metrics(self):
+        metrics = copy.deepcopy(faulty_metrics)
+        for metric in metrics:
+            for name, configuration in metric.items():
+                if name == "generic.http.ar-argoui-ni4os":
+                    configuration.pop("probe")
+
+        with self.assertLogs(LOGNAME) as log:
+            generator = ConfigurationGenerator(
+                metrics=metrics,
+                profiles=["ARGO_TEST1"],
+                metric_profiles=mock_metric_profiles,
+                topology=mock_topology,
+                attributes=mock_attributes,
+                secrets_file="",
+                default_ports=mock_default_ports,
+                tenant="MOCK_TENANT",
+                default_agent=["sensu-agent-mock_tenant.example.com"]
+            )
+            checks = generator.generate_checks(
+                publish=True, namespace="mockspace"
+            )
+        self.assertEqual(
+            [check["metadata"]["name"] for check in checks],
+            ["generic.tcp.connect"]
+        )
+        self.assertEqual(
+            log.output, [
+                f"WARNING:{LOGNAME}:MOCK_TENANT: Skipping metric "
+                f"generic.http.ar-argoui-ni4os: Missing key 'probe'"
+            ]
+        )
+
+    def test_generate_checks_configuration_with_wrong_metric_type(self):
+        metrics = copy.deepcopy(faulty_metrics)
+        for metric in metrics:
+            for name, configuration in metric.items():
+                if name == "generic.tcp.connect":
+                    configuration["flags"] = None
+
+        with self.assertLogs(LOGNAME) as log:
+            generator = ConfigurationGenerator(
+                metrics=metrics,
+                profiles=["ARGO_TEST1"],
+                metric_profiles=mock_metric_profiles,
+                topology=mock_topology,
+                attributes=mock_attributes,
+                secrets_file="",
+                default_ports=mock_default_ports,
+                tenant="MOCK_TENANT",
+                default_agent=["sensu-agent-mock_tenant.example.com"]
+            )
+            checks = generator.generate_checks(
+                publish=True, namespace="mockspace"
+            )
+        self.assertEqual(checks, [])
+        self.assertEqual(
+            log.output, [
+                f"WARNING:{LOGNAME}:MOCK_TENANT: Skipping metric "
+                f"generic.tcp.connect: 'NoneType' object is not iterable",
+                f"WARNING:{LOGNAME}:MOCK_TENANT: Skipping check "
+                f"generic.http.ar-argoui-ni4os: Missing key 'timeout'"
+            ]
+        )
+
     def test_generate_checks_configuration_for_default_tenant(self):
         generator = ConfigurationGenerator(
             metrics=mock_metrics,
@@ -11697,6 +11766,259 @@ class EntityConfigurationTests(unittest.TestCase):
         )
         self.assertEqual(log.output, DUMMY_LOG)
 
+    def test_generate_entities_in_worker_processes(self):
+        generator = ConfigurationGenerator(
+            metrics=mock_metrics,
+            profiles=["ARGO_TEST1", "ARGO_TEST14", "ARGO_TEST21"],
+            metric_profiles=copy.deepcopy(mock_metric_profiles),
+            topology=copy.deepcopy(
+                mock_topology + mock_topology_with_duplicate_entries
+            ),
+            attributes=mock_attributes,
+            secrets_file="",
+            default_ports=mock_default_ports,
+            tenant="MOCK_TENANT",
+            default_agent=["sensu-agent-mock_tenant.example.com"]
+        )
+        entities = generator.generate_entities(namespace="tenant")
+        self.assertGreater(len(entities), 3)
+        self.assertEqual(
+            generator.generate_entities(namespace="tenant", workers=3),
+            entities
+        )
+
+    def test_generate_with_metric_specs(self):
+        specs = dict()
+        for metric in mock_metrics:
+            for name, configuration in metric.items():
+                specs.setdefault(name, MetricSpec(name, configuration))
+
+        generators = [
+            ConfigurationGenerator(
+                metrics=metrics,
+                profiles=["ARGO_TEST1", "ARGO_TEST14", "ARGO_TEST21"],
+                metric_profiles=copy.deepcopy(mock_metric_profiles),
+                topology=copy.deepcopy(mock_topology),
+                attributes=mock_attributes,
+                secrets_file="",
+                default_ports=mock_default_ports,
+                tenant="MOCK_TENANT",
+                default_agent=["sensu-agent-mock_tenant.example.com"]
+            ) for metrics in [mock_metrics, specs]
+        ]
+        checks = generators[0].generate_checks(
+            publish=True, namespace="tenant"
+        )
+        entities = generators[0].generate_entities(namespace="tenant")
+        self.assertGreater(len(checks), 3)
+        self.assertGreater(len(entities), 3)
+        self.assertEqual(
+            generators[1].generate_checks(publish=True, namespace="tenant"),
+            checks
+        )
+        self.assertEqual(
+            generators[1].generate_entities(namespace="tenant"), entities
+        )
+
+    def test_generate_with_parsed_metric_numbers(self):
+        configuration = [
+            m["generic.tcp.connect"] for m in mock_metrics
+            if "generic.tcp.connect" in m
+        ][0]
+        configurations = dict(
+            (name, copy.deepcopy(configuration)) for name in [
+                "generic.tcp.connect", "generic.tcp.connect-invalid",
+                "generic.tcp.connect-missing"
+            ]
+        )
+        configurations["generic.tcp.connect"]["config"].update({
+            "interval": " 5", "timeout": "120 "
+        })
+        configurations["generic.tcp.connect-invalid"]["config"].update({
+            "interval": "5m"
+        })
+        configurations["generic.tcp.connect-missing"]["config"].pop("timeout")
+        metrics = dict(
+            (name, MetricSpec(name, config))
+            for name, config in configurations.items()
+        )
+
+        generator = ConfigurationGenerator(
+            metrics=metrics,
+            profiles=["ARGO_TEST"],
+            metric_profiles=[{
+                "name": "ARGO_TEST",
+                "services": [{
+                    "service": "argo.webui",
+                    "metrics": sorted(metrics)
+                }]
+            }],
+            topology=copy.deepcopy(mock_topology),
+            attributes=mock_attributes,
+            secrets_file="",
+            default_ports=mock_default_ports,
+            tenant="MOCK_TENANT",
+            default_agent=["sensu-agent-mock_tenant.example.com"]
+        )
+        with self.assertLogs(LOGNAME) as log:
+            checks = generator.generate_checks(
+                publish=True, namespace="tenant"
+            )
+
+        self.assertEqual(
+            [check["metadata"]["name"] for check in checks],
+            ["generic.tcp.connect"]
+        )
+        self.assertEqual(checks[0]["interval"], 300)
+        self.assertEqual(
+            checks[0]["metadata"]["annotations"], {"attempts": "3"}
+        )
+        self.assertIn(" -t 120 ", checks[0]["command"])
+        self.assertEqual(
+            sorted(log.output), [
+                f"WARNING:{LOGNAME}:MOCK_TENANT: Skipping check "
+                f"generic.tcp.connect-invalid: Invalid interval value '5m'",
+                f"WARNING:{LOGNAME}:MOCK_TENANT: Skipping check "
+                f"generic.tcp.connect-missing: Missing key 'timeout'"
+            ]
+        )
+
+    def test_is_extension_present(self):
+        generator = ConfigurationGenerator(
+            metrics=mock_metrics,
+            profiles=["ARGO_TEST1"],
+            metric_profiles=mock_metric_profiles,
+            topology=mock_topology,
+            attributes=mock_attributes,
+            secrets_file="",
+            default_ports=mock_default_ports,
+            tenant="MOCK_TENANT",
+            default_agent=["sensu-agent-mock_tenant.example.com"]
+        )
+        services = ["eu.egi.cloud.dyndns", "eu.egi.cloud.dyndns"]
+        self.assertTrue(generator._is_extension_present_all_endpoints(
+            services=services, extension="info_ext_endpoint-name"
+        ))
+        self.assertFalse(generator._is_extension_present_all_endpoints(
+            services=services + ["eu.ni4os.hpc.ui"],
+            extension="info_ext_endpoint-name"
+        ))
+        self.assertTrue(generator._is_extension_present_any_endpoint(
+            services=services + ["eu.ni4os.hpc.ui"],
+            extension="info_ext_PORT"
+        ))
+        self.assertFalse(generator._is_extension_present_any_endpoint(
+            services=services, extension="info_ext_PORT"
+        ))
+        self.assertTrue(generator._is_extension_present_all_endpoints(
+            services=["nonexisting"], extension="info_ext_PORT"
+        ))
+        self.assertFalse(generator._is_extension_present_any_endpoint(
+            services=["nonexisting"], extension="info_ext_PORT"
+        ))
+
+    def test_topology_maps_built_once(self):
+        generator = ConfigurationGenerator(
+            metrics=mock_metrics,
+            profiles=["ARGO_TEST1"],
+            metric_profiles=[{
+                "name": "ARGO_TEST1",
+                "services": [{
+                    "service": "argo.webui",
+                    "metrics": [
+                        "generic.http.ar-argoui-ni4os", "generic.tcp.connect"
+                    ]
+                }, {
+                    "service": "argo.test",
+                    "metrics": ["generic.http.ar-argoui-ni4os"]
+                }]
+            }],
+            topology=mock_topology,
+            attributes=mock_attributes,
+            secrets_file="",
+            default_ports=mock_default_ports,
+            tenant="MOCK_TENANT",
+            default_agent=["sensu-agent-mock_tenant.example.com"]
+        )
+        with patch.object(
+                generator, "_get_hostname", wraps=generator._get_hostname
+        ) as mock_hostname:
+            hostnames4metrics = generator._get_hostnames4metrics()
+            calls = mock_hostname.call_count
+            self.assertGreater(calls, 0)
+            self.assertIs(generator._get_hostnames4metrics(), hostnames4metrics)
+            self.assertIs(
+                generator._get_hostnames4servicetypes(),
+                generator._get_hostnames4servicetypes()
+            )
+            self.assertTrue(
+                generator._is_attribute_overridden_all_endpoints("NONE")
+            )
+            self.assertEqual(
+                generator.attributes_overridden_all_endpoints, {"NONE": True}
+            )
+            self.assertEqual(mock_hostname.call_count, calls)
+
+        self.assertEqual(
+            hostnames4metrics, {
+                "generic.http.ar-argoui-ni4os": [
+                    "argo-devel.ni4os.eu", "argo.ni4os.eu"
+                ],
+                "generic.tcp.connect": ["argo-devel.ni4os.eu", "argo.ni4os.eu"]
+            }
+        )
+        self.assertEqual(
+            generator._get_entities4servicetypes(), {
+                "argo.test": ["argo.test__argo.ni4os.eu"],
+                "argo.webui": [
+                    "argo.webui__argo-devel.ni4os.eu",
+                    "argo.webui__argo.ni4os.eu"
+                ]
+            }
+        )
+        self.assertEqual(
+            generator._get_entities4metrics(), {
+                "generic.http.ar-argoui-ni4os": [
+                    "argo.test__argo.ni4os.eu",
+                    "argo.webui__argo-devel.ni4os.eu",
+                    "argo.webui__argo.ni4os.eu"
+                ],
+                "generic.tcp.connect": [
+                    "argo.webui__argo-devel.ni4os.eu",
+                    "argo.webui__argo.ni4os.eu"
+                ]
+            }
+        )
+
+    def test_generate_entities_in_worker_processes_with_faulty_topology(
+            self
+    ):
+        generator = ConfigurationGenerator(
+            metrics=mock_metrics,
+            profiles=["ARGO_TEST21"],
+            metric_profiles=mock_metric_profiles,
+            topology=faulty_local_topology,
+            attributes=mock_attributes,
+            secrets_file="",
+            default_ports=mock_default_ports,
+            tenant="MOCK_TENANT",
+            default_agent=["sensu-agent-mock_tenant.example.com"]
+        )
+        with self.assertRaises(GeneratorException) as context:
+            with self.assertLogs(LOGNAME) as log:
+                generator.generate_entities(workers=2)
+
+        self.assertEqual(
+            context.exception.__str__(),
+            "MOCK_TENANT: Error generating entities: faulty topology"
+        )
+        self.assertEqual(
+            log.output, [
+                f"ERROR:{LOGNAME}:MOCK_TENANT: Skipping entities generation: "
+                f"faulty topology"
+            ]
+        )
+
     def test_generate_entities_with_SITE_BDII(self):
         generator = ConfigurationGenerator(
             metrics=mock_metrics,
@@ -11913,6 +12235,39 @@ class EntityConfigurationTests(unittest.TestCase):
             ]
         )
 
+    def test_iter_entities_with_faulty_topology(self):
+        generator = ConfigurationGenerator(
+            metrics=mock_metrics,
+            profiles=["ARGO_TEST21"],
+            metric_profiles=mock_metric_profiles,
+            topology=faulty_local_topology,
+            attributes=mock_attributes,
+            secrets_file="",
+            default_ports=mock_default_ports,
+            tenant="MOCK_TENANT",
+            default_agent=["sensu-agent-mock_tenant.example.com"]
+        )
+        with self.assertLogs(LOGNAME) as log:
+            _log_dummy()
+            entities = generator.iter_entities()
+
+        self.assertEqual(log.output, DUMMY_LOG)
+
+        with self.assertRaises(GeneratorException) as context:
+            with self.assertLogs(LOGNAME) as log:
+                list(entities)
+
+        self.assertEqual(
+            context.exception.__str__(),
+            "MOCK_TENANT: Error generating entities: faulty topology"
+        )
+        self.assertEqual(
+            log.output, [
+                f"ERROR:{LOGNAME}:MOCK_TENANT: Skipping entities generation: "
+                f"faulty topology"
+            ]
+        )
+
     def test_generate_entities_with_metric_parameter_overrides(self):
         attributes = {
             "local": {
@@ -15088,6 +15443,135 @@ class AdHocCheckTests(unittest.TestCase):
             }
         )
 
+    def test_generate_adhoc_check_with_name(self):
+        check = generate_adhoc_check(
+            command="/usr/lib64/nagios/plugins/check_tcp -H argo.ni4os.eu",
+            subscriptions=["internals"], namespace="TENANT1",
+            name="adhoc-check-123-0"
+        )
+        self.assertEqual(
+            check["metadata"], {
+                "name": "adhoc-check-123-0",
+                "namespace": "TENANT1"
+            }
+        )
+
+
+class HashTests(unittest.TestCase):
+    def setUp(self):
+        self.check = {
+            "command": "/usr/lib64/nagios/plugins/check_tcp "
+                       "-H {{ .labels.hostname }} -t 120 -p 443",
+            "subscriptions": ["argo.test", "argo.webui"],
+            "handlers": [],
+            "interval": 300,
+            "timeout": 900,
+            "publish": True,
+            "metadata": {
+                "name": "generic.tcp.connect",
+                "namespace": "default",
+                "annotations": {"attempts": "3"},
+                "labels": {"tenants": "TENANT1"}
+            },
+            "round_robin": False
+        }
+
+    def test_stamp_hash(self):
+        check = copy.deepcopy(self.check)
+        stamped = stamp_hash(check)
+        self.assertEqual(check, self.check)
+        self.assertEqual(
+            stamped["metadata"]["annotations"], {
+                "attempts": "3", HASH_ANNOTATION: get_hash(self.check)
+            }
+        )
+        self.assertEqual(get_hash(stamped), get_hash(self.check))
+        self.assertEqual(stamp_hash(stamped), stamped)
+
+    def test_hash_of_equivalent_objects(self):
+        check = copy.deepcopy(self.check)
+        check.update({"subscriptions": ["argo.webui", "argo.test"]})
+        self.assertEqual(get_hash(check), get_hash(self.check))
+
+    def test_hash_of_changed_objects(self):
+        check = copy.deepcopy(self.check)
+        check["metadata"]["annotations"].update({"attempts": "4"})
+        self.assertNotEqual(get_hash(check), get_hash(self.check))
+
+        entity = {
+            "entity_class": "proxy",
+            "metadata": {
+                "name": "argo.ni4os.eu",
+                "namespace": "tenant1",
+                "labels": {"hostname": "argo.ni4os.eu"}
+            }
+        }
+        entity2 = copy.deepcopy(entity)
+        entity2["metadata"]["labels"].update({"tenants": "TENANT1"})
+        self.assertNotEqual(get_hash(entity), get_hash(entity2))
+
+
+class HelperCacheTests(unittest.TestCase):
+    @patch.dict("argo_scg.generator._worker_cache_stats", clear=True)
+    def test_cache_stats(self):
+        create_label.cache_clear()
+        for _ in range(2):
+            self.assertEqual(
+                create_label("generic.http.connect"), "generic_http_connect"
+            )
+
+        stats = get_cache_stats()
+        self.assertEqual(stats["create_label"].hits, 1)
+        self.assertEqual(stats["create_label"].misses, 1)
+        self.assertEqual(stats["create_label"].currsize, 1)
+        self.assertEqual(
+            set(stats.keys()), {
+                "create_label", "create_attribute_env", "is_attribute_secret",
+                "urlparse", "_create_metric_parameter_label",
+                "_get_single_endpoint_url", "_handle_endpoint_url"
+            }
+        )
+
+
+    @patch.dict("argo_scg.generator._worker_cache_stats", clear=True)
+    def test_cache_stats_with_worker_processes(self):
+        def get_calls():
+            return dict(
+                (name, info.hits + info.misses) for name, info in
+                get_cache_stats().items()
+            )
+
+        generator = ConfigurationGenerator(
+            metrics=mock_metrics,
+            profiles=["ARGO_TEST1", "ARGO_TEST14", "ARGO_TEST21"],
+            metric_profiles=copy.deepcopy(mock_metric_profiles),
+            topology=copy.deepcopy(
+                mock_topology + mock_topology_with_duplicate_entries
+            ),
+            attributes=mock_attributes,
+            secrets_file="",
+            default_ports=mock_default_ports,
+            tenant="MOCK_TENANT",
+            default_agent=["sensu-agent-mock_tenant.example.com"]
+        )
+        calls = get_calls()
+        generator.generate_entities(namespace="tenant")
+        calls1 = get_calls()
+        with patch(
+                "argo_scg.generator.multiprocessing.get_context",
+                wraps=multiprocessing.get_context
+        ) as mock_context:
+            generator.generate_entities(namespace="tenant", workers=3)
+
+        calls2 = get_calls()
+        mock_context.assert_called_once_with("forkserver")
+        self.assertGreater(calls1["create_label"], calls["create_label"])
+        # each partition is generated on its own, so the helpers are called
+        # at least as many times as in a single process
+        for name in calls.keys():
+            self.assertGreaterEqual(
+                calls2[name] - calls1[name], calls1[name] - calls[name]
+            )
 
 class ConfigurationMergerTests(unittest.TestCase):
     def setUp(self):
@@ -15988,6 +16472,83 @@ class ConfigurationMergerTests(unittest.TestCase):
             ]
         )
 
+    def test_merge_with_three_tenants(self):
+        def check(tenant):
+            return {
+                "command": "/usr/lib64/nagios/plugins/check_tcp -H "
+                           "{{ .labels.hostname }} -t 120 -p 443",
+                "subscriptions": ["argo.test"],
+                "metadata": {
+                    "name": "generic.tcp.connect",
+                    "labels": {"tenants": tenant}
+                }
+            }
+
+        def entity(tenant, site):
+            return {
+                "entity_class": "proxy",
+                "metadata": {
+                    "name": "argo.test__argo.ni4os.eu",
+                    "labels": {
+                        "hostname": "argo.ni4os.eu",
+                        "site": site,
+                        "tenants": tenant
+                    }
+                }
+            }
+
+        merger = ConfigurationMerger(
+            checks={
+                "TENANT3": [check("TENANT3")],
+                "TENANT1": [check("TENANT1")],
+                "TENANT2": [check("TENANT2")]
+            },
+            entities={
+                "TENANT3": [entity("TENANT3", "SITE2")],
+                "TENANT1": [entity("TENANT1", "SITE1")],
+                "TENANT2": [entity("TENANT2", "SITE2")]
+            },
+            internal_services={
+                "TENANT1": "", "TENANT2": "", "TENANT3": ""
+            },
+            attributeoverrides4agents={
+                "TENANT3": [{
+                    "hostname": "agent1", "attribute": "ROBOT_CERT",
+                    "value": "/etc/robot.pem", "metrics": ["metric3"]
+                }],
+                "TENANT1": [{
+                    "hostname": "agent1", "attribute": "ROBOT_CERT",
+                    "value": "/etc/robot.pem", "metrics": ["metric1"]
+                }],
+                "TENANT2": [{
+                    "hostname": "agent1", "attribute": "ROBOT_CERT",
+                    "value": "/etc/robot.pem", "metrics": ["metric2"]
+                }]
+            }
+        )
+        checks = merger.merge_checks()
+        entities = merger.merge_entities()
+        self.assertEqual(len(checks), 1)
+        self.assertEqual(
+            checks[0]["metadata"]["labels"]["tenants"],
+            "TENANT1,TENANT2,TENANT3"
+        )
+        self.assertEqual(len(entities), 1)
+        self.assertEqual(
+            entities[0]["metadata"]["labels"], {
+                "hostname": "argo.ni4os.eu",
+                "site": "SITE1,SITE2,SITE2",
+                "tenants": "TENANT1,TENANT2,TENANT3"
+            }
+        )
+        self.assertEqual(
+            merger.merge_attribute_overrides(), [{
+                "hostname": "agent1", "attribute": "ROBOT_CERT",
+                "value": "/etc/robot.pem",
+                "metrics": ["metric1", "metric2", "metric3"]
+            }]
+        )
+
     def test_merge_internal_services(self):
         merger = ConfigurationMerger(
             checks={
@@ -2,6 +2,7 @@ import logging
 import unittest
 from unittest.mock import patch
 
+from argo_scg.metric import MetricSpec
 from argo_scg.poem import Poem, PoemException
 
 from utils import MockResponse
@@ -403,7 +404,7 @@ class PoemTests(unittest.TestCase):
         )
         self.logname = "argo-scg.poem"
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_metrics(self, mock_request):
         mock_request.side_effect = mock_poem_metrics_request
         with self.assertLogs(self.logname) as log:
@@ -421,7 +422,7 @@ class PoemTests(unittest.TestCase):
         self.assertEqual(metrics, metrics2)
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_metrics_with_error_with_msg(self, mock_request):
         mock_request.side_effect = mock_poem_request_with_error_with_msg
         with self.assertRaises(PoemException) as context:
@@ -443,7 +444,7 @@ class PoemTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_metrics_with_error_without_msg(self, mock_request):
         mock_request.side_effect = mock_poem_request_with_error_without_msg
         with self.assertRaises(PoemException) as context:
@@ -464,7 +465,7 @@ class PoemTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_metrics_with_error_in_config(self, mock_request):
         mock_request.side_effect = mock_poem_metrics_request_error_param
         with self.assertLogs(self.logname) as log:
@@ -487,7 +488,69 @@ class PoemTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
+    def test_get_compact_metrics(self, mock_request):
+        mock_request.side_effect = mock_poem_metrics_request
+        with self.assertLogs(self.logname) as log:
+            _log_dummy()
+            metrics = self.poem.get_metrics_configurations(compact=True)
+        mock_request.assert_called_once_with(
+            "https://mock.poem.url/api/v2/metrics",
+            headers={'x-api-key': 'P03mt0k3n'}
+        )
+        self.assertEqual(
+            sorted(metrics.keys()),
+            sorted(name for metric in mock_metrics for name in metric.keys())
+        )
+        for metric in mock_metrics:
+            for name, configuration in metric.items():
+                spec = metrics[name]
+                self.assertIsInstance(spec, MetricSpec)
+                self.assertEqual(spec.name, name)
+                self.assertEqual(spec.tags, frozenset(configuration["tags"]))
+                self.assertEqual(
+                    spec.flags, frozenset(configuration["flags"].keys())
+                )
+                self.assertEqual(spec["probe"], configuration["probe"])
+                self.assertEqual(
+                    spec["config"]["path"], "/usr/lib64/nagios/plugins"
+                )
+                self.assertEqual(
+                    spec.interval, int(configuration["config"]["interval"])
+                )
+                self.assertEqual(
+                    spec.max_check_attempts,
+                    int(configuration["config"]["maxCheckAttempts"])
+                )
+                self.assertEqual(spec["attribute"], configuration["attribute"])
+                self.assertEqual(spec["parameter"], configuration["parameter"])
+                self.assertEqual(spec["parent"], configuration["parent"])
+                with self.assertRaises(KeyError):
+                    spec["name"]
+
+        self.assertEqual(log.output, DUMMY_LOG)
+
+    @patch("argo_scg.session.Session.get")
+    def test_get_compact_metrics_with_error_in_config(self, mock_request):
+        mock_request.side_effect = mock_poem_metrics_request_error_param
+        with self.assertLogs(self.logname) as log:
+            metrics = self.poem.get_metrics_configurations(compact=True)
+        self.assertEqual(
+            sorted(metrics.keys()), sorted([
+                name for metric in [
+                    mock_metrics_with_config_error[0],
+                    mock_metrics_with_config_error[2]
+                ] for name in metric.keys()
+            ])
+        )
+        self.assertEqual(
+            log.output, [
+                f"WARNING:{self.logname}:MOCK_TENANT: "
+                f"Metric generic.http.connect skipped: Missing key 'path'"
+            ]
+        )
+
+    @patch("argo_scg.session.Session.get")
     def test_get_metric_overrides(self, mock_request):
         mock_request.side_effect = mock_poem_metric_overrides_request
         with self.assertLogs(self.logname) as log:
@@ -501,7 +564,7 @@ class PoemTests(unittest.TestCase):
         self.assertEqual(overrides, mock_metric_overrides)
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_metric_overrides_with_error_with_msg(self, mock_request):
         mock_request.side_effect = mock_poem_request_with_error_with_msg
         with self.assertLogs(self.logname) as log:
@@ -524,7 +587,7 @@ class PoemTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_metric_overrides_with_error_without_msg(self, mock_request):
         mock_request.side_effect = mock_poem_request_with_error_without_msg
         with self.assertLogs(self.logname) as log:
@@ -546,7 +609,7 @@ class PoemTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_default_ports(self, mock_request):
         mock_request.side_effect = mock_poem_default_ports_request
         with self.assertLogs(self.logname) as log:
@@ -560,7 +623,7 @@ class PoemTests(unittest.TestCase):
         self.assertEqual(ports, mock_default_ports)
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_default_ports_with_error_with_msg(self, mock_request):
         mock_request.side_effect = mock_poem_request_with_error_with_msg
         with self.assertLogs(self.logname) as log:
@@ -583,7 +646,7 @@ class PoemTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_default_ports_with_error_without_msg(self, mock_request):
         mock_request.side_effect = mock_poem_request_with_error_without_msg
         with self.assertLogs(self.logname) as log:
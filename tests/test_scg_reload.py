@@ -0,0 +1,519 @@
+import concurrent.futures
+import importlib.machinery
+import importlib.util
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+from argo_scg.exceptions import GeneratorException, SensuException, \
+    WebApiException
+from argo_scg.sensu import Sensu
+from argo_scg.state import State
+
+LOGNAME = "argo-scg"
+
+SCRIPT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "exec", "scg-reload.py"
+)
+
+
+def load_script():
+    loader = importlib.machinery.SourceFileLoader("scg_reload", SCRIPT)
+    spec = importlib.util.spec_from_loader("scg_reload", loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+scg_reload = load_script()
+
+mock_check = {
+    "command": "/usr/lib64/nagios/plugins/check_tcp "
+               "-H {{ .labels.hostname }} -t 120 -p 443",
+    "subscriptions": ["argo.test"],
+    "handlers": [],
+    "interval": 300,
+    "timeout": 900,
+    "publish": True,
+    "metadata": {
+        "name": "generic.tcp.connect",
+        "namespace": "tenant1",
+        "annotations": {"attempts": "3"},
+        "labels": {"tenants": "TENANT1"}
+    },
+    "round_robin": False
+}
+
+mock_topology = [{
+    "date": "2023-03-14",
+    "group": "APEL-Site1",
+    "type": "SITES",
+    "service": "generic.tcp.connect",
+    "hostname": "test.argo.grnet.gr",
+    "notifications": None,
+    "tags": {"monitored": "1", "production": "1", "scope": "EGI"}
+}]
+
+mock_metric_profiles = [{
+    "id": "669e3b5e-bd8f-4b45-a6b6-0fb4a7ce1c05",
+    "date": "2023-03-14",
+    "name": "ARGO_TEST1",
+    "description": "Profile for unit tests",
+    "services": [{
+        "service": "generic.tcp.connect",
+        "metrics": ["generic.tcp.connect"]
+    }]
+}]
+
+config_file = """[GENERAL]
+sensu_url = http://sensu.mock.url/
+sensu_token = s3ns8t0k3n
+webapi_url = https://web-api.mock.url/
+state_dir = {directory}/state
+cache_dir = {directory}/cache
+
+[TENANT1]
+poem_url = https://tenant1.poem.mock.url/
+poem_token = p03mt0k3n1
+webapi_token = w3b4p1t0k3n1
+metricprofiles = ARGO_TEST1
+publish = false
+
+[TENANT2]
+poem_url = https://tenant2.poem.mock.url/
+poem_token = p03mt0k3n2
+webapi_token = w3b4p1t0k3n2
+metricprofiles = ARGO_TEST1
+publish = false
+
+[TENANT3]
+poem_url = https://tenant3.poem.mock.url/
+poem_token = p03mt0k3n3
+webapi_token = w3b4p1t0k3n3
+metricprofiles = ARGO_TEST1
+publish = false
+
+[TENANT4]
+namespace = TENANT3
+poem_url = https://tenant4.poem.mock.url/
+poem_token = p03mt0k3n4
+webapi_token = w3b4p1t0k3n4
+metricprofiles = ARGO_TEST1
+publish = false
+"""
+
+mock_agents = [{
+    "metadata": {"name": "sensu-agent1", "namespace": "tenant1"}
+}]
+
+
+def mock_generate_configuration(
+        namespace, tenant, inputs, settings, stream=False
+):
+    return {
+        "checks": iter([mock_check]) if stream else [mock_check],
+        "entities": iter([]) if stream else [],
+        "internal_services": "",
+        "metric_overrides": [],
+        "attribute_overrides": []
+    }
+
+
+class SyncNamespaceTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.state = State(directory=os.path.join(self.directory, "state"))
+        self.cache = MagicMock()
+        self.settings = {
+            "webapi_url": "https://api.devel.argo.grnet.gr",
+            "webapi_tokens": {"TENANT1": "w3b4p1t0k3n"},
+            "topo_groups_filter": {"TENANT1": None},
+            "topo_endpoints_filter": {"TENANT1": "tags=monitored:1"},
+            "poem_urls": {"TENANT1": "https://tenant1.poem.argo.grnet.gr"},
+            "poem_tokens": {"TENANT1": "p03mt0k3n"},
+            "local_topology": {"TENANT1": ""},
+            "publish": {"TENANT1": False},
+            "secrets": {"TENANT1": ""},
+            "metricprofiles": {"TENANT1": ["ARGO_TEST1"]},
+            "skipped_metrics": {"TENANT1": []},
+            "agents_configurations": {"TENANT1": ""}
+        }
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+        webapi_patcher = patch.object(scg_reload, "WebApi")
+        self.mock_webapi = webapi_patcher.start()
+        self.addCleanup(webapi_patcher.stop)
+        webapi = self.mock_webapi.return_value
+        webapi.get_topology.return_value = mock_topology
+        webapi.get_metric_profiles.return_value = mock_metric_profiles
+
+        poem_patcher = patch.object(scg_reload, "Poem")
+        self.mock_poem = poem_patcher.start()
+        self.addCleanup(poem_patcher.stop)
+        poem = self.mock_poem.return_value
+        poem.get_metrics_configurations.return_value = [
+            {"generic.tcp.connect": {"probe": "check_tcp"}}
+        ]
+        poem.get_metric_overrides.return_value = []
+        poem.get_default_ports.return_value = {"SSH_PORT": "22"}
+
+        self.sensu = MagicMock()
+        self.sensu.get_agents.return_value = mock_agents
+
+    def tearDown(self):
+        self.executor.shutdown()
+        shutil.rmtree(self.directory)
+
+    def sync(self, sensu=None, full=False):
+        scg_reload.sync_namespace(
+            namespace="tenant1", tenants=["TENANT1"],
+            sensu=sensu if sensu else self.sensu, settings=self.settings,
+            state=self.state, cache=self.cache, executor=self.executor,
+            full=full
+        )
+
+    @patch("argo_scg.session.Session.delete")
+    @patch("argo_scg.session.Session.patch")
+    @patch("argo_scg.session.Session.post")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.session.Session.get")
+    def test_sync_with_generator_error_mid_stream(
+            self, mock_get, mock_put, mock_post, mock_patch, mock_delete
+    ):
+        def generate_checks():
+            yield mock_check
+            raise GeneratorException("Error generating checks")
+
+        def generate_configuration(
+                namespace, tenant, inputs, settings, stream=False
+        ):
+            return {
+                "checks": generate_checks(),
+                "entities": iter([]),
+                "internal_services": "",
+                "metric_overrides": [],
+                "attribute_overrides": []
+            }
+
+        sensu = Sensu(
+            url="https://sensu.mock.com:8080", token="t0k3n",
+            namespaces=["tenant1"]
+        )
+        with patch.object(sensu, "get_agents", return_value=mock_agents):
+            with patch.object(
+                    scg_reload, "generate_configuration",
+                    side_effect=generate_configuration
+            ):
+                with self.assertLogs(LOGNAME) as log:
+                    self.sync(sensu=sensu)
+
+        self.assertFalse(mock_get.called)
+        self.assertFalse(mock_put.called)
+        self.assertFalse(mock_post.called)
+        self.assertFalse(mock_patch.called)
+        self.assertFalse(mock_delete.called)
+        self.assertEqual(
+            log.output,
+            [f"WARNING:{LOGNAME}:tenant1: Skipping configuration..."]
+        )
+        self.assertEqual(os.listdir(self.directory), ["state"])
+        self.assertEqual(os.listdir(self.state.directory), [])
+
+    def test_sync_with_prefetched_inputs(self):
+        with patch.object(
+                scg_reload, "generate_configuration",
+                side_effect=mock_generate_configuration
+        ) as mock_generate:
+            with self.assertLogs(LOGNAME) as log:
+                self.sync()
+
+        self.mock_webapi.assert_called_once_with(
+            url="https://api.devel.argo.grnet.gr",
+            token="w3b4p1t0k3n",
+            tenant="TENANT1",
+            topo_groups_filter=None,
+            topo_endpoints_filter="tags=monitored:1",
+            cache=self.cache
+        )
+        self.mock_poem.assert_called_once_with(
+            url="https://tenant1.poem.argo.grnet.gr",
+            token="p03mt0k3n",
+            tenant="TENANT1",
+            cache=self.cache
+        )
+        poem = self.mock_poem.return_value
+        poem.get_metrics_configurations.assert_called_once_with(compact=True)
+        self.sensu.invalidate_snapshot.assert_called_once_with(
+            namespace="tenant1"
+        )
+        self.sensu.get_agents.assert_called_once_with(namespace="tenant1")
+        mock_generate.assert_called_once_with(
+            namespace="tenant1", tenant="TENANT1", inputs={
+                "metrics": [{"generic.tcp.connect": {"probe": "check_tcp"}}],
+                "metric_profiles": mock_metric_profiles,
+                "topology": mock_topology,
+                "attributes": [],
+                "default_ports": {"SSH_PORT": "22"},
+                "default_agent": ["sensu-agent1"],
+                "agents_config": None
+            }, settings=self.settings, stream=True
+        )
+        self.assertEqual(self.sensu.handle_checks.call_count, 1)
+        self.assertEqual(
+            log.output, [f"INFO:{LOGNAME}:tenant1: All synced!"]
+        )
+
+    def test_sync_with_local_topology(self):
+        filename = os.path.join(self.directory, "topology.json")
+        with open(filename, "w") as f:
+            json.dump(mock_topology, f)
+
+        self.settings["local_topology"]["TENANT1"] = filename
+        with patch.object(
+                scg_reload, "generate_configuration",
+                side_effect=mock_generate_configuration
+        ) as mock_generate:
+            with self.assertLogs(LOGNAME) as log:
+                self.sync()
+
+        self.assertFalse(self.mock_webapi.return_value.get_topology.called)
+        self.assertEqual(
+            mock_generate.call_args[1]["inputs"]["topology"], mock_topology
+        )
+        self.assertEqual(
+            log.output, [f"INFO:{LOGNAME}:tenant1: All synced!"]
+        )
+
+    def test_sync_with_prefetch_error(self):
+        self.mock_webapi.side_effect = WebApiException(
+            "TENANT1: Error creating Web-API session"
+        )
+        with patch.object(
+                scg_reload, "generate_configuration",
+                side_effect=mock_generate_configuration
+        ) as mock_generate:
+            with self.assertLogs(LOGNAME) as log:
+                self.sync()
+
+        self.assertFalse(mock_generate.called)
+        self.assertFalse(self.sensu.handle_checks.called)
+        self.assertEqual(
+            log.output,
+            [f"WARNING:{LOGNAME}:tenant1: Skipping configuration..."]
+        )
+
+    def test_sync_with_missing_tenant_settings(self):
+        self.settings["webapi_tokens"] = dict()
+        with patch.object(
+                scg_reload, "generate_configuration",
+                side_effect=mock_generate_configuration
+        ) as mock_generate:
+            with self.assertLogs(LOGNAME) as log:
+                self.sync()
+
+        self.assertFalse(mock_generate.called)
+        self.assertFalse(self.sensu.handle_checks.called)
+        self.assertEqual(
+            log.output,
+            [f"WARNING:{LOGNAME}:tenant1: 'TENANT1' Skipping configuration..."]
+        )
+
+    def test_sync_with_failing_prefetch_request(self):
+        self.mock_webapi.return_value.get_topology.side_effect = \
+            WebApiException("TENANT1: Topology fetch error")
+        with patch.object(
+                scg_reload, "generate_configuration",
+                side_effect=mock_generate_configuration
+        ) as mock_generate:
+            with self.assertLogs(LOGNAME) as log:
+                self.sync()
+
+        self.assertFalse(mock_generate.called)
+        self.assertFalse(self.sensu.handle_checks.called)
+        self.assertEqual(
+            log.output,
+            [f"WARNING:{LOGNAME}:tenant1: Skipping configuration..."]
+        )
+
+    def test_sync_with_stored_configuration(self):
+        synced = list()
+        self.sensu.handle_checks.side_effect = \
+            lambda checks, namespace: synced.append(
+                [check["metadata"]["name"] for check in checks]
+            )
+        with patch.object(
+                scg_reload, "generate_configuration",
+                side_effect=mock_generate_configuration
+        ) as mock_generate:
+            self.sync()
+            self.sync()
+
+        self.assertEqual(mock_generate.call_count, 1)
+        self.assertEqual(
+            synced, [["generic.tcp.connect"], ["generic.tcp.connect"]]
+        )
+
+    def test_sync_with_different_state_version(self):
+        with patch.object(
+                scg_reload, "generate_configuration",
+                side_effect=mock_generate_configuration
+        ) as mock_generate:
+            self.sync()
+            with patch.object(
+                    scg_reload, "STATE_VERSION", scg_reload.STATE_VERSION + 1
+            ):
+                self.sync()
+                self.sync()
+
+        self.assertEqual(mock_generate.call_count, 2)
+        self.assertEqual(self.sensu.handle_checks.call_count, 3)
+
+
+class MainTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.conf = os.path.join(self.directory, "scg.conf")
+        with open(self.conf, "w") as f:
+            f.write(config_file.format(directory=self.directory))
+
+        self.synced = list()
+
+        def handle_checks(checks, namespace):
+            self.synced.append((namespace, [
+                check["metadata"]["name"] for check in checks
+            ]))
+
+        patchers = [
+            patch.object(scg_reload, "Sensu"),
+            patch.object(scg_reload, "WebApi"),
+            patch.object(scg_reload, "Poem"),
+            patch.object(
+                scg_reload, "get_logger",
+                side_effect=lambda thread_names, debug:
+                logging.getLogger(LOGNAME)
+            )
+        ]
+        self.mock_sensu, self.mock_webapi, self.mock_poem, _ = [
+            patcher.start() for patcher in patchers
+        ]
+        for patcher in patchers:
+            self.addCleanup(patcher.stop)
+
+        sensu = self.mock_sensu.return_value
+        sensu.get_agents.return_value = mock_agents
+        sensu.handle_checks.side_effect = handle_checks
+        webapi = self.mock_webapi.return_value
+        webapi.get_topology.return_value = mock_topology
+        webapi.get_metric_profiles.return_value = mock_metric_profiles
+        poem = self.mock_poem.return_value
+        poem.get_metrics_configurations.return_value = [
+            {"generic.tcp.connect": {"probe": "check_tcp"}}
+        ]
+        poem.get_metric_overrides.return_value = []
+        poem.get_default_ports.return_value = {"SSH_PORT": "22"}
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def run_main(self, workers):
+        with patch.object(
+                sys, "argv",
+                ["scg-reload.py", "-c", self.conf, "-w", str(workers)]
+        ):
+            with self.assertLogs(LOGNAME) as log:
+                scg_reload.main()
+
+        return log.output
+
+    def test_main_with_workers(self):
+        with patch.object(
+                scg_reload, "generate_configuration",
+                side_effect=mock_generate_configuration
+        ) as mock_generate:
+            output = self.run_main(workers=2)
+
+        self.assertEqual(
+            sorted(self.synced), [
+                ("TENANT1", ["generic.tcp.connect"]),
+                ("TENANT2", ["generic.tcp.connect"]),
+                ("TENANT3", ["generic.tcp.connect"])
+            ]
+        )
+        self.assertEqual(
+            sorted(call[1]["tenant"] for call in mock_generate.call_args_list),
+            ["TENANT1", "TENANT2", "TENANT3", "TENANT4"]
+        )
+        self.assertEqual(
+            sorted(output), sorted([
+                f"INFO:{LOGNAME}:Started",
+                f"INFO:{LOGNAME}:TENANT1: All synced!",
+                f"INFO:{LOGNAME}:TENANT2: All synced!",
+                f"INFO:{LOGNAME}:TENANT3: All synced!",
+                f"INFO:{LOGNAME}:Done"
+            ])
+        )
+
+    def test_main_with_workers_and_generator_error(self):
+        def generate_configuration(
+                namespace, tenant, inputs, settings, stream=False
+        ):
+            if tenant == "TENANT2":
+                raise GeneratorException("TENANT2: Error generating checks")
+
+            return mock_generate_configuration(
+                namespace=namespace, tenant=tenant, inputs=inputs,
+                settings=settings, stream=stream
+            )
+
+        with patch.object(
+                scg_reload, "generate_configuration",
+                side_effect=generate_configuration
+        ):
+            output = self.run_main(workers=2)
+
+        self.assertEqual(
+            sorted(self.synced), [
+                ("TENANT1", ["generic.tcp.connect"]),
+                ("TENANT3", ["generic.tcp.connect"])
+            ]
+        )
+        self.assertEqual(
+            sorted(output), sorted([
+                f"INFO:{LOGNAME}:Started",
+                f"INFO:{LOGNAME}:TENANT1: All synced!",
+                f"WARNING:{LOGNAME}:TENANT2: Skipping configuration...",
+                f"INFO:{LOGNAME}:TENANT3: All synced!",
+                f"INFO:{LOGNAME}:Done"
+            ])
+        )
+
+    def test_main_with_workers_and_sensu_error(self):
+        def add_cpu_check(namespace):
+            if namespace == "TENANT1":
+                raise SensuException("TENANT1: Check create error")
+
+        self.mock_sensu.return_value.add_cpu_check.side_effect = add_cpu_check
+        with patch.object(
+                scg_reload, "generate_configuration",
+                side_effect=mock_generate_configuration
+        ):
+            output = self.run_main(workers=3)
+
+        self.assertEqual(
+            sorted(namespace for namespace, _ in self.synced),
+            ["TENANT1", "TENANT2", "TENANT3"]
+        )
+        self.assertEqual(
+            sorted(output), sorted([
+                f"INFO:{LOGNAME}:Started",
+                f"WARNING:{LOGNAME}:TENANT1: Skipping configuration...",
+                f"INFO:{LOGNAME}:TENANT2: All synced!",
+                f"INFO:{LOGNAME}:TENANT3: All synced!",
+                f"INFO:{LOGNAME}:Done"
+            ])
+        )
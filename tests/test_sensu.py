@@ -5,8 +5,14 @@ import subprocess
 import unittest
 from unittest.mock import patch, call
 
+import requests
+
 from argo_scg.exceptions import SensuException, SCGWarnException
-from argo_scg.sensu import Sensu, MetricOutput, SensuCtl
+from argo_scg.generator import HASH_ANNOTATION, generate_adhoc_check, \
+    stamp_hash
+from argo_scg.sensu import (
+    Sensu, MetricOutput, SensuCtl, SELECTOR_MAX_VALUES
+)
 
 from utils import MockResponse
 
@@ -3536,6 +3542,30 @@ def mock_sensu_request_events_not_ok_without_msg(*args, **kwargs):
         return MockResponse(mock_namespaces, status_code=200)
 
 
+def mock_sensu_object_request(checks=None, entities=None, events=None):
+    objects = dict()
+    for check in checks or list():
+        objects.update({f"checks/{check['metadata']['name']}": check})
+
+    for entity in entities or list():
+        objects.update({f"entities/{entity['metadata']['name']}": entity})
+
+    for event in events or list():
+        objects.update({
+            f"events/{event['entity']['metadata']['name']}/"
+            f"{event['check']['metadata']['name']}": event
+        })
+
+    def request(*args, **kwargs):
+        path = args[0].split("/namespaces/")[1].split("/", 1)[1]
+        if path in objects:
+            return MockResponse(objects[path], status_code=200)
+
+        return MockResponse({"message": "resource not found"}, status_code=404)
+
+    return request
+
+
 def mock_sensu_request_namespaces_not_ok_with_msg(*args, **kwargs):
     if args[0].endswith("entities"):
         return MockResponse(mock_entities, status_code=200)
@@ -3650,6 +3680,10 @@ def mock_delete_response_entity_not_ok_without_msg(*args, **kwargs):
     return MockResponse(None, status_code=400)
 
 
+def mock_delete_objects(checks=None, entities=None, namespace="default"):
+    return set(checks if checks is not None else entities)
+
+
 def mock_function(*args, **kwargs):
     pass
 
@@ -3665,6 +3699,13 @@ def mock_silenced_entry_delete_exception(*args, **kwargs):
         )
 
 
+def mock_silenced_entries_delete_exception(*args, **kwargs):
+    raise SCGWarnException(
+        "Silenced entry entity:argo.ni4os.eu:generic.tcp.connect "
+        "(400 BAD REQUEST: Something went wrong) not removed"
+    )
+
+
 class SensuNamespaceTests(unittest.TestCase):
     def setUp(self):
         self.sensu = Sensu(
@@ -3678,7 +3719,7 @@ class SensuNamespaceTests(unittest.TestCase):
             }
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_namespaces(self, mock_get):
         mock_get.side_effect = mock_sensu_request
         with self.assertLogs(LOGNAME) as log:
@@ -3694,7 +3735,7 @@ class SensuNamespaceTests(unittest.TestCase):
         self.assertEqual(sorted(namespaces), ["default", "tenant1", "tenant2"])
         self.assertEqual(log.output, [f"INFO:{LOGNAME}:dummy"])
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_namespaces_with_error_with_message(self, mock_get):
         mock_get.side_effect = mock_sensu_request_namespaces_not_ok_with_msg
         with self.assertRaises(SensuException) as context:
@@ -3721,7 +3762,7 @@ class SensuNamespaceTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_namespaces_with_error_without_message(self, mock_get):
         mock_get.side_effect = mock_sensu_request_namespaces_not_ok_without_msg
         with self.assertRaises(SensuException) as context:
@@ -3747,7 +3788,7 @@ class SensuNamespaceTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu._get_namespaces")
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     def test_handle_namespaces(self, mock_put, mock_namespace):
         mock_put.side_effect = mock_post_response
         mock_namespace.return_value = ["Tenant1", "Tenant2"]
@@ -3780,7 +3821,7 @@ class SensuNamespaceTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu._get_namespaces")
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     def test_handle_namespaces_with_error_with_message(
             self, mock_put, mock_namespace
     ):
@@ -3811,7 +3852,7 @@ class SensuNamespaceTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu._get_namespaces")
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     def test_handle_namespaces_with_error_without_message(
             self, mock_put, mock_namespace
     ):
@@ -3842,8 +3883,8 @@ class SensuNamespaceTests(unittest.TestCase):
 
     @patch("argo_scg.sensu.Sensu._get_namespaces")
     @patch("subprocess.check_output")
-    @patch("requests.delete")
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.delete")
+    @patch("argo_scg.session.Session.put")
     def test_handle_namespaces_with_deletion(
             self, mock_put, mock_delete, mock_subprocess, mock_namespace
     ):
@@ -3891,8 +3932,8 @@ class SensuNamespaceTests(unittest.TestCase):
 
     @patch("argo_scg.sensu.Sensu._get_namespaces")
     @patch("argo_scg.sensu.subprocess.check_output")
-    @patch("requests.delete")
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.delete")
+    @patch("argo_scg.session.Session.put")
     def test_handle_namespaces_with_deletion_subprocess_error(
             self, mock_put, mock_delete, mock_subprocess, mock_namespace
     ):
@@ -3939,8 +3980,8 @@ class SensuNamespaceTests(unittest.TestCase):
 
     @patch("argo_scg.sensu.Sensu._get_namespaces")
     @patch("subprocess.check_output")
-    @patch("requests.delete")
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.delete")
+    @patch("argo_scg.session.Session.put")
     def test_handle_namespaces_with_deletion_error_delete_api_with_msg(
             self, mock_put, mock_delete, mock_subprocess, mock_namespace
     ):
@@ -3991,8 +4032,8 @@ class SensuNamespaceTests(unittest.TestCase):
 
     @patch("argo_scg.sensu.Sensu._get_namespaces")
     @patch("subprocess.check_output")
-    @patch("requests.delete")
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.delete")
+    @patch("argo_scg.session.Session.put")
     def test_handle_namespaces_with_deletion_error_delete_api_without_msg(
             self, mock_put, mock_delete, mock_subprocess, mock_namespace
     ):
@@ -4149,7 +4190,7 @@ class SensuCheckTests(unittest.TestCase):
             }
         ]
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_checks(self, mock_get):
         mock_get.side_effect = mock_sensu_request
         with self.assertLogs(LOGNAME) as log:
@@ -4167,7 +4208,7 @@ class SensuCheckTests(unittest.TestCase):
         self.assertEqual(checks, mock_checks)
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_checks_with_error_with_messsage(self, mock_get):
         mock_get.side_effect = mock_sensu_request_check_not_ok_with_msg
 
@@ -4195,7 +4236,7 @@ class SensuCheckTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_checks_with_error_without_messsage(self, mock_get):
         mock_get.side_effect = mock_sensu_request_check_not_ok_without_msg
 
@@ -4222,8 +4263,8 @@ class SensuCheckTests(unittest.TestCase):
             ]
         )
 
-    @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.sensu.Sensu._delete_silenced_entries")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_checks(self, mock_delete, mock_delete_silenced):
         mock_delete.side_effect = mock_delete_response
         mock_delete_silenced.side_effect = mock_function
@@ -4260,25 +4301,17 @@ class SensuCheckTests(unittest.TestCase):
                 }
             )
         ], any_order=True)
-        self.assertEqual(mock_delete_silenced.call_count, 3)
-        mock_delete_silenced.assert_has_calls([
-            call(check="generic.tcp.connect", namespace="tenant1"),
-            call(check="generic.http.connect", namespace="tenant1"),
-            call(check="generic.certificate.validity", namespace="tenant1")
-        ])
-        self.assertEqual(
-            set(log.output), {
-                f"INFO:{LOGNAME}:tenant1: "
-                f"Check generic.tcp.connect removed",
-                f"INFO:{LOGNAME}:tenant1: "
-                f"Check generic.http.connect removed",
-                f"INFO:{LOGNAME}:tenant1: "
-                f"Check generic.certificate.validity removed"
-            }
+        mock_delete_silenced.assert_called_once_with(
+            checks=[
+                "generic.tcp.connect",
+                "generic.http.connect",
+                "generic.certificate.validity"
+            ],
+            namespace="tenant1"
         )
 
-    @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.sensu.Sensu._delete_silenced_entries")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_checks_with_error_with_message(
             self, mock_delete, mock_delete_silenced
     ):
@@ -4288,7 +4321,7 @@ class SensuCheckTests(unittest.TestCase):
         ]
         mock_delete_silenced.side_effect = mock_function
         with self.assertLogs(LOGNAME) as log:
-            self.sensu._delete_checks(
+            removed = self.sensu._delete_checks(
                 checks=["generic.tcp.connect", "generic.http.connect"],
                 namespace="tenant1"
             )
@@ -4310,7 +4343,10 @@ class SensuCheckTests(unittest.TestCase):
             )
         ], any_order=True)
         mock_delete_silenced.assert_called_once_with(
-            check="generic.http.connect", namespace="tenant1"
+            checks=[
+                "generic.http.connect"
+            ],
+            namespace="tenant1"
         )
         self.assertEqual(
             set(log.output), {
@@ -4321,9 +4357,10 @@ class SensuCheckTests(unittest.TestCase):
                 f"Check generic.http.connect removed"
             }
         )
+        self.assertEqual(removed, {"generic.http.connect"})
 
-    @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.sensu.Sensu._delete_silenced_entries")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_checks_with_error_without_message(
             self, mock_delete, mock_delete_silenced
     ):
@@ -4355,7 +4392,10 @@ class SensuCheckTests(unittest.TestCase):
             )
         ], any_order=True)
         mock_delete_silenced.assert_called_once_with(
-            check="generic.http.connect", namespace="tenant1"
+            checks=[
+                "generic.http.connect"
+            ],
+            namespace="tenant1"
         )
         self.assertEqual(
             set(log.output), {
@@ -4367,13 +4407,14 @@ class SensuCheckTests(unittest.TestCase):
             }
         )
 
-    @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.sensu.Sensu._delete_silenced_entries")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_checks_with_error_with_silenced_entries(
             self, mock_delete, mock_delete_silenced
     ):
         mock_delete.side_effect = mock_delete_response
-        mock_delete_silenced.side_effect = mock_silenced_entry_delete_exception
+        mock_delete_silenced.side_effect = \
+            mock_silenced_entries_delete_exception
         with self.assertLogs(LOGNAME) as log:
             self.sensu._delete_checks(
                 checks=[
@@ -4407,28 +4448,17 @@ class SensuCheckTests(unittest.TestCase):
                 }
             )
         ], any_order=True)
-        self.assertEqual(mock_delete_silenced.call_count, 3)
-        mock_delete_silenced.assert_has_calls([
-            call(check="generic.tcp.connect", namespace="tenant1"),
-            call(check="generic.http.connect", namespace="tenant1"),
-            call(check="generic.certificate.validity", namespace="tenant1")
-        ])
-        self.assertEqual(
-            set(log.output), {
-                f"INFO:{LOGNAME}:tenant1: "
-                f"Check generic.tcp.connect removed",
-                f"INFO:{LOGNAME}:tenant1: "
-                f"Check generic.http.connect removed",
-                f"INFO:{LOGNAME}:tenant1: "
-                f"Check generic.certificate.validity removed",
-                f"WARNING:{LOGNAME}:tenant1: Silenced entry "
-                f"entity:argo.ni4os.eu:generic.tcp.connect "
-                f"(400 BAD REQUEST: Something went wrong) not removed"
-            }
+        mock_delete_silenced.assert_called_once_with(
+            checks=[
+                "generic.tcp.connect",
+                "generic.http.connect",
+                "generic.certificate.validity"
+            ],
+            namespace="tenant1"
         )
 
     @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_single_check(self, mock_delete, mock_delete_silenced):
         mock_delete.side_effect = mock_delete_response
         mock_delete_silenced.side_effect = mock_function
@@ -4447,7 +4477,7 @@ class SensuCheckTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_single_check_with_error_with_message(
             self, mock_delete, mock_delete_silenced
     ):
@@ -4474,7 +4504,7 @@ class SensuCheckTests(unittest.TestCase):
         self.assertFalse(mock_delete_silenced.called)
 
     @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_single_check_with_error_without_message(
             self, mock_delete, mock_delete_silenced
     ):
@@ -4499,7 +4529,7 @@ class SensuCheckTests(unittest.TestCase):
         self.assertFalse(mock_delete_silenced.called)
 
     @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_single_check_with_silenced_entry_error(
             self, mock_delete, mock_delete_silenced
     ):
@@ -4525,7 +4555,7 @@ class SensuCheckTests(unittest.TestCase):
             "(400 BAD REQUEST: Something went wrong) not removed"
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     @patch("argo_scg.sensu.Sensu._delete_events")
     @patch("argo_scg.sensu.Sensu._delete_checks")
     @patch("argo_scg.sensu.Sensu._fetch_events")
@@ -4541,7 +4571,7 @@ class SensuCheckTests(unittest.TestCase):
         checks3 = [checks2[0], checks2[2], checks2[3], checks2[4], checks2[5]]
         mock_get_checks.side_effect = [mock_checks, checks2, checks3]
         mock_get_events.return_value = mock_events
-        mock_delete_checks.side_effect = mock_delete_response
+        mock_delete_checks.side_effect = mock_delete_objects
         mock_delete_events.side_effect = mock_delete_response
         mock_put.side_effect = mock_post_response
 
@@ -4550,7 +4580,9 @@ class SensuCheckTests(unittest.TestCase):
 
         self.assertEqual(mock_get_checks.call_count, 3)
         mock_get_checks.assert_called_with(namespace="tenant1")
-        mock_get_events.assert_called_once_with(namespace="tenant1")
+        mock_get_events.assert_called_once_with(
+            namespace="tenant1", checks={"generic.http.status-argoui-ni4os"}
+        )
         mock_delete_checks.assert_called_once_with(
             checks=["generic.http.status-argoui-ni4os"],
             namespace="tenant1"
@@ -4592,7 +4624,7 @@ class SensuCheckTests(unittest.TestCase):
             }
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     @patch("argo_scg.sensu.Sensu._delete_events")
     @patch("argo_scg.sensu.Sensu._delete_checks")
     @patch("argo_scg.sensu.Sensu._fetch_events")
@@ -4617,7 +4649,7 @@ class SensuCheckTests(unittest.TestCase):
         checks3 = [mock_checks[0], check2]
         mock_get_checks.side_effect = [mock_checks, checks2, checks3]
         mock_get_events.return_value = mock_events
-        mock_delete_checks.side_effect = mock_delete_response
+        mock_delete_checks.side_effect = mock_delete_objects
         mock_delete_events.side_effect = mock_delete_response
         mock_put.side_effect = mock_post_response
 
@@ -4647,7 +4679,7 @@ class SensuCheckTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     @patch("argo_scg.sensu.Sensu._delete_events")
     @patch("argo_scg.sensu.Sensu._delete_checks")
     @patch("argo_scg.sensu.Sensu._fetch_events")
@@ -4722,7 +4754,7 @@ class SensuCheckTests(unittest.TestCase):
 
         mock_get_checks.side_effect = [mock_checks, checks2, checks]
         mock_get_events.return_value = mock_events
-        mock_delete_checks.side_effect = mock_delete_response
+        mock_delete_checks.side_effect = mock_delete_objects
         mock_delete_events.side_effect = mock_delete_response
         mock_put.side_effect = mock_post_response
 
@@ -4730,7 +4762,12 @@ class SensuCheckTests(unittest.TestCase):
             self.sensu.handle_checks(checks=checks, namespace="tenant1")
         self.assertEqual(mock_get_checks.call_count, 3)
         mock_get_checks.assert_called_with(namespace="tenant1")
-        mock_get_events.assert_called_once_with(namespace="tenant1")
+        mock_get_events.assert_called_once_with(
+            namespace="tenant1", checks={
+                "generic.http.ar-argoui-ni4os", "generic.tcp.connect",
+                "generic.http.status-argoui-ni4os"
+            }
+        )
         mock_delete_checks.assert_called_once_with(
             checks=[
                 "generic.http.ar-argoui-ni4os",
@@ -4782,7 +4819,7 @@ class SensuCheckTests(unittest.TestCase):
             }
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     @patch("argo_scg.sensu.Sensu._delete_events")
     @patch("argo_scg.sensu.Sensu._delete_checks")
     @patch("argo_scg.sensu.Sensu._fetch_events")
@@ -4852,7 +4889,7 @@ class SensuCheckTests(unittest.TestCase):
 
         mock_get_checks.side_effect = [mock_checks, checks2, checks]
         mock_get_events.return_value = mock_events
-        mock_delete_checks.side_effect = mock_delete_response
+        mock_delete_checks.side_effect = mock_delete_objects
         mock_delete_events.side_effect = mock_delete_response
         mock_put.side_effect = mock_post_response
 
@@ -4861,7 +4898,12 @@ class SensuCheckTests(unittest.TestCase):
 
         self.assertEqual(mock_get_checks.call_count, 3)
         mock_get_checks.assert_called_with(namespace="tenant1")
-        mock_get_events.assert_called_once_with(namespace="tenant1")
+        mock_get_events.assert_called_once_with(
+            namespace="tenant1", checks={
+                "generic.http.ar-argoui-ni4os", "generic.tcp.connect",
+                "generic.http.status-argoui-ni4os"
+            }
+        )
         mock_delete_checks.assert_called_once_with(
             checks=[
                 "generic.http.ar-argoui-ni4os",
@@ -4914,7 +4956,7 @@ class SensuCheckTests(unittest.TestCase):
             }
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     @patch("argo_scg.sensu.Sensu._delete_events")
     @patch("argo_scg.sensu.Sensu._delete_checks")
     @patch("argo_scg.sensu.Sensu._fetch_events")
@@ -4962,7 +5004,7 @@ class SensuCheckTests(unittest.TestCase):
             mock_checks_small, checks2, no_proxy_checks
         ]
         mock_get_events.return_value = [mock_events[0], mock_events[1]]
-        mock_delete_checks.side_effect = mock_delete_response
+        mock_delete_checks.side_effect = mock_delete_objects
         mock_delete_events.side_effect = mock_delete_response
         mock_put.side_effect = mock_post_response
 
@@ -4971,7 +5013,9 @@ class SensuCheckTests(unittest.TestCase):
 
         self.assertEqual(mock_get_checks.call_count, 3)
         mock_get_checks.assert_called_with(namespace="tenant1")
-        mock_get_events.assert_called_once_with(namespace="tenant1")
+        mock_get_events.assert_called_once_with(
+            namespace="tenant1", checks={"generic.http.ar-argoui-ni4os"}
+        )
         mock_delete_checks.assert_called_once_with(
             checks=["generic.http.ar-argoui-ni4os"],
             namespace="tenant1"
@@ -4998,7 +5042,7 @@ class SensuCheckTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     @patch("argo_scg.sensu.Sensu._delete_events")
     @patch("argo_scg.sensu.Sensu._delete_checks")
     @patch("argo_scg.sensu.Sensu._fetch_events")
@@ -5023,7 +5067,7 @@ class SensuCheckTests(unittest.TestCase):
         checks3 = [mock_checks[0], check2]
         mock_get_checks.side_effect = [mock_checks, checks2, checks3]
         mock_get_events.return_value = mock_events
-        mock_delete_checks.side_effect = mock_delete_response
+        mock_delete_checks.side_effect = mock_delete_objects
         mock_delete_events.side_effect = mock_delete_response
         mock_put.side_effect = mock_post_response
 
@@ -5032,7 +5076,9 @@ class SensuCheckTests(unittest.TestCase):
 
         self.assertEqual(mock_get_checks.call_count, 3)
         mock_get_checks.assert_called_with(namespace="tenant1")
-        mock_get_events.assert_called_once_with(namespace="tenant1")
+        mock_get_events.assert_called_once_with(
+            namespace="tenant1", checks={"generic.http.status-argoui-ni4os"}
+        )
         mock_delete_checks.assert_called_once_with(
             checks=["generic.http.status-argoui-ni4os"],
             namespace="tenant1"
@@ -5053,7 +5099,7 @@ class SensuCheckTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     @patch("argo_scg.sensu.Sensu._delete_events")
     @patch("argo_scg.sensu.Sensu._delete_checks")
     @patch("argo_scg.sensu.Sensu._fetch_events")
@@ -5072,7 +5118,7 @@ class SensuCheckTests(unittest.TestCase):
         checks3 = [checks2[0], checks2[2], checks2[3], checks2[4], checks2[5]]
         mock_get_checks.side_effect = [copied_mock_checks, checks2, checks3]
         mock_get_events.return_value = mock_events
-        mock_delete_checks.side_effect = mock_delete_response
+        mock_delete_checks.side_effect = mock_delete_objects
         mock_delete_events.side_effect = mock_delete_response
         mock_put.side_effect = mock_post_response
 
@@ -5081,7 +5127,9 @@ class SensuCheckTests(unittest.TestCase):
 
         self.assertEqual(mock_get_checks.call_count, 3)
         mock_get_checks.assert_called_with(namespace="tenant1")
-        mock_get_events.assert_called_once_with(namespace="tenant1")
+        mock_get_events.assert_called_once_with(
+            namespace="tenant1", checks={"generic.http.status-argoui-ni4os"}
+        )
         mock_delete_checks.assert_called_once_with(
             checks=["generic.http.status-argoui-ni4os"],
             namespace="tenant1"
@@ -5133,7 +5181,7 @@ class SensuCheckTests(unittest.TestCase):
             }
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     @patch("argo_scg.sensu.Sensu._delete_events")
     @patch("argo_scg.sensu.Sensu._delete_checks")
     @patch("argo_scg.sensu.Sensu._fetch_events")
@@ -5160,7 +5208,7 @@ class SensuCheckTests(unittest.TestCase):
         }
         mock_get_checks.return_value = self.checks
         mock_get_events.return_value = mock_events
-        mock_delete_checks.side_effect = mock_delete_response
+        mock_delete_checks.side_effect = mock_delete_objects
         mock_delete_events.side_effect = mock_delete_response
         mock_put.side_effect = mock_post_response
 
@@ -5190,7 +5238,7 @@ class SensuCheckTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     @patch("argo_scg.sensu.Sensu._delete_events")
     @patch("argo_scg.sensu.Sensu._delete_checks")
     @patch("argo_scg.sensu.Sensu._fetch_events")
@@ -5246,7 +5294,7 @@ class SensuCheckTests(unittest.TestCase):
             "pipelines": []
         }]
         mock_get_events.return_value = mock_events
-        mock_delete_checks.side_effect = mock_delete_response
+        mock_delete_checks.side_effect = mock_delete_objects
         mock_delete_events.side_effect = mock_delete_response
         mock_put.side_effect = mock_post_response
 
@@ -5265,7 +5313,149 @@ class SensuCheckTests(unittest.TestCase):
 
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.sensu.Sensu._delete_events")
+    @patch("argo_scg.sensu.Sensu._delete_checks")
+    @patch("argo_scg.sensu.Sensu._fetch_events")
+    @patch("argo_scg.sensu.Sensu._get_checks")
+    def test_handle_checks_with_hashes(
+            self, mock_get_checks, mock_get_events, mock_delete_checks,
+            mock_delete_events, mock_put
+    ):
+        checks = [stamp_hash(check) for check in self.checks]
+        # differs from the desired check, but carries its hash
+        existing_check1 = copy.deepcopy(checks[0])
+        existing_check1.update({"ttl": 0, "subscriptions": ["other"]})
+        # same as the desired check, but without its hash
+        existing_check2 = copy.deepcopy(self.checks[1])
+        existing_check3 = copy.deepcopy(checks[2])
+        existing_check3["metadata"]["annotations"].update({
+            HASH_ANNOTATION: "abc"
+        })
+        mock_get_checks.side_effect = [
+            [existing_check1, existing_check2, existing_check3],
+            checks
+        ]
+        mock_put.side_effect = mock_post_response
+
+        with self.assertLogs(LOGNAME) as log:
+            self.sensu.handle_checks(
+                checks=iter(checks), namespace="tenant1"
+            )
+
+        self.assertEqual(mock_get_checks.call_count, 2)
+        self.assertFalse(mock_get_events.called)
+        self.assertFalse(mock_delete_checks.called)
+        self.assertFalse(mock_delete_events.called)
+        self.assertEqual(mock_put.call_count, 2)
+        mock_put.assert_has_calls([
+            call(
+                "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
+                "checks/generic.tcp.connect",
+                data=json.dumps(checks[1]),
+                headers={
+                    "Authorization": "Key t0k3n",
+                    "Content-Type": "application/json"
+                }
+            ),
+            call(
+                "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
+                "checks/generic.certificate.validity",
+                data=json.dumps(checks[2]),
+                headers={
+                    "Authorization": "Key t0k3n",
+                    "Content-Type": "application/json"
+                }
+            )
+        ], any_order=True)
+        self.assertEqual(
+            sorted(log.output), [
+                f"INFO:{LOGNAME}:tenant1: Check generic.certificate.validity "
+                f"updated",
+                f"INFO:{LOGNAME}:tenant1: Check generic.tcp.connect updated"
+            ]
+        )
+
+    @patch("argo_scg.sensu.time.monotonic")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.sensu.Sensu._delete_events")
+    @patch("argo_scg.sensu.Sensu._delete_checks")
+    @patch("argo_scg.sensu.Sensu._fetch_events")
+    @patch("argo_scg.sensu.Sensu._get_checks")
+    def test_handle_checks_summary(
+            self, mock_get_checks, mock_get_events, mock_delete_checks,
+            mock_delete_events, mock_put, mock_monotonic
+    ):
+        checks = [stamp_hash(check) for check in self.checks]
+        existing_checks = [
+            checks[0],
+            copy.deepcopy(self.checks[1]),
+            copy.deepcopy(mock_checks[0]),
+            copy.deepcopy(mock_checks[1])
+        ]
+        existing_checks[2]["metadata"]["name"] = "generic.ping"
+        existing_checks[3]["metadata"]["name"] = "generic.dns"
+        mock_get_checks.side_effect = [existing_checks, existing_checks, []]
+        mock_get_events.return_value = []
+        mock_delete_checks.side_effect = mock_delete_objects
+        mock_put.side_effect = mock_post_response
+        mock_monotonic.side_effect = [10.0, 12.5]
+
+        with self.assertLogs(LOGNAME, level="DEBUG") as log:
+            self.sensu.handle_checks(checks=checks, namespace="tenant1")
+
+        mock_delete_checks.assert_called_once_with(
+            checks=["generic.dns", "generic.ping"], namespace="tenant1"
+        )
+        self.assertEqual(mock_put.call_count, 2)
+        self.assertEqual(
+            log.output[-1],
+            f"DEBUG:{LOGNAME}:tenant1: Checks: 1 created, 1 updated, "
+            f"1 unchanged, 2 deleted in 2.50 s"
+        )
+
+    @patch("argo_scg.sensu.time.monotonic")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.sensu.Sensu._delete_events")
+    @patch("argo_scg.sensu.Sensu._delete_checks")
+    @patch("argo_scg.sensu.Sensu._fetch_events")
+    @patch("argo_scg.sensu.Sensu._get_checks")
+    def test_handle_checks_summary_with_errors(
+            self, mock_get_checks, mock_get_events, mock_delete_checks,
+            mock_delete_events, mock_put, mock_monotonic
+    ):
+        checks = [stamp_hash(check) for check in self.checks]
+        existing_checks = [
+            checks[0],
+            copy.deepcopy(self.checks[1]),
+            copy.deepcopy(mock_checks[0]),
+            copy.deepcopy(mock_checks[1])
+        ]
+        existing_checks[2]["metadata"]["name"] = "generic.ping"
+        existing_checks[3]["metadata"]["name"] = "generic.dns"
+        mock_get_checks.side_effect = [existing_checks, existing_checks, []]
+        mock_get_events.return_value = []
+        mock_delete_checks.return_value = {"generic.dns"}
+        mock_put.side_effect = [
+            MockResponse(None, status_code=200),
+            MockResponse(None, status_code=400)
+        ]
+        mock_monotonic.side_effect = [10.0, 12.5]
+
+        with self.assertLogs(LOGNAME, level="DEBUG") as log:
+            self.sensu.handle_checks(checks=checks, namespace="tenant1")
+
+        mock_delete_checks.assert_called_once_with(
+            checks=["generic.dns", "generic.ping"], namespace="tenant1"
+        )
+        self.assertEqual(mock_put.call_count, 2)
+        self.assertEqual(
+            log.output[-1],
+            f"DEBUG:{LOGNAME}:tenant1: Checks: 0 created, 1 updated, "
+            f"1 unchanged, 1 deleted in 2.50 s"
+        )
+
+    @patch("argo_scg.session.Session.put")
     @patch("argo_scg.sensu.Sensu._delete_events")
     @patch("argo_scg.sensu.Sensu._delete_checks")
     @patch("argo_scg.sensu.Sensu._fetch_events")
@@ -5280,7 +5470,7 @@ class SensuCheckTests(unittest.TestCase):
         checks3 = [checks2[0], checks2[2], checks2[3]]
         mock_get_checks.side_effect = [mock_checks, checks2, checks3]
         mock_get_events.return_value = mock_events
-        mock_delete_checks.side_effect = mock_delete_response
+        mock_delete_checks.side_effect = mock_delete_objects
         mock_delete_events.side_effect = mock_delete_response
         mock_put.side_effect = [
             MockResponse(None, status_code=200),
@@ -5292,7 +5482,9 @@ class SensuCheckTests(unittest.TestCase):
 
         self.assertEqual(mock_get_checks.call_count, 3)
         mock_get_checks.assert_called_with(namespace="tenant1")
-        mock_get_events.assert_called_once_with(namespace="tenant1")
+        mock_get_events.assert_called_once_with(
+            namespace="tenant1", checks={"generic.http.status-argoui-ni4os"}
+        )
         mock_delete_checks.assert_called_once_with(
             checks=["generic.http.status-argoui-ni4os"],
             namespace="tenant1"
@@ -5335,7 +5527,116 @@ class SensuCheckTests(unittest.TestCase):
             }
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.sensu.Sensu._delete_events")
+    @patch("argo_scg.sensu.Sensu._delete_checks")
+    @patch("argo_scg.sensu.Sensu._fetch_events")
+    @patch("argo_scg.sensu.Sensu._get_checks")
+    def test_handle_checks_concurrently(
+            self, mock_get_checks, mock_get_events, mock_delete_checks,
+            mock_delete_events, mock_put
+    ):
+        def put_response(*args, **kwargs):
+            if args[0].endswith("generic.certificate.validity"):
+                return MockResponse(
+                    {"message": "Something went wrong."}, status_code=400
+                )
+
+            return MockResponse(None, status_code=200)
+
+        self.sensu.concurrency = 4
+        checks2 = [
+            mock_checks[0], mock_checks[1], mock_checks[2], self.checks[2]
+        ]
+        checks3 = [checks2[0], checks2[2], checks2[3]]
+        mock_get_checks.side_effect = [mock_checks, checks2, checks3]
+        mock_get_events.return_value = mock_events
+        mock_delete_checks.side_effect = mock_delete_objects
+        mock_delete_events.side_effect = mock_delete_response
+        mock_put.side_effect = put_response
+
+        with self.assertLogs(LOGNAME) as log:
+            self.sensu.handle_checks(checks=self.checks, namespace="tenant1")
+
+        self.assertEqual(mock_get_checks.call_count, 3)
+        mock_delete_checks.assert_called_once_with(
+            checks=["generic.http.status-argoui-ni4os"],
+            namespace="tenant1"
+        )
+        self.assertEqual(mock_put.call_count, 2)
+        mock_put.assert_has_calls([
+            call(
+                "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
+                "checks/generic.http.ar-argoui-ni4os",
+                data=json.dumps(self.checks[0]),
+                headers={
+                    "Authorization": "Key t0k3n",
+                    "Content-Type": "application/json"
+                }
+            ),
+            call(
+                "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
+                "checks/generic.certificate.validity",
+                data=json.dumps(self.checks[2]),
+                headers={
+                    "Authorization": "Key t0k3n",
+                    "Content-Type": "application/json"
+                }
+            )
+        ], any_order=True)
+
+        self.assertEqual(
+            set(log.output), {
+                f"WARNING:{LOGNAME}:tenant1: Check "
+                f"generic.certificate.validity not created: "
+                f"400 BAD REQUEST: Something went wrong.",
+                f"INFO:{LOGNAME}:tenant1: Check generic.http.ar-argoui-ni4os "
+                f"updated"
+            }
+        )
+
+    @patch("argo_scg.session.Session.delete")
+    @patch("argo_scg.sensu.Sensu._delete_silenced_entries")
+    def test_delete_checks_concurrently(
+            self, mock_delete_silenced, mock_delete
+    ):
+        def delete_response(*args, **kwargs):
+            if args[0].endswith("generic.tcp.connect"):
+                return MockResponse(None, status_code=400)
+
+            return MockResponse(None, status_code=204)
+
+        self.sensu.concurrency = 2
+        mock_delete.side_effect = delete_response
+
+        with self.assertLogs(LOGNAME) as log:
+            self.sensu._delete_checks(
+                checks=[
+                    "generic.http.connect", "generic.tcp.connect",
+                    "generic.certificate.validity"
+                ],
+                namespace="tenant1"
+            )
+
+        self.assertEqual(mock_delete.call_count, 3)
+        mock_delete_silenced.assert_called_once_with(
+            checks=[
+                "generic.http.connect",
+                "generic.certificate.validity"
+            ],
+            namespace="tenant1"
+        )
+        self.assertEqual(
+            set(log.output), {
+                f"INFO:{LOGNAME}:tenant1: Check generic.http.connect removed",
+                f"WARNING:{LOGNAME}:tenant1: Check generic.tcp.connect not "
+                f"removed: 400 BAD REQUEST",
+                f"INFO:{LOGNAME}:tenant1: Check generic.certificate.validity "
+                f"removed"
+            }
+        )
+
+    @patch("argo_scg.session.Session.put")
     @patch("argo_scg.sensu.Sensu._delete_events")
     @patch("argo_scg.sensu.Sensu._delete_checks")
     @patch("argo_scg.sensu.Sensu._fetch_events")
@@ -5350,7 +5651,7 @@ class SensuCheckTests(unittest.TestCase):
         checks3 = [checks2[0], checks2[2], checks2[3]]
         mock_get_checks.side_effect = [mock_checks, checks2, checks3]
         mock_get_events.return_value = mock_events
-        mock_delete_checks.side_effect = mock_delete_response
+        mock_delete_checks.side_effect = mock_delete_objects
         mock_delete_events.side_effect = mock_delete_response
         mock_put.side_effect = [
             MockResponse(None, status_code=200),
@@ -5362,7 +5663,9 @@ class SensuCheckTests(unittest.TestCase):
 
         self.assertEqual(mock_get_checks.call_count, 3)
         mock_get_checks.assert_called_with(namespace="tenant1")
-        mock_get_events.assert_called_once_with(namespace="tenant1")
+        mock_get_events.assert_called_once_with(
+            namespace="tenant1", checks={"generic.http.status-argoui-ni4os"}
+        )
         mock_delete_checks.assert_called_once_with(
             checks=["generic.http.status-argoui-ni4os"],
             namespace="tenant1"
@@ -5405,7 +5708,7 @@ class SensuCheckTests(unittest.TestCase):
             }
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     def test_put_check(self, mock_put):
         mock_put.side_effect = mock_post_response
         check = {
@@ -5436,7 +5739,7 @@ class SensuCheckTests(unittest.TestCase):
             }
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     def test_put_check_with_error_with_message(self, mock_put):
         mock_put.return_value = MockResponse(
             {"message": "Something went wrong"}, status_code=400
@@ -5477,7 +5780,7 @@ class SensuCheckTests(unittest.TestCase):
             "400 BAD REQUEST: Something went wrong"
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     def test_put_check_with_error_without_message(self, mock_put):
         mock_put.return_value = MockResponse(None, status_code=400)
         check = {
@@ -5516,31 +5819,83 @@ class SensuCheckTests(unittest.TestCase):
             "400 BAD REQUEST"
         )
 
-
-class SensuEventsTests(unittest.TestCase):
-    def setUp(self):
-        self.sensu = Sensu(
-            url="https://sensu.mock.com:8080",
-            token="t0k3n",
-            namespaces={
-                "default": ["default"],
-                "tenant1": ["TENANT1"],
-                "tenant2": ["TENANT2"]
+    @patch("argo_scg.session.Session.post")
+    def test_execute_check(self, mock_post):
+        mock_post.side_effect = mock_post_response
+        self.sensu.execute_check(check="adhoc-check", namespace="tenant1")
+        mock_post.assert_called_once_with(
+            "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/checks/"
+            "adhoc-check/execute",
+            data=json.dumps({"check": "adhoc-check"}),
+            headers={
+                "Authorization": "Key t0k3n",
+                "Content-Type": "application/json"
             }
         )
 
-    @patch("requests.get")
-    def test_fetch_events(self, mock_get):
-        mock_get.side_effect = mock_sensu_request
-        with self.assertLogs(LOGNAME) as log:
-            _log_dummy()
-            checks = self.sensu._fetch_events(namespace="tenant1")
-        self.assertEqual(checks, mock_events)
-        self.assertEqual(log.output, DUMMY_LOG)
-
-    @patch("requests.get")
-    def test_fetch_events_with_error_with_messsage(self, mock_get):
-        mock_get.side_effect = mock_sensu_request_events_not_ok_with_msg
+    @patch("argo_scg.session.Session.post")
+    def test_execute_check_with_error_with_message(self, mock_post):
+        mock_post.side_effect = mock_post_response_not_ok_with_msg
+
+        with self.assertRaises(SensuException) as context:
+            self.sensu.execute_check(check="adhoc-check", namespace="tenant1")
+
+        self.assertEqual(
+            context.exception.__str__(),
+            "Sensu error: tenant1: Check adhoc-check not executed: "
+            "400 BAD REQUEST: Something went wrong."
+        )
+
+    @patch("argo_scg.session.Session.post")
+    def test_execute_check_with_error_without_message(self, mock_post):
+        mock_post.side_effect = mock_post_response_not_ok_without_msg
+
+        with self.assertRaises(SensuException) as context:
+            self.sensu.execute_check(check="adhoc-check", namespace="tenant1")
+
+        self.assertEqual(
+            context.exception.__str__(),
+            "Sensu error: tenant1: Check adhoc-check not executed: "
+            "400 BAD REQUEST"
+        )
+
+    @patch("argo_scg.session.Session.post")
+    def test_execute_check_returns_issued_time(self, mock_post):
+        mock_post.return_value = MockResponse(
+            {"issued": 1700000000}, status_code=202
+        )
+        self.assertEqual(
+            self.sensu.execute_check(
+                check="adhoc-check", namespace="tenant1"
+            ),
+            1700000000
+        )
+
+
+class SensuEventsTests(unittest.TestCase):
+    def setUp(self):
+        self.sensu = Sensu(
+            url="https://sensu.mock.com:8080",
+            token="t0k3n",
+            namespaces={
+                "default": ["default"],
+                "tenant1": ["TENANT1"],
+                "tenant2": ["TENANT2"]
+            }
+        )
+
+    @patch("argo_scg.session.Session.get")
+    def test_fetch_events(self, mock_get):
+        mock_get.side_effect = mock_sensu_request
+        with self.assertLogs(LOGNAME) as log:
+            _log_dummy()
+            checks = self.sensu._fetch_events(namespace="tenant1")
+        self.assertEqual(checks, mock_events)
+        self.assertEqual(log.output, DUMMY_LOG)
+
+    @patch("argo_scg.session.Session.get")
+    def test_fetch_events_with_error_with_messsage(self, mock_get):
+        mock_get.side_effect = mock_sensu_request_events_not_ok_with_msg
 
         with self.assertRaises(SensuException) as context:
             with self.assertLogs(LOGNAME) as log:
@@ -5566,7 +5921,7 @@ class SensuEventsTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_fetch_events_with_error_without_messsage(self, mock_get):
         mock_get.side_effect = mock_sensu_request_events_not_ok_without_msg
 
@@ -5593,8 +5948,8 @@ class SensuEventsTests(unittest.TestCase):
             ]
         )
 
-    @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.sensu.Sensu._delete_silenced_entries")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_events(self, mock_delete, mock_delete_silenced):
         mock_delete.side_effect = mock_delete_response
         mock_delete_silenced.side_effect = mock_function
@@ -5633,37 +5988,17 @@ class SensuEventsTests(unittest.TestCase):
                 }
             )
         ], any_order=True)
-        self.assertEqual(mock_delete_silenced.call_count, 3)
-        mock_delete_silenced.assert_has_calls([
-            call(
-                entity="argo.ni4os.eu",
-                check="generic.tcp.connect",
-                namespace="tenant1"
-            ),
-            call(
-                entity="argo.ni4os.eu",
-                check="generic.http.connect",
-                namespace="tenant1"
-            ),
-            call(
-                entity="argo-devel.ni4os.eu",
-                check="generic.certificate.validation",
-                namespace="tenant1"
-            )
-        ], any_order=True)
-        self.assertEqual(
-            set(log.output), {
-                f"INFO:{LOGNAME}:tenant1: Event "
-                f"argo-devel.ni4os.eu/generic.certificate.validation removed",
-                f"INFO:{LOGNAME}:tenant1: Event "
-                f"argo.ni4os.eu/generic.http.connect removed",
-                f"INFO:{LOGNAME}:tenant1: Event "
-                f"argo.ni4os.eu/generic.tcp.connect removed"
-            }
+        mock_delete_silenced.assert_called_once_with(
+            events=[
+                ("argo.ni4os.eu", "generic.tcp.connect"),
+                ("argo.ni4os.eu", "generic.http.connect"),
+                ("argo-devel.ni4os.eu", "generic.certificate.validation")
+            ],
+            namespace="tenant1"
         )
 
-    @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.sensu.Sensu._delete_silenced_entries")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_events_with_error_with_message(
             self, mock_delete, mock_delete_silenced
     ):
@@ -5700,8 +6035,9 @@ class SensuEventsTests(unittest.TestCase):
             )
         ], any_order=True)
         mock_delete_silenced.assert_called_once_with(
-            entity="argo.ni4os.eu",
-            check="generic.tcp.connect",
+            events=[
+                ("argo.ni4os.eu", "generic.tcp.connect")
+            ],
             namespace="tenant1"
         )
         self.assertEqual(
@@ -5714,8 +6050,8 @@ class SensuEventsTests(unittest.TestCase):
             }
         )
 
-    @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.sensu.Sensu._delete_silenced_entries")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_events_with_error_without_message(
             self, mock_delete, mock_delete_silenced
     ):
@@ -5752,8 +6088,9 @@ class SensuEventsTests(unittest.TestCase):
             )
         ], any_order=True)
         mock_delete_silenced.assert_called_once_with(
-            entity="argo.ni4os.eu",
-            check="generic.tcp.connect",
+            events=[
+                ("argo.ni4os.eu", "generic.tcp.connect")
+            ],
             namespace="tenant1"
         )
         self.assertEqual(
@@ -5766,13 +6103,14 @@ class SensuEventsTests(unittest.TestCase):
             }
         )
 
-    @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.sensu.Sensu._delete_silenced_entries")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_events_with_silenced_entry_error(
             self, mock_delete, mock_delete_silenced
     ):
         mock_delete.side_effect = mock_delete_response
-        mock_delete_silenced.side_effect = mock_silenced_entry_delete_exception
+        mock_delete_silenced.side_effect = \
+            mock_silenced_entries_delete_exception
         with self.assertLogs(LOGNAME) as log:
             self.sensu._delete_events(
                 events={
@@ -5808,40 +6146,17 @@ class SensuEventsTests(unittest.TestCase):
                 }
             )
         ], any_order=True)
-        self.assertEqual(mock_delete_silenced.call_count, 3)
-        mock_delete_silenced.assert_has_calls([
-            call(
-                entity="argo.ni4os.eu",
-                check="generic.tcp.connect",
-                namespace="tenant1"
-            ),
-            call(
-                entity="argo.ni4os.eu",
-                check="generic.http.connect",
-                namespace="tenant1"
-            ),
-            call(
-                entity="argo-devel.ni4os.eu",
-                check="generic.certificate.validation",
-                namespace="tenant1"
-            )
-        ], any_order=True)
-        self.assertEqual(
-            set(log.output), {
-                f"INFO:{LOGNAME}:tenant1: Event "
-                f"argo-devel.ni4os.eu/generic.certificate.validation removed",
-                f"INFO:{LOGNAME}:tenant1: Event "
-                f"argo.ni4os.eu/generic.http.connect removed",
-                f"INFO:{LOGNAME}:tenant1: Event "
-                f"argo.ni4os.eu/generic.tcp.connect removed",
-                f"WARNING:{LOGNAME}:tenant1: Silenced entry "
-                f"entity:argo.ni4os.eu:generic.tcp.connect "
-                "(400 BAD REQUEST: Something went wrong) not removed"
-            }
+        mock_delete_silenced.assert_called_once_with(
+            events=[
+                ("argo.ni4os.eu", "generic.tcp.connect"),
+                ("argo.ni4os.eu", "generic.http.connect"),
+                ("argo-devel.ni4os.eu", "generic.certificate.validation")
+            ],
+            namespace="tenant1"
         )
 
     @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_event(self, mock_delete, mock_delete_silenced):
         mock_delete.side_effect = mock_delete_response
         mock_delete_silenced.side_effect = mock_function
@@ -5864,7 +6179,7 @@ class SensuEventsTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_event_with_error_with_message(
             self, mock_delete, mock_delete_silenced
     ):
@@ -5893,7 +6208,7 @@ class SensuEventsTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_event_with_error_without_message(
             self, mock_delete, mock_delete_silenced
     ):
@@ -5920,7 +6235,7 @@ class SensuEventsTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_event_with_silenced_entry_error(
             self, mock_delete, mock_delete_silenced
     ):
@@ -5950,9 +6265,9 @@ class SensuEventsTests(unittest.TestCase):
             "(400 BAD REQUEST: Something went wrong) not removed"
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_event_output(self, mock_get):
-        mock_get.side_effect = mock_sensu_request
+        mock_get.side_effect = mock_sensu_object_request(events=mock_events)
         output = self.sensu.get_event_output(
             entity="gocdb.ni4os.eu",
             check="generic.tcp.connect",
@@ -5964,9 +6279,11 @@ class SensuEventsTests(unittest.TestCase):
             "time=0.044729s;;;0.000000;120.000000\n"
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_event_output_with_error_with_message(self, mock_get):
-        mock_get.side_effect = mock_sensu_request_events_not_ok_with_msg
+        mock_get.return_value = MockResponse(
+            {"message": "Something went wrong."}, status_code=400
+        )
         with self.assertRaises(SensuException) as context:
             self.sensu.get_event_output(
                 entity="gocdb.ni4os.eu",
@@ -5980,9 +6297,9 @@ class SensuEventsTests(unittest.TestCase):
             "Something went wrong."
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_event_output_with_error_without_message(self, mock_get):
-        mock_get.side_effect = mock_sensu_request_events_not_ok_without_msg
+        mock_get.return_value = MockResponse(None, status_code=400)
         with self.assertRaises(SensuException) as context:
             self.sensu.get_event_output(
                 entity="gocdb.ni4os.eu",
@@ -5995,9 +6312,9 @@ class SensuEventsTests(unittest.TestCase):
             "Sensu error: tenant1: Events fetch error: 400 BAD REQUEST"
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_event_output_if_nonexisting_entity_or_check(self, mock_get):
-        mock_get.side_effect = mock_sensu_request
+        mock_get.side_effect = mock_sensu_object_request(events=mock_events)
         with self.assertRaises(SensuException) as context:
             self.sensu.get_event_output(
                 entity="mock.entity.com",
@@ -6011,6 +6328,91 @@ class SensuEventsTests(unittest.TestCase):
             "check generic.tcp.connect"
         )
 
+    @patch("argo_scg.session.Session.get")
+    def test_get_event_output_not_served_from_snapshot(self, mock_get):
+        new_event = copy.deepcopy(mock_events[1])
+        new_event["check"].update({"output": "TCP OK - new result"})
+        mock_get.side_effect = [
+            MockResponse(mock_events, status_code=200),
+            MockResponse(new_event, status_code=200)
+        ]
+        self.assertEqual(
+            self.sensu._fetch_events(namespace="tenant1"), mock_events
+        )
+        self.assertEqual(
+            self.sensu.get_event_output(
+                entity="gocdb.ni4os.eu", check="generic.tcp.connect",
+                namespace="tenant1"
+            ),
+            "TCP OK - new result"
+        )
+        mock_get.assert_called_with(
+            "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
+            "events/gocdb.ni4os.eu/generic.tcp.connect",
+            headers={
+                "Authorization": "Key t0k3n",
+                "Content-Type": "application/json"
+            }
+        )
+
+    @patch("argo_scg.sensu.time.sleep")
+    @patch("argo_scg.sensu.time.monotonic")
+    @patch("argo_scg.session.Session.get")
+    def test_wait_for_event(self, mock_get, mock_monotonic, mock_sleep):
+        old_event = copy.deepcopy(mock_events[1])
+        old_event["check"].update({"issued": 1000, "executed": 1001})
+        new_event = copy.deepcopy(mock_events[1])
+        new_event["check"].update({"issued": 1100, "executed": 1102})
+        mock_get.side_effect = [
+            MockResponse({"message": "not found"}, status_code=404),
+            MockResponse(old_event, status_code=200),
+            MockResponse(new_event, status_code=200)
+        ]
+        mock_monotonic.side_effect = [10, 10, 10.5, 11.5, 11.5]
+        self.assertEqual(
+            self.sensu.wait_for_event(
+                entity="gocdb.ni4os.eu", check="generic.tcp.connect",
+                issued=1100, timeout=120, namespace="tenant1"
+            ),
+            (new_event, 1.5)
+        )
+        self.assertEqual(mock_get.call_count, 3)
+        mock_get.assert_called_with(
+            "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
+            "events/gocdb.ni4os.eu/generic.tcp.connect",
+            headers={
+                "Authorization": "Key t0k3n",
+                "Content-Type": "application/json"
+            }
+        )
+        self.assertEqual(mock_sleep.call_args_list, [call(0.5), call(1)])
+
+    @patch("argo_scg.sensu.time.sleep")
+    @patch("argo_scg.sensu.time.monotonic")
+    @patch("argo_scg.session.Session.get")
+    def test_wait_for_event_with_timeout(
+            self, mock_get, mock_monotonic, mock_sleep
+    ):
+        mock_get.return_value = MockResponse(
+            {"message": "not found"}, status_code=404
+        )
+        mock_monotonic.side_effect = [0, 4, 10, 18, 20]
+        with self.assertRaises(SensuException) as context:
+            self.sensu.wait_for_event(
+                entity="gocdb.ni4os.eu", check="generic.tcp.connect",
+                issued=1100, timeout=20, namespace="tenant1", interval=4
+            )
+
+        self.assertEqual(
+            context.exception.__str__(),
+            "Sensu error: tenant1: No result for entity gocdb.ni4os.eu and "
+            "check generic.tcp.connect in 20 s"
+        )
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(
+            mock_sleep.call_args_list, [call(4), call(8), call(2)]
+        )
+
 
 class SensuEntityTests(unittest.TestCase):
     def setUp(self):
@@ -6067,7 +6469,7 @@ class SensuEntityTests(unittest.TestCase):
             }
         ]
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_proxy_entities(self, mock_get):
         mock_get.side_effect = mock_sensu_request
         with self.assertLogs(LOGNAME) as log:
@@ -6087,7 +6489,7 @@ class SensuEntityTests(unittest.TestCase):
         )
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_proxy_entities_with_error_with_message(self, mock_get):
         mock_get.side_effect = mock_sensu_request_entity_not_ok_with_msg
         with self.assertRaises(SensuException) as context:
@@ -6115,7 +6517,7 @@ class SensuEntityTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_proxy_entities_with_error_without_message(self, mock_get):
         mock_get.side_effect = mock_sensu_request_entity_not_ok_without_msg
         with self.assertRaises(SensuException) as context:
@@ -6143,8 +6545,8 @@ class SensuEntityTests(unittest.TestCase):
             ]
         )
 
-    @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.sensu.Sensu._delete_silenced_entries")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_entities(self, mock_delete, mock_delete_silenced):
         mock_delete.side_effect = mock_delete_response
         mock_delete_silenced.side_effect = mock_function
@@ -6175,22 +6577,17 @@ class SensuEntityTests(unittest.TestCase):
                 }
             )
         ], any_order=True)
-        self.assertEqual(mock_delete_silenced.call_count, 3)
-        mock_delete_silenced.assert_has_calls([
-            call(entity="argo.ni4os.eu", namespace="tenant1"),
-            call(entity="argo-devel.ni4os.eu", namespace="tenant1"),
-            call(entity="gocdb.ni4os.eu", namespace="tenant1")
-        ], any_order=True)
-        self.assertEqual(
-            set(log.output), {
-                f"INFO:{LOGNAME}:tenant1: Entity argo.ni4os.eu removed",
-                f"INFO:{LOGNAME}:tenant1: Entity argo-devel.ni4os.eu removed",
-                f"INFO:{LOGNAME}:tenant1: Entity gocdb.ni4os.eu removed"
-            }
+        mock_delete_silenced.assert_called_once_with(
+            entities=[
+                "argo.ni4os.eu",
+                "argo-devel.ni4os.eu",
+                "gocdb.ni4os.eu"
+            ],
+            namespace="tenant1"
         )
 
-    @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.sensu.Sensu._delete_silenced_entries")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_entities_with_error_with_message(
             self, mock_delete, mock_delete_silenced
     ):
@@ -6202,7 +6599,9 @@ class SensuEntityTests(unittest.TestCase):
         mock_delete_silenced.side_effect = mock_function
         entities = ["argo.ni4os.eu", "argo-devel.ni4os.eu", "gocdb.ni4os.eu"]
         with self.assertLogs(LOGNAME) as log:
-            self.sensu._delete_entities(entities=entities, namespace="tenant1")
+            removed = self.sensu._delete_entities(
+                entities=entities, namespace="tenant1"
+            )
         self.assertEqual(mock_delete.call_count, 3)
         mock_delete.assert_has_calls([
             call(
@@ -6227,22 +6626,17 @@ class SensuEntityTests(unittest.TestCase):
                 }
             )
         ], any_order=True)
-        self.assertEqual(mock_delete_silenced.call_count, 2)
-        mock_delete_silenced.assert_has_calls([
-            call(entity="argo.ni4os.eu", namespace="tenant1"),
-            call(entity="gocdb.ni4os.eu", namespace="tenant1")
-        ], any_order=True)
-        self.assertEqual(
-            set(log.output), {
-                f"INFO:{LOGNAME}:tenant1: Entity argo.ni4os.eu removed",
-                f"WARNING:{LOGNAME}:tenant1: Entity argo-devel.ni4os.eu "
-                f"not removed: 400 BAD REQUEST: Something went wrong.",
-                f"INFO:{LOGNAME}:tenant1: Entity gocdb.ni4os.eu removed"
-            }
+        mock_delete_silenced.assert_called_once_with(
+            entities=[
+                "argo.ni4os.eu",
+                "gocdb.ni4os.eu"
+            ],
+            namespace="tenant1"
         )
+        self.assertEqual(removed, {"argo.ni4os.eu", "gocdb.ni4os.eu"})
 
-    @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.sensu.Sensu._delete_silenced_entries")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_entities_with_error_without_message(
             self, mock_delete, mock_delete_silenced
     ):
@@ -6279,27 +6673,22 @@ class SensuEntityTests(unittest.TestCase):
                 }
             )
         ], any_order=True)
-        self.assertEqual(mock_delete_silenced.call_count, 2)
-        mock_delete_silenced.assert_has_calls([
-            call(entity="argo.ni4os.eu", namespace="tenant1"),
-            call(entity="gocdb.ni4os.eu", namespace="tenant1")
-        ], any_order=True)
-        self.assertEqual(
-            set(log.output), {
-                f"INFO:{LOGNAME}:tenant1: Entity argo.ni4os.eu removed",
-                f"WARNING:{LOGNAME}:tenant1: Entity argo-devel.ni4os.eu not "
-                f"removed: 400 BAD REQUEST",
-                f"INFO:{LOGNAME}:tenant1: Entity gocdb.ni4os.eu removed"
-            }
+        mock_delete_silenced.assert_called_once_with(
+            entities=[
+                "argo.ni4os.eu",
+                "gocdb.ni4os.eu"
+            ],
+            namespace="tenant1"
         )
 
-    @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
-    @patch("requests.delete")
+    @patch("argo_scg.sensu.Sensu._delete_silenced_entries")
+    @patch("argo_scg.session.Session.delete")
     def test_delete_entities_with_silenced_entry_error(
             self, mock_delete, mock_delete_silenced
     ):
         mock_delete.side_effect = mock_delete_response
-        mock_delete_silenced.side_effect = mock_silenced_entry_delete_exception
+        mock_delete_silenced.side_effect = \
+            mock_silenced_entries_delete_exception
         entities = ["argo.ni4os.eu", "argo-devel.ni4os.eu", "gocdb.ni4os.eu"]
         with self.assertLogs(LOGNAME) as log:
             self.sensu._delete_entities(entities=entities, namespace="tenant1")
@@ -6327,36 +6716,31 @@ class SensuEntityTests(unittest.TestCase):
                 }
             )
         ], any_order=True)
-        self.assertEqual(mock_delete_silenced.call_count, 3)
-        mock_delete_silenced.assert_has_calls([
-            call(entity="argo.ni4os.eu", namespace="tenant1"),
-            call(entity="argo-devel.ni4os.eu", namespace="tenant1"),
-            call(entity="gocdb.ni4os.eu", namespace="tenant1")
-        ], any_order=True)
-        self.assertEqual(
-            set(log.output), {
-                f"INFO:{LOGNAME}:tenant1: Entity argo.ni4os.eu removed",
-                f"INFO:{LOGNAME}:tenant1: Entity argo-devel.ni4os.eu removed",
-                f"INFO:{LOGNAME}:tenant1: Entity gocdb.ni4os.eu removed",
-                f"WARNING:{LOGNAME}:tenant1: Silenced entry "
-                f"entity:argo.ni4os.eu:generic.tcp.connect (400 BAD REQUEST: "
-                f"Something went wrong) not removed"
-            }
+        mock_delete_silenced.assert_called_once_with(
+            entities=[
+                "argo.ni4os.eu",
+                "argo-devel.ni4os.eu",
+                "gocdb.ni4os.eu"
+            ],
+            namespace="tenant1"
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     @patch("argo_scg.sensu.Sensu._delete_entities")
     @patch("argo_scg.sensu.Sensu._get_proxy_entities")
-    def test_handle_proxy_entities(
+    def test_handle_proxy_entities_with_hashes(
             self, mock_get_entities, mock_delete_entities, mock_put
     ):
-        mock_get_entities.return_value = mock_entities[:-2]
-        mock_delete_entities.side_effect = mock_delete_response
+        entities = [stamp_hash(entity) for entity in self.entities]
+        existing_entity1 = copy.deepcopy(entities[0])
+        existing_entity1["metadata"]["labels"].update({"extra": "label"})
+        existing_entity2 = copy.deepcopy(self.entities[1])
+        mock_get_entities.return_value = [existing_entity1, existing_entity2]
         mock_put.side_effect = mock_post_response
 
         with self.assertLogs(LOGNAME) as log:
             self.sensu.handle_proxy_entities(
-                entities=self.entities, namespace="tenant1"
+                entities=iter(entities), namespace="tenant1"
             )
 
         mock_get_entities.assert_called_once_with(namespace="tenant1")
@@ -6364,8 +6748,8 @@ class SensuEntityTests(unittest.TestCase):
         mock_put.assert_has_calls([
             call(
                 "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
-                "entities/argo-devel.ni4os.eu",
-                data=json.dumps(self.entities[0]),
+                "entities/argo.ni4os.eu",
+                data=json.dumps(entities[1]),
                 headers={
                     "Authorization": "Key t0k3n",
                     "Content-Type": "application/json"
@@ -6374,92 +6758,77 @@ class SensuEntityTests(unittest.TestCase):
             call(
                 "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
                 "entities/argo-mon.ni4os.eu",
-                data=json.dumps(self.entities[2]),
+                data=json.dumps(entities[2]),
                 headers={
                     "Authorization": "Key t0k3n",
                     "Content-Type": "application/json"
                 }
             )
         ], any_order=True)
-
-        mock_delete_entities.assert_called_once_with(
-            entities=["gocdb.ni4os.eu"],
-            namespace="tenant1"
-        )
-
+        self.assertFalse(mock_delete_entities.called)
         self.assertEqual(
             set(log.output), {
                 f"INFO:{LOGNAME}:tenant1: Entity argo-mon.ni4os.eu created",
-                f"INFO:{LOGNAME}:tenant1: Entity argo-devel.ni4os.eu updated"
+                f"INFO:{LOGNAME}:tenant1: Entity argo.ni4os.eu updated"
             }
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.sensu.time.monotonic")
+    @patch("argo_scg.session.Session.put")
     @patch("argo_scg.sensu.Sensu._delete_entities")
     @patch("argo_scg.sensu.Sensu._get_proxy_entities")
-    def test_handle_proxy_entities_if_different_labels(
-            self, mock_get_entities, mock_delete_entities, mock_put
+    def test_handle_proxy_entities_summary(
+            self, mock_get_entities, mock_delete_entities, mock_put,
+            mock_monotonic
     ):
-        copied_mock_entities = [
-            copy.deepcopy(item) for item in mock_entities[:-2]
-        ]
-        copied_mock_entities[0]["metadata"]["labels"]["tenants"] = "TENANT2"
-        mock_get_entities.return_value = copied_mock_entities
-        mock_delete_entities.side_effect = mock_delete_response
+        mock_get_entities.return_value = mock_entities[:-2]
+        mock_delete_entities.side_effect = mock_delete_objects
         mock_put.side_effect = mock_post_response
+        mock_monotonic.side_effect = [3.0, 3.25]
 
-        with self.assertLogs(LOGNAME) as log:
+        with self.assertLogs(LOGNAME, level="DEBUG") as log:
             self.sensu.handle_proxy_entities(
                 entities=self.entities, namespace="tenant1"
             )
 
-        mock_get_entities.assert_called_once_with(namespace="tenant1")
-        self.assertEqual(mock_put.call_count, 2)
-        mock_put.assert_has_calls([
-            call(
-                "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
-                "entities/argo-devel.ni4os.eu",
-                data=json.dumps(self.entities[0]),
-                headers={
-                    "Authorization": "Key t0k3n",
-                    "Content-Type": "application/json"
-                }
-            ),
-            call(
-                "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
-                "entities/argo-mon.ni4os.eu",
-                data=json.dumps(self.entities[2]),
-                headers={
-                    "Authorization": "Key t0k3n",
-                    "Content-Type": "application/json"
-                }
-            )
-        ], any_order=True)
-
-        mock_delete_entities.assert_called_once_with(
-            entities=["gocdb.ni4os.eu"],
-            namespace="tenant1"
+        self.assertEqual(
+            log.output[-1],
+            f"DEBUG:{LOGNAME}:tenant1: Proxy entities: 1 created, "
+            f"1 updated, 1 unchanged, 1 deleted in 0.25 s"
         )
 
+    @patch("argo_scg.sensu.time.monotonic")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.sensu.Sensu._delete_entities")
+    @patch("argo_scg.sensu.Sensu._get_proxy_entities")
+    def test_handle_proxy_entities_summary_with_errors(
+            self, mock_get_entities, mock_delete_entities, mock_put,
+            mock_monotonic
+    ):
+        mock_get_entities.return_value = mock_entities[:-2]
+        mock_delete_entities.return_value = set()
+        mock_put.side_effect = mock_post_response_not_ok_without_msg
+        mock_monotonic.side_effect = [3.0, 3.25]
+
+        with self.assertLogs(LOGNAME, level="DEBUG") as log:
+            self.sensu.handle_proxy_entities(
+                entities=self.entities, namespace="tenant1"
+            )
+
         self.assertEqual(
-            set(log.output), {
-                f"INFO:{LOGNAME}:tenant1: Entity argo-mon.ni4os.eu created",
-                f"INFO:{LOGNAME}:tenant1: Entity argo-devel.ni4os.eu updated"
-            }
+            log.output[-1],
+            f"DEBUG:{LOGNAME}:tenant1: Proxy entities: 0 created, "
+            f"0 updated, 1 unchanged, 0 deleted in 0.25 s"
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     @patch("argo_scg.sensu.Sensu._delete_entities")
     @patch("argo_scg.sensu.Sensu._get_proxy_entities")
-    def test_handle_proxy_entities_if_missing_labels(
+    def test_handle_proxy_entities(
             self, mock_get_entities, mock_delete_entities, mock_put
     ):
-        copied_mock_entities = [
-            copy.deepcopy(item) for item in mock_entities[:-2]
-        ]
-        copied_mock_entities[0]["metadata"]["labels"].pop("tenants")
-        mock_get_entities.return_value = copied_mock_entities
-        mock_delete_entities.side_effect = mock_delete_response
+        mock_get_entities.return_value = mock_entities[:-2]
+        mock_delete_entities.side_effect = mock_delete_objects
         mock_put.side_effect = mock_post_response
 
         with self.assertLogs(LOGNAME) as log:
@@ -6502,14 +6871,189 @@ class SensuEntityTests(unittest.TestCase):
             }
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.sensu.APPLY_BATCH_SIZE", 1)
+    @patch("argo_scg.sensu.Sensu._apply")
+    @patch("argo_scg.session.Session.put")
     @patch("argo_scg.sensu.Sensu._delete_entities")
     @patch("argo_scg.sensu.Sensu._get_proxy_entities")
-    def test_handle_proxy_entities_with_error_with_msg(
+    def test_handle_proxy_entities_from_generator(
+            self, mock_get_entities, mock_delete_entities, mock_put,
+            mock_apply
+    ):
+        def apply(operations):
+            applied.append(len(operations))
+            for operation in operations:
+                operation()
+
+        applied = list()
+        mock_get_entities.return_value = mock_entities[:-2]
+        mock_delete_entities.side_effect = mock_delete_objects
+        mock_put.side_effect = mock_post_response
+        mock_apply.side_effect = apply
+
+        with self.assertLogs(LOGNAME) as log:
+            self.sensu.handle_proxy_entities(
+                entities=(entity for entity in self.entities),
+                namespace="tenant1"
+            )
+
+        self.assertEqual(applied, [1, 1, 0])
+        self.assertEqual(mock_put.call_count, 2)
+        mock_delete_entities.assert_called_once_with(
+            entities=["gocdb.ni4os.eu"],
+            namespace="tenant1"
+        )
+        self.assertEqual(
+            set(log.output), {
+                f"INFO:{LOGNAME}:tenant1: Entity argo-mon.ni4os.eu created",
+                f"INFO:{LOGNAME}:tenant1: Entity argo-devel.ni4os.eu updated"
+            }
+        )
+
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.sensu.Sensu._delete_entities")
+    @patch("argo_scg.sensu.Sensu._get_proxy_entities")
+    def test_handle_proxy_entities_concurrently(
+            self, mock_get_entities, mock_delete_entities, mock_put
+    ):
+        self.sensu.concurrency = 32
+        mock_get_entities.return_value = mock_entities[:-2]
+        mock_delete_entities.side_effect = mock_delete_objects
+        mock_put.side_effect = mock_post_response
+
+        with self.assertLogs(LOGNAME) as log:
+            self.sensu.handle_proxy_entities(
+                entities=self.entities, namespace="tenant1"
+            )
+
+        self.assertEqual(mock_put.call_count, 2)
+        mock_delete_entities.assert_called_once_with(
+            entities=["gocdb.ni4os.eu"],
+            namespace="tenant1"
+        )
+        self.assertEqual(
+            set(log.output), {
+                f"INFO:{LOGNAME}:tenant1: Entity argo-mon.ni4os.eu created",
+                f"INFO:{LOGNAME}:tenant1: Entity argo-devel.ni4os.eu updated"
+            }
+        )
+
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.sensu.Sensu._delete_entities")
+    @patch("argo_scg.sensu.Sensu._get_proxy_entities")
+    def test_handle_proxy_entities_if_different_labels(
+            self, mock_get_entities, mock_delete_entities, mock_put
+    ):
+        copied_mock_entities = [
+            copy.deepcopy(item) for item in mock_entities[:-2]
+        ]
+        copied_mock_entities[0]["metadata"]["labels"]["tenants"] = "TENANT2"
+        mock_get_entities.return_value = copied_mock_entities
+        mock_delete_entities.side_effect = mock_delete_objects
+        mock_put.side_effect = mock_post_response
+
+        with self.assertLogs(LOGNAME) as log:
+            self.sensu.handle_proxy_entities(
+                entities=self.entities, namespace="tenant1"
+            )
+
+        mock_get_entities.assert_called_once_with(namespace="tenant1")
+        self.assertEqual(mock_put.call_count, 2)
+        mock_put.assert_has_calls([
+            call(
+                "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
+                "entities/argo-devel.ni4os.eu",
+                data=json.dumps(self.entities[0]),
+                headers={
+                    "Authorization": "Key t0k3n",
+                    "Content-Type": "application/json"
+                }
+            ),
+            call(
+                "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
+                "entities/argo-mon.ni4os.eu",
+                data=json.dumps(self.entities[2]),
+                headers={
+                    "Authorization": "Key t0k3n",
+                    "Content-Type": "application/json"
+                }
+            )
+        ], any_order=True)
+
+        mock_delete_entities.assert_called_once_with(
+            entities=["gocdb.ni4os.eu"],
+            namespace="tenant1"
+        )
+
+        self.assertEqual(
+            set(log.output), {
+                f"INFO:{LOGNAME}:tenant1: Entity argo-mon.ni4os.eu created",
+                f"INFO:{LOGNAME}:tenant1: Entity argo-devel.ni4os.eu updated"
+            }
+        )
+
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.sensu.Sensu._delete_entities")
+    @patch("argo_scg.sensu.Sensu._get_proxy_entities")
+    def test_handle_proxy_entities_if_missing_labels(
+            self, mock_get_entities, mock_delete_entities, mock_put
+    ):
+        copied_mock_entities = [
+            copy.deepcopy(item) for item in mock_entities[:-2]
+        ]
+        copied_mock_entities[0]["metadata"]["labels"].pop("tenants")
+        mock_get_entities.return_value = copied_mock_entities
+        mock_delete_entities.side_effect = mock_delete_objects
+        mock_put.side_effect = mock_post_response
+
+        with self.assertLogs(LOGNAME) as log:
+            self.sensu.handle_proxy_entities(
+                entities=self.entities, namespace="tenant1"
+            )
+
+        mock_get_entities.assert_called_once_with(namespace="tenant1")
+        self.assertEqual(mock_put.call_count, 2)
+        mock_put.assert_has_calls([
+            call(
+                "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
+                "entities/argo-devel.ni4os.eu",
+                data=json.dumps(self.entities[0]),
+                headers={
+                    "Authorization": "Key t0k3n",
+                    "Content-Type": "application/json"
+                }
+            ),
+            call(
+                "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
+                "entities/argo-mon.ni4os.eu",
+                data=json.dumps(self.entities[2]),
+                headers={
+                    "Authorization": "Key t0k3n",
+                    "Content-Type": "application/json"
+                }
+            )
+        ], any_order=True)
+
+        mock_delete_entities.assert_called_once_with(
+            entities=["gocdb.ni4os.eu"],
+            namespace="tenant1"
+        )
+
+        self.assertEqual(
+            set(log.output), {
+                f"INFO:{LOGNAME}:tenant1: Entity argo-mon.ni4os.eu created",
+                f"INFO:{LOGNAME}:tenant1: Entity argo-devel.ni4os.eu updated"
+            }
+        )
+
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.sensu.Sensu._delete_entities")
+    @patch("argo_scg.sensu.Sensu._get_proxy_entities")
+    def test_handle_proxy_entities_with_error_with_msg(
             self, mock_get_entities, mock_delete_entities, mock_put
     ):
         mock_get_entities.return_value = mock_entities[:-2]
-        mock_delete_entities.side_effect = mock_delete_response
+        mock_delete_entities.side_effect = mock_delete_objects
         mock_put.side_effect = [
             MockResponse(None, status_code=201),
             MockResponse({"message": "Something went wrong."}, status_code=400)
@@ -6556,14 +7100,14 @@ class SensuEntityTests(unittest.TestCase):
             }
         )
 
-    @patch("requests.put")
+    @patch("argo_scg.session.Session.put")
     @patch("argo_scg.sensu.Sensu._delete_entities")
     @patch("argo_scg.sensu.Sensu._get_proxy_entities")
     def test_handle_proxy_entities_with_error_without_msg(
             self, mock_get_entities, mock_delete_entities, mock_put
     ):
         mock_get_entities.return_value = mock_entities[:-2]
-        mock_delete_entities.side_effect = mock_delete_response
+        mock_delete_entities.side_effect = mock_delete_objects
         mock_put.side_effect = [
             MockResponse(None, status_code=201),
             MockResponse(None, status_code=400)
@@ -6623,7 +7167,7 @@ class SensuAgentsTests(unittest.TestCase):
             }
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_agents(self, mock_get):
         mock_get.side_effect = mock_sensu_request
         with self.assertLogs(LOGNAME) as log:
@@ -6642,7 +7186,7 @@ class SensuAgentsTests(unittest.TestCase):
         )
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_agents_with_error_with_message(self, mock_get):
         mock_get.side_effect = mock_sensu_request_entity_not_ok_with_msg
         with self.assertRaises(SensuException) as context:
@@ -6670,7 +7214,7 @@ class SensuAgentsTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_agents_with_error_without_message(self, mock_get):
         mock_get.side_effect = mock_sensu_request_entity_not_ok_without_msg
         with self.assertRaises(SensuException) as context:
@@ -6697,7 +7241,7 @@ class SensuAgentsTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.patch")
+    @patch("argo_scg.session.Session.patch")
     @patch("argo_scg.sensu.Sensu._get_agents")
     def test_handle_agents_with_metric_parameter_overrides(
             self, mock_get, mock_patch
@@ -6770,7 +7314,7 @@ class SensuAgentsTests(unittest.TestCase):
             }
         )
 
-    @patch("requests.patch")
+    @patch("argo_scg.session.Session.patch")
     @patch("argo_scg.sensu.Sensu._get_agents")
     def test_handle_agents_with_host_attributes(self, mock_get, mock_patch):
         mock_get.return_value = [mock_entities[3], mock_entities[4]]
@@ -6846,7 +7390,7 @@ class SensuAgentsTests(unittest.TestCase):
             }
         )
 
-    @patch("requests.patch")
+    @patch("argo_scg.session.Session.patch")
     @patch("argo_scg.sensu.Sensu._get_agents")
     def test_handle_agents_with_services(self, mock_get, mock_patch):
         mock_get.return_value = [mock_entities[3], mock_entities[4]]
@@ -6942,7 +7486,7 @@ class SensuHandlersTests(unittest.TestCase):
             "runtime_assets": ["sensu-slack-handler"]
         }
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_handlers(self, mock_get):
         mock_get.side_effect = mock_sensu_request
         with self.assertLogs(LOGNAME) as log:
@@ -6959,7 +7503,7 @@ class SensuHandlersTests(unittest.TestCase):
         self.assertEqual(handlers, mock_handlers1)
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_handlers_with_error_with_message(self, mock_get):
         mock_get.side_effect = mock_sensu_request_not_ok_with_msg
         with self.assertRaises(SensuException) as context:
@@ -6986,7 +7530,7 @@ class SensuHandlersTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_handlers_with_error_without_message(self, mock_get):
         mock_get.side_effect = mock_sensu_request_not_ok_without_msg
         with self.assertRaises(SensuException) as context:
@@ -7013,7 +7557,7 @@ class SensuHandlersTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_handlers")
     def test_handle_publisher_handler(self, mock_get_handlers, mock_post):
         mock_get_handlers.return_value = mock_handlers1
@@ -7035,7 +7579,7 @@ class SensuHandlersTests(unittest.TestCase):
             log.output, [f"INFO:{LOGNAME}:tenant1: publisher-handler created"]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_handlers")
     def test_handle_publisher_handler_with_error_with_msg(
             self, mock_get_handlers, mock_post
@@ -7068,7 +7612,7 @@ class SensuHandlersTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_handlers")
     def test_handle_publisher_handler_with_error_without_msg(
             self, mock_get_handlers, mock_post
@@ -7100,7 +7644,7 @@ class SensuHandlersTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_handlers")
     def test_handle_publisher_handler_if_exists_and_same(
             self, mock_get_handlers, mock_post
@@ -7114,7 +7658,7 @@ class SensuHandlersTests(unittest.TestCase):
         self.assertFalse(mock_post.called)
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.patch")
+    @patch("argo_scg.session.Session.patch")
     @patch("argo_scg.sensu.Sensu._get_handlers")
     def test_handle_publisher_handler_if_exists_and_different(
             self, mock_get_handlers, mock_patch
@@ -7141,7 +7685,7 @@ class SensuHandlersTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.patch")
+    @patch("argo_scg.session.Session.patch")
     @patch("argo_scg.sensu.Sensu._get_handlers")
     def test_handle_publisher_handler_if_exists_and_different_with_err_with_msg(
             self, mock_get_handlers, mock_patch
@@ -7169,7 +7713,7 @@ class SensuHandlersTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.patch")
+    @patch("argo_scg.session.Session.patch")
     @patch("argo_scg.sensu.Sensu._get_handlers")
     def test_handle_publisher_handler_if_exists_and_different_with_err_no_msg(
             self, mock_get_handlers, mock_patch
@@ -7197,7 +7741,7 @@ class SensuHandlersTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_handlers")
     def test_handle_slack_handler(self, mock_get_handlers, mock_post):
         mock_get_handlers.return_value = mock_handlers1
@@ -7220,7 +7764,7 @@ class SensuHandlersTests(unittest.TestCase):
             log.output, [f"INFO:{LOGNAME}:tenant1: slack-handler created"]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_handlers")
     def test_handle_slack_handler_with_error_with_msg(
             self, mock_get_handlers, mock_post
@@ -7254,7 +7798,7 @@ class SensuHandlersTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_handlers")
     def test_handle_slack_handler_with_error_without_msg(
             self, mock_get_handlers, mock_post
@@ -7288,7 +7832,7 @@ class SensuHandlersTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_handlers")
     def test_handle_slack_handler_if_exists_and_same(
             self, mock_get_handlers, mock_post
@@ -7304,7 +7848,7 @@ class SensuHandlersTests(unittest.TestCase):
         self.assertFalse(mock_post.called)
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.patch")
+    @patch("argo_scg.session.Session.patch")
     @patch("argo_scg.sensu.Sensu._get_handlers")
     def test_handle_slack_handler_if_exists_and_different(
             self, mock_get_handlers, mock_patch
@@ -7333,7 +7877,7 @@ class SensuHandlersTests(unittest.TestCase):
             log.output, [f"INFO:{LOGNAME}:tenant1: slack-handler updated"]
         )
 
-    @patch("requests.patch")
+    @patch("argo_scg.session.Session.patch")
     @patch("argo_scg.sensu.Sensu._get_handlers")
     def test_handle_slack_handler_if_exists_and_different_with_err_with_msg(
             self, mock_get_handlers, mock_patch
@@ -7365,7 +7909,7 @@ class SensuHandlersTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.patch")
+    @patch("argo_scg.session.Session.patch")
     @patch("argo_scg.sensu.Sensu._get_handlers")
     def test_handle_slack_handler_if_exists_and_different_with_err_without_msg(
             self, mock_get_handlers, mock_patch
@@ -7439,7 +7983,7 @@ class SensuFiltersTests(unittest.TestCase):
             ]
         }
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_filters(self, mock_get):
         mock_get.side_effect = mock_sensu_request
         with self.assertLogs(LOGNAME) as log:
@@ -7455,7 +7999,7 @@ class SensuFiltersTests(unittest.TestCase):
         self.assertEqual(filters, mock_filters1)
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_filters_with_error_with_msg(self, mock_get):
         mock_get.side_effect = mock_sensu_request_not_ok_with_msg
         with self.assertRaises(SensuException) as context:
@@ -7482,7 +8026,7 @@ class SensuFiltersTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_filters_with_error_without_msg(self, mock_get):
         mock_get.side_effect = mock_sensu_request_not_ok_without_msg
         with self.assertRaises(SensuException) as context:
@@ -7507,7 +8051,7 @@ class SensuFiltersTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_filters")
     def test_add_daily_filter(self, mock_filters, mock_post):
         mock_filters.return_value = []
@@ -7529,7 +8073,7 @@ class SensuFiltersTests(unittest.TestCase):
             log.output, [f"INFO:{LOGNAME}:tenant1: daily filter created"]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_filters")
     def test_add_daily_filter_with_err_with_msg(self, mock_filters, mock_post):
         mock_filters.return_value = []
@@ -7562,7 +8106,7 @@ class SensuFiltersTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_filters")
     def test_add_daily_filter_with_err_no_msg(self, mock_filters, mock_post):
         mock_filters.return_value = []
@@ -7593,7 +8137,7 @@ class SensuFiltersTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_filters")
     def test_add_daily_filter_if_exists_and_same(self, mock_filters, mock_post):
         mock_filters.return_value = mock_filters1
@@ -7604,8 +8148,8 @@ class SensuFiltersTests(unittest.TestCase):
         self.assertFalse(mock_post.called)
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.patch")
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.patch")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_filters")
     def test_add_daily_filter_if_exists_and_different(
             self, mock_filters, mock_post, mock_patch
@@ -7640,7 +8184,7 @@ class SensuFiltersTests(unittest.TestCase):
             log.output, [f"INFO:{LOGNAME}:tenant1: daily filter updated"]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_filters")
     def test_add_hard_state_filter(self, mock_filters, mock_post):
         mock_filters.return_value = []
@@ -7662,7 +8206,7 @@ class SensuFiltersTests(unittest.TestCase):
             log.output, [f"INFO:{LOGNAME}:tenant1: hard-state filter created"]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_filters")
     def test_add_hard_state_filter_with_err_with_msg(
             self, mock_filters, mock_post
@@ -7697,7 +8241,7 @@ class SensuFiltersTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_filters")
     def test_add_hard_state_filter_with_err_no_msg(
             self, mock_filters, mock_post
@@ -7731,7 +8275,7 @@ class SensuFiltersTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_filters")
     def test_add_hard_state_filter_if_exists_and_same(
             self, mock_filters, mock_post
@@ -7744,8 +8288,8 @@ class SensuFiltersTests(unittest.TestCase):
         self.assertFalse(mock_post.called)
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.patch")
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.patch")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_filters")
     def test_add_hard_state_filter_if_exists_and_different(
             self, mock_filters, mock_post, mock_patch
@@ -7845,7 +8389,7 @@ class SensuPipelinesTests(unittest.TestCase):
             ]
         }
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_pipelines(self, mock_get):
         mock_get.side_effect = mock_sensu_request
         with self.assertLogs(LOGNAME) as log:
@@ -7861,7 +8405,7 @@ class SensuPipelinesTests(unittest.TestCase):
         self.assertEqual(pipelines, mock_pipelines1)
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_pipelines_with_error_with_msg(self, mock_get):
         mock_get.side_effect = mock_sensu_request_not_ok_with_msg
         with self.assertRaises(SensuException) as context:
@@ -7886,7 +8430,7 @@ class SensuPipelinesTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_pipelines_with_error_without_msg(self, mock_get):
         mock_get.side_effect = mock_sensu_request_not_ok_without_msg
         with self.assertRaises(SensuException) as context:
@@ -7910,7 +8454,7 @@ class SensuPipelinesTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_pipelines")
     def test_reduce_alerts_pipeline(self, mock_pipelines, mock_post):
         mock_pipelines.return_value = []
@@ -7932,7 +8476,7 @@ class SensuPipelinesTests(unittest.TestCase):
             [f"INFO:{LOGNAME}:tenant1: reduce_alerts pipeline created"]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_pipelines")
     def test_add_alerts_pipe_with_err_with_msg(self, mock_pipelines, mock_post):
         mock_pipelines.return_value = []
@@ -7963,7 +8507,7 @@ class SensuPipelinesTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_pipelines")
     def test_add_alert_pipe_with_err_no_msg(self, mock_pipelines, mock_post):
         mock_pipelines.return_value = []
@@ -7994,7 +8538,7 @@ class SensuPipelinesTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_pipelines")
     def test_add_alert_pipe_if_exists_and_same(self, mock_pipeline, mock_post):
         mock_pipeline.return_value = mock_pipelines1
@@ -8005,8 +8549,8 @@ class SensuPipelinesTests(unittest.TestCase):
         self.assertFalse(mock_post.called)
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.patch")
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.patch")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_pipelines")
     def test_add_alert_pipe_if_exists_and_different(
             self, mock_pipeline, mock_post, mock_patch
@@ -8056,7 +8600,7 @@ class SensuPipelinesTests(unittest.TestCase):
             [f"INFO:{LOGNAME}:tenant1: reduce_alerts pipeline updated"]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_pipelines")
     def test_hard_state_pipeline(self, mock_pipelines, mock_post):
         mock_pipelines.return_value = []
@@ -8078,7 +8622,7 @@ class SensuPipelinesTests(unittest.TestCase):
             [f"INFO:{LOGNAME}:tenant1: hard_state pipeline created"]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_pipelines")
     def test_add_hard_pipe_with_err_with_msg(self, mock_pipelines, mock_post):
         mock_pipelines.return_value = []
@@ -8109,7 +8653,7 @@ class SensuPipelinesTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_pipelines")
     def test_add_hard_pipe_with_err_no_msg(self, mock_pipelines, mock_post):
         mock_pipelines.return_value = []
@@ -8140,7 +8684,7 @@ class SensuPipelinesTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_pipelines")
     def test_add_hard_pipe_if_exists(self, mock_pipeline, mock_post):
         mock_pipeline.return_value = mock_pipelines1
@@ -8220,7 +8764,7 @@ class SensuUsageChecksTests(unittest.TestCase):
         }
 
     @patch("argo_scg.sensu.Sensu.get_agents")
-    @patch("argo_scg.sensu.requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_checks")
     def test_add_cpu_check(self, mock_get, mock_post, mock_agents):
         copy_mock_checks = mock_checks.copy()[0:3]
@@ -8244,7 +8788,7 @@ class SensuUsageChecksTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu.get_agents")
-    @patch("argo_scg.sensu.requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_checks")
     def test_add_cpu_check_with_error_with_message(
             self, mock_get, mock_post, mock_agents
@@ -8278,7 +8822,7 @@ class SensuUsageChecksTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu.get_agents")
-    @patch("argo_scg.sensu.requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_checks")
     def test_add_cpu_check_with_error_without_message(
             self, mock_get, mock_post, mock_agents
@@ -8312,8 +8856,8 @@ class SensuUsageChecksTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu.get_agents")
-    @patch("argo_scg.sensu.requests.put")
-    @patch("argo_scg.sensu.requests.post")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_checks")
     def test_add_cpu_check_if_exists_and_same(
             self, mock_get, mock_post, mock_put, mock_agents
@@ -8329,8 +8873,8 @@ class SensuUsageChecksTests(unittest.TestCase):
         self.assertEqual(log.output, DUMMY_LOG)
 
     @patch("argo_scg.sensu.Sensu.get_agents")
-    @patch("argo_scg.sensu.requests.put")
-    @patch("argo_scg.sensu.requests.post")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_checks")
     def test_add_cpu_check_if_exists_and_different(
             self, mock_get, mock_post, mock_put, mock_agents
@@ -8396,8 +8940,8 @@ class SensuUsageChecksTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu.get_agents")
-    @patch("argo_scg.sensu.requests.put")
-    @patch("argo_scg.sensu.requests.post")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_checks")
     def test_update_cpu_check_error_with_message(
             self, mock_get, mock_post, mock_put, mock_agents
@@ -8470,8 +9014,8 @@ class SensuUsageChecksTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu.get_agents")
-    @patch("argo_scg.sensu.requests.put")
-    @patch("argo_scg.sensu.requests.post")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_checks")
     def test_update_cpu_check_error_without_message(
             self, mock_get, mock_post, mock_put, mock_agents
@@ -8544,7 +9088,7 @@ class SensuUsageChecksTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu.get_agents")
-    @patch("argo_scg.sensu.requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_checks")
     def test_add_memory_check(self, mock_get, mock_post, mock_agents):
         mock_checks_copy = mock_checks.copy()
@@ -8568,7 +9112,7 @@ class SensuUsageChecksTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu.get_agents")
-    @patch("argo_scg.sensu.requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_checks")
     def test_add_memory_check_with_error_with_message(
             self, mock_get, mock_post, mock_agents
@@ -8602,7 +9146,7 @@ class SensuUsageChecksTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu.get_agents")
-    @patch("argo_scg.sensu.requests.post")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_checks")
     def test_add_memory_check_with_error_without_message(
             self, mock_get, mock_post, mock_agents
@@ -8636,8 +9180,8 @@ class SensuUsageChecksTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu.get_agents")
-    @patch("argo_scg.sensu.requests.put")
-    @patch("argo_scg.sensu.requests.post")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_checks")
     def test_add_memory_check_if_exists_and_same(
             self, mock_get, mock_post, mock_put, mock_agents
@@ -8653,8 +9197,8 @@ class SensuUsageChecksTests(unittest.TestCase):
         self.assertEqual(log.output, DUMMY_LOG)
 
     @patch("argo_scg.sensu.Sensu.get_agents")
-    @patch("argo_scg.sensu.requests.put")
-    @patch("argo_scg.sensu.requests.post")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_checks")
     def test_add_memory_check_if_exists_and_different(
             self, mock_get, mock_post, mock_put, mock_agents
@@ -8720,8 +9264,8 @@ class SensuUsageChecksTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu.get_agents")
-    @patch("argo_scg.sensu.requests.put")
-    @patch("argo_scg.sensu.requests.post")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_checks")
     def test_update_memory_check_error_with_message(
             self, mock_get, mock_post, mock_put, mock_agents
@@ -8794,8 +9338,8 @@ class SensuUsageChecksTests(unittest.TestCase):
         )
 
     @patch("argo_scg.sensu.Sensu.get_agents")
-    @patch("argo_scg.sensu.requests.put")
-    @patch("argo_scg.sensu.requests.post")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.session.Session.post")
     @patch("argo_scg.sensu.Sensu._get_checks")
     def test_update_memory_check_error_without_message(
             self, mock_get, mock_post, mock_put, mock_agents
@@ -9707,27 +10251,44 @@ class SensuCheckCallTests(unittest.TestCase):
             }
         ]
 
-    @patch("argo_scg.sensu.Sensu._get_entities")
-    @patch("argo_scg.sensu.Sensu._get_checks")
-    def test_get_check_run(self, return_checks, return_entities):
-        return_checks.return_value = self.checks
-        return_entities.return_value = self.entities
+    @patch("argo_scg.session.Session.get")
+    def test_get_check_run(self, mock_get):
+        mock_get.side_effect = mock_sensu_object_request(
+            checks=self.checks, entities=self.entities
+        )
         run, timeout = self.sensu.get_check_run(
             entity="argo.ni4os.eu", check="generic.tcp.connect"
         )
+        self.assertEqual(mock_get.call_count, 2)
+        mock_get.assert_has_calls([
+            call(
+                "https://mock.url.com/api/core/v2/namespaces/default/checks/"
+                "generic.tcp.connect",
+                headers={
+                    "Authorization": "Key t0k3n",
+                    "Content-Type": "application/json"
+                }
+            ),
+            call(
+                "https://mock.url.com/api/core/v2/namespaces/default/entities/"
+                "argo.ni4os.eu",
+                headers={
+                    "Authorization": "Key t0k3n",
+                    "Content-Type": "application/json"
+                }
+            )
+        ])
         self.assertEqual(
             run,
             "/usr/lib64/nagios/plugins/check_tcp -H argo.ni4os.eu -t 120 -p 443"
         )
         self.assertEqual(timeout, 120)
 
-    @patch("argo_scg.sensu.Sensu._get_entities")
-    @patch("argo_scg.sensu.Sensu._get_checks")
-    def test_get_check_run_if_multiple_labels(
-            self, return_checks, return_entities
-    ):
-        return_checks.return_value = self.checks
-        return_entities.return_value = self.entities
+    @patch("argo_scg.session.Session.get")
+    def test_get_check_run_if_multiple_labels(self, mock_get):
+        mock_get.side_effect = mock_sensu_object_request(
+            checks=self.checks, entities=self.entities
+        )
         run, timeout = self.sensu.get_check_run(
             entity="argo.ni4os.eu", check="generic.http.connect"
         )
@@ -9738,19 +10299,17 @@ class SensuCheckCallTests(unittest.TestCase):
         )
         self.assertEqual(timeout, 60)
 
-    @patch("argo_scg.sensu.Sensu._get_entities")
-    @patch("argo_scg.sensu.Sensu._get_checks")
-    def test_get_check_run_if_labels_with_defaults(
-            self, return_checks, return_entities
-    ):
+    @patch("argo_scg.session.Session.get")
+    def test_get_check_run_if_labels_with_defaults(self, mock_get):
         checks = self.checks.copy()
         checks[0]["command"] = "/usr/lib64/nagios/plugins/check_http "\
                                "-H {{ .labels.hostname }} -t 60 --link "\
                                "--onredirect follow {{ .labels.ssl }} "\
                                "-p {{ .labels.port }} " \
                                "-u {{ .labels.path | default \"/\" }}"
-        return_checks.return_value = checks
-        return_entities.return_value = self.entities
+        mock_get.side_effect = mock_sensu_object_request(
+            checks=checks, entities=self.entities
+        )
         run1, timeout1 = self.sensu.get_check_run(
             entity="argo.ni4os.eu", check="generic.http.connect"
         )
@@ -9770,13 +10329,11 @@ class SensuCheckCallTests(unittest.TestCase):
         )
         self.assertEqual(timeout2, 60)
 
-    @patch("argo_scg.sensu.Sensu._get_entities")
-    @patch("argo_scg.sensu.Sensu._get_checks")
-    def test_get_check_run_if_nonexisting_check(
-            self, return_checks, return_entities
-    ):
-        return_checks.return_value = self.checks
-        return_entities.return_value = self.entities
+    @patch("argo_scg.session.Session.get")
+    def test_get_check_run_if_nonexisting_check(self, mock_get):
+        mock_get.side_effect = mock_sensu_object_request(
+            checks=self.checks, entities=self.entities
+        )
         with self.assertRaises(SensuException) as context:
             self.sensu.get_check_run(
                 entity="argo.ni4os.eu", check="generic.certificate.validity"
@@ -9788,13 +10345,11 @@ class SensuCheckCallTests(unittest.TestCase):
             "default"
         )
 
-    @patch("argo_scg.sensu.Sensu._get_entities")
-    @patch("argo_scg.sensu.Sensu._get_checks")
-    def test_get_check_run_if_nonexisting_entity(
-            self, return_checks, return_entities
-    ):
-        return_checks.return_value = self.checks
-        return_entities.return_value = self.entities
+    @patch("argo_scg.session.Session.get")
+    def test_get_check_run_if_nonexisting_entity(self, mock_get):
+        mock_get.side_effect = mock_sensu_object_request(
+            checks=self.checks, entities=self.entities
+        )
         with self.assertRaises(SensuException) as context:
             self.sensu.get_check_run(
                 entity="argo.egi.eu", check="generic.http.connect"
@@ -9805,13 +10360,11 @@ class SensuCheckCallTests(unittest.TestCase):
             "Sensu error: No entity argo.egi.eu in namespace default"
         )
 
-    @patch("argo_scg.sensu.Sensu._get_entities")
-    @patch("argo_scg.sensu.Sensu._get_checks")
-    def test_get_check_run_if_entity_is_agent(
-            self, return_checks, return_entities
-    ):
-        return_checks.return_value = self.checks
-        return_entities.return_value = self.entities
+    @patch("argo_scg.session.Session.get")
+    def test_get_check_run_if_entity_is_agent(self, mock_get):
+        mock_get.side_effect = mock_sensu_object_request(
+            checks=self.checks, entities=self.entities
+        )
         run, timeout = self.sensu.get_check_run(
             entity="sensu-agent1", check="srce.certificate.validity-robot"
         )
@@ -9822,13 +10375,11 @@ class SensuCheckCallTests(unittest.TestCase):
         )
         self.assertEqual(timeout, 900)
 
-    @patch("argo_scg.sensu.Sensu._get_entities")
-    @patch("argo_scg.sensu.Sensu._get_checks")
-    def test_get_check_run_if_entity_is_agent_and_nonexisting_event(
-            self, return_checks, return_entities
-    ):
-        return_checks.return_value = self.checks
-        return_entities.return_value = self.entities
+    @patch("argo_scg.session.Session.get")
+    def test_get_check_run_if_agent_and_nonexisting_event(self, mock_get):
+        mock_get.side_effect = mock_sensu_object_request(
+            checks=self.checks, entities=self.entities
+        )
         with self.assertRaises(SensuException) as context:
             self.sensu.get_check_run(
                 entity="sensu-agent1", check="generic.http.connect"
@@ -9839,13 +10390,11 @@ class SensuCheckCallTests(unittest.TestCase):
             "generic.http.connect in namespace default"
         )
 
-    @patch("argo_scg.sensu.Sensu._get_entities")
-    @patch("argo_scg.sensu.Sensu._get_checks")
-    def test_get_check_run_if_nonexisting_event(
-            self, return_checks, return_entities
-    ):
-        return_checks.return_value = self.checks
-        return_entities.return_value = self.entities
+    @patch("argo_scg.session.Session.get")
+    def test_get_check_run_if_nonexisting_event(self, mock_get):
+        mock_get.side_effect = mock_sensu_object_request(
+            checks=self.checks, entities=self.entities
+        )
         with self.assertRaises(SensuException) as context:
             self.sensu.get_check_run(
                 entity="argo2.ni4os.eu", check="generic.tcp.connect"
@@ -9857,9 +10406,9 @@ class SensuCheckCallTests(unittest.TestCase):
             "generic.tcp.connect in namespace default"
         )
 
-    @patch("argo_scg.sensu.Sensu._get_checks")
-    def test_get_check_subscriptions(self, return_checks):
-        return_checks.return_value = self.checks
+    @patch("argo_scg.session.Session.get")
+    def test_get_check_subscriptions(self, mock_get):
+        mock_get.side_effect = mock_sensu_object_request(checks=self.checks)
         self.assertEqual(
             self.sensu.get_check_subscriptions(check="generic.http.connect"),
             ["entity:sensu-agent1"]
@@ -9870,9 +10419,11 @@ class SensuCheckCallTests(unittest.TestCase):
             ]
         )
 
-    @patch("argo_scg.sensu.Sensu._get_entities")
-    def test_is_entity_agent(self, return_entities):
-        return_entities.return_value = self.entities
+    @patch("argo_scg.session.Session.get")
+    def test_is_entity_agent(self, mock_get):
+        mock_get.side_effect = mock_sensu_object_request(
+            entities=self.entities
+        )
         self.assertTrue(
             self.sensu.is_entity_agent(
                 entity="sensu-agent1", namespace="default"
@@ -9884,9 +10435,11 @@ class SensuCheckCallTests(unittest.TestCase):
             )
         )
 
-    @patch("argo_scg.sensu.Sensu._get_entities")
-    def test_is_entity_agent_if_nonexisting_entity(self, return_entities):
-        return_entities.return_value = self.entities
+    @patch("argo_scg.session.Session.get")
+    def test_is_entity_agent_if_nonexisting_entity(self, mock_get):
+        mock_get.side_effect = mock_sensu_object_request(
+            entities=self.entities
+        )
         with self.assertRaises(SensuException) as context:
             self.sensu.is_entity_agent(
                 entity="nonexisting-entity", namespace="default"
@@ -9897,72 +10450,382 @@ class SensuCheckCallTests(unittest.TestCase):
             "Sensu error: No entity nonexisting-entity in namespace default"
         )
 
-
-class SensuSilencingEntryTests(unittest.TestCase):
-    def setUp(self):
-        self.sensu = Sensu(
-            url="https://mock.url.com",
-            token="t0k3n",
-            namespaces={
-                "default": ["default"],
-                "tenant1": ["TENANT1"],
-                "tenant2": ["TENANT2"]
-            }
+    @patch("argo_scg.session.Session.get")
+    def test_is_entity_agent_with_error(self, mock_get):
+        mock_get.return_value = MockResponse(
+            {"message": "Something went wrong."}, status_code=400
         )
+        with self.assertRaises(SensuException) as context:
+            self.sensu.is_entity_agent(
+                entity="sensu-agent1", namespace="default"
+            )
 
-    @patch("argo_scg.sensu.Sensu._get_events")
-    @patch("requests.post")
-    def test_create_silencing_entry(self, mock_post, mock_get_events):
-        mock_post.side_effect = mock_post_response
-        mock_get_events.return_value = MockResponse(
-            mock_events, status_code=200
+        self.assertEqual(
+            context.exception.__str__(),
+            "Sensu error: default: Entities fetch error: 400 BAD REQUEST: "
+            "Something went wrong."
         )
-        self.sensu.create_silencing_entry(
-            check="generic.tcp.connect",
-            entity="gocdb.ni4os.eu",
-            namespace="tenant1"
+
+    @patch("argo_scg.session.Session.get")
+    def test_is_entity_agent_with_loaded_entities(self, mock_get):
+        mock_get.return_value = MockResponse(self.entities, status_code=200)
+        self.sensu._get_entities(namespace="default")
+        self.assertTrue(
+            self.sensu.is_entity_agent(
+                entity="sensu-agent1", namespace="default"
+            )
         )
-        mock_post.assert_called_once_with(
-            "https://mock.url.com/api/core/v2/namespaces/tenant1/silenced",
-            data=json.dumps({
-                "metadata": {
-                    "name": "entity:gocdb.ni4os.eu:generic.tcp.connect",
-                    "namespace": "tenant1"
-                },
-                "expire_on_resolve": True,
-                "check": "generic.tcp.connect",
-                "subscription": "entity:gocdb.ni4os.eu"
-            }),
+        with self.assertRaises(SensuException):
+            self.sensu.is_entity_agent(
+                entity="nonexisting-entity", namespace="default"
+            )
+
+        mock_get.assert_called_once_with(
+            "https://mock.url.com/api/core/v2/namespaces/default/entities",
             headers={
                 "Authorization": "Key t0k3n",
                 "Content-Type": "application/json"
             }
         )
 
-    @patch("argo_scg.sensu.Sensu._get_events")
-    @patch("requests.post")
-    def test_create_silencing_entry_with_error_with_message(
-            self, mock_post, mock_get_events
-    ):
-        mock_post.return_value = MockResponse(
-            {"message": "There has been an error"}, status_code=400
+
+    @patch("argo_scg.session.Session.get")
+    def test_get_check_runs(self, mock_get):
+        mock_get.side_effect = mock_sensu_object_request(
+            checks=self.checks, entities=self.entities
         )
-        mock_get_events.return_value = MockResponse(
-            mock_events, status_code=200
+        runs, errors = self.sensu.get_check_runs(
+            check="generic.tcp.connect", entities=[
+                "argo.ni4os.eu", "argo2.ni4os.eu", "sensu-agent1",
+                "nonexisting-entity"
+            ]
         )
-        with self.assertRaises(SensuException) as context:
-            self.sensu.create_silencing_entry(
-                check="generic.tcp.connect",
-                entity="gocdb.ni4os.eu",
-                namespace="tenant1"
-            )
-        mock_post.assert_called_once_with(
-            "https://mock.url.com/api/core/v2/namespaces/tenant1/silenced",
-            data=json.dumps({
-                "metadata": {
-                    "name": "entity:gocdb.ni4os.eu:generic.tcp.connect",
-                    "namespace": "tenant1"
-                },
+        # entities are looked up by name, the collection is not fetched
+        self.assertEqual(mock_get.call_count, 5)
+        self.assertEqual(
+            sorted(item[0][0].split("/default/")[1] for item in
+                   mock_get.call_args_list), [
+                "checks/generic.tcp.connect", "entities/argo.ni4os.eu",
+                "entities/argo2.ni4os.eu", "entities/nonexisting-entity",
+                "entities/sensu-agent1"
+            ]
+        )
+        self.assertEqual(
+            runs, {
+                "argo.ni4os.eu": (
+                    "/usr/lib64/nagios/plugins/check_tcp -H argo.ni4os.eu "
+                    "-t 120 -p 443",
+                    120
+                )
+            }
+        )
+        self.assertEqual(
+            errors, {
+                "argo2.ni4os.eu":
+                    "No event with entity argo2.ni4os.eu and check "
+                    "generic.tcp.connect in namespace default",
+                "sensu-agent1":
+                    "No event with entity sensu-agent1 and check "
+                    "generic.tcp.connect in namespace default",
+                "nonexisting-entity":
+                    "No entity nonexisting-entity in namespace default"
+            }
+        )
+
+    @patch("argo_scg.session.Session.get")
+    def test_get_check_runs_with_entity_fetch_error(self, mock_get):
+        def get_response(*args, **kwargs):
+            if args[0].endswith("entities/argo2.ni4os.eu"):
+                return MockResponse(
+                    {"message": "Something went wrong."}, status_code=400
+                )
+
+            return mock_sensu_object_request(
+                checks=self.checks, entities=self.entities
+            )(*args, **kwargs)
+
+        mock_get.side_effect = get_response
+        runs, errors = self.sensu.get_check_runs(
+            check="generic.tcp.connect",
+            entities=["argo.ni4os.eu", "argo2.ni4os.eu"]
+        )
+        self.assertEqual(list(runs.keys()), ["argo.ni4os.eu"])
+        self.assertEqual(
+            errors, {
+                "argo2.ni4os.eu":
+                    "default: Entities fetch error: 400 BAD REQUEST: "
+                    "Something went wrong."
+            }
+        )
+
+    @patch("argo_scg.session.Session.get")
+    def test_get_check_runs_for_service_type(self, mock_get):
+        entities = copy.deepcopy(self.entities)
+        entities[0]["metadata"]["labels"].update({"service": "argo.webui"})
+        entities[1]["metadata"]["labels"].update({"service": "argo.webui"})
+
+        def get_response(*args, **kwargs):
+            if args[0].endswith("entities"):
+                return MockResponse(entities, status_code=200)
+
+            return mock_sensu_object_request(checks=self.checks)(
+                *args, **kwargs
+            )
+
+        mock_get.side_effect = get_response
+        runs, errors = self.sensu.get_check_runs(
+            check="generic.tcp.connect", service_type="argo.webui"
+        )
+        mock_get.assert_called_with(
+            "https://mock.url.com/api/core/v2/namespaces/default/entities",
+            headers={
+                "Authorization": "Key t0k3n",
+                "Content-Type": "application/json"
+            },
+            params={"labelSelector": "service == argo.webui"}
+        )
+        self.assertEqual(
+            runs, {
+                "argo.ni4os.eu": (
+                    "/usr/lib64/nagios/plugins/check_tcp -H argo.ni4os.eu "
+                    "-t 120 -p 443",
+                    120
+                )
+            }
+        )
+        self.assertEqual(errors, {})
+
+    @patch("argo_scg.session.Session.delete")
+    @patch("argo_scg.session.Session.post")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.session.Session.get")
+    def test_run_adhoc_checks(self, mock_get, mock_put, mock_post, mock_delete):
+        def get_response(*args, **kwargs):
+            if args[0].endswith("entities"):
+                return MockResponse(self.entities[2:], status_code=200)
+
+            if args[0].endswith("silenced"):
+                return MockResponse([], status_code=200)
+
+            if "/events/" in args[0]:
+                check = args[0].split("/")[-1]
+                return MockResponse({
+                    "entity": {"metadata": {"name": "sensu-agent1"}},
+                    "check": {
+                        "metadata": {"name": check},
+                        "output": f"OK - {check}",
+                        "issued": 1000
+                    }
+                }, status_code=200)
+
+            return mock_sensu_object_request(checks=self.checks)(
+                *args, **kwargs
+            )
+
+        def post_response(*args, **kwargs):
+            if "adhoc-check-123-1" in args[0]:
+                return MockResponse(
+                    {"message": "Something went wrong."}, status_code=400
+                )
+
+            return MockResponse({"issued": 1000}, status_code=202)
+
+        mock_get.side_effect = get_response
+        mock_put.return_value = MockResponse(None, status_code=201)
+        mock_post.side_effect = post_response
+        mock_delete.side_effect = mock_delete_response
+        with patch("argo_scg.sensu.time.monotonic", return_value=10):
+            results = self.sensu.run_adhoc_checks(
+                check="generic.tcp.connect", runs={
+                    "sensu-agent1": ("/usr/bin/check -H sensu-agent1", 60),
+                    "argo.ni4os.eu": ("/usr/bin/check -H argo.ni4os.eu", 60)
+                }, prefix="adhoc-check-123"
+            )
+
+        self.assertEqual(
+            results, {
+                "argo.ni4os.eu": ("OK - adhoc-check-123-0", 0),
+                "sensu-agent1": (
+                    "Sensu error: default: Check adhoc-check-123-1 not "
+                    "executed: 400 BAD REQUEST: Something went wrong.",
+                    None
+                )
+            }
+        )
+        self.assertEqual(mock_put.call_count, 2)
+        self.assertEqual(
+            json.loads(mock_put.call_args_list[0][1]["data"]),
+            generate_adhoc_check(
+                command="/usr/bin/check -H argo.ni4os.eu",
+                subscriptions=["entity:sensu-agent1"],
+                namespace="default", name="adhoc-check-123-0"
+            )
+        )
+        self.assertEqual(
+            json.loads(mock_put.call_args_list[1][1]["data"]),
+            generate_adhoc_check(
+                command="/usr/bin/check -H sensu-agent1",
+                subscriptions=["entity:sensu-agent1"],
+                namespace="default", name="adhoc-check-123-1"
+            )
+        )
+        self.assertEqual(mock_delete.call_count, 3)
+        mock_delete.assert_has_calls([
+            call(
+                "https://mock.url.com/api/core/v2/namespaces/default/events/"
+                "sensu-agent1/adhoc-check-123-0",
+                headers={"Authorization": "Key t0k3n"}
+            ),
+            call(
+                "https://mock.url.com/api/core/v2/namespaces/default/checks/"
+                "adhoc-check-123-0",
+                headers={"Authorization": "Key t0k3n"}
+            ),
+            call(
+                "https://mock.url.com/api/core/v2/namespaces/default/checks/"
+                "adhoc-check-123-1",
+                headers={"Authorization": "Key t0k3n"}
+            )
+        ])
+
+    @patch("argo_scg.session.Session.delete")
+    @patch("argo_scg.session.Session.post")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.session.Session.get")
+    def test_run_adhoc_checks_with_connection_error(
+            self, mock_get, mock_put, mock_post, mock_delete
+    ):
+        def get_response(*args, **kwargs):
+            if args[0].endswith("entities"):
+                return MockResponse(self.entities[2:], status_code=200)
+
+            if args[0].endswith("silenced"):
+                return MockResponse([], status_code=200)
+
+            if "/events/" in args[0]:
+                check = args[0].split("/")[-1]
+                return MockResponse({
+                    "entity": {"metadata": {"name": "sensu-agent1"}},
+                    "check": {
+                        "metadata": {"name": check},
+                        "output": f"OK - {check}",
+                        "issued": 1000
+                    }
+                }, status_code=200)
+
+            return mock_sensu_object_request(checks=self.checks)(
+                *args, **kwargs
+            )
+
+        def post_response(*args, **kwargs):
+            if "adhoc-check-123-1" in args[0]:
+                raise requests.ConnectionError("Connection refused")
+
+            return MockResponse({"issued": 1000}, status_code=202)
+
+        mock_get.side_effect = get_response
+        mock_put.return_value = MockResponse(None, status_code=201)
+        mock_post.side_effect = post_response
+        mock_delete.side_effect = mock_delete_response
+        with patch("argo_scg.sensu.time.monotonic", return_value=10):
+            results = self.sensu.run_adhoc_checks(
+                check="generic.tcp.connect", runs={
+                    "sensu-agent1": ("/usr/bin/check -H sensu-agent1", 60),
+                    "argo.ni4os.eu": ("/usr/bin/check -H argo.ni4os.eu", 60)
+                }, prefix="adhoc-check-123"
+            )
+
+        self.assertEqual(
+            results, {
+                "argo.ni4os.eu": ("OK - adhoc-check-123-0", 0),
+                "sensu-agent1": ("Connection refused", None)
+            }
+        )
+        self.assertEqual(mock_delete.call_count, 3)
+        mock_delete.assert_has_calls([
+            call(
+                "https://mock.url.com/api/core/v2/namespaces/default/events/"
+                "sensu-agent1/adhoc-check-123-0",
+                headers={"Authorization": "Key t0k3n"}
+            ),
+            call(
+                "https://mock.url.com/api/core/v2/namespaces/default/checks/"
+                "adhoc-check-123-0",
+                headers={"Authorization": "Key t0k3n"}
+            ),
+            call(
+                "https://mock.url.com/api/core/v2/namespaces/default/checks/"
+                "adhoc-check-123-1",
+                headers={"Authorization": "Key t0k3n"}
+            )
+        ])
+
+
+class SensuSilencingEntryTests(unittest.TestCase):
+    def setUp(self):
+        self.sensu = Sensu(
+            url="https://mock.url.com",
+            token="t0k3n",
+            namespaces={
+                "default": ["default"],
+                "tenant1": ["TENANT1"],
+                "tenant2": ["TENANT2"]
+            }
+        )
+
+    @patch("argo_scg.session.Session.get")
+    @patch("argo_scg.session.Session.post")
+    def test_create_silencing_entry(self, mock_post, mock_get):
+        mock_post.side_effect = mock_post_response
+        mock_get.side_effect = mock_sensu_object_request(
+            events=mock_events
+        )
+        self.sensu.create_silencing_entry(
+            check="generic.tcp.connect",
+            entity="gocdb.ni4os.eu",
+            namespace="tenant1"
+        )
+        mock_post.assert_called_once_with(
+            "https://mock.url.com/api/core/v2/namespaces/tenant1/silenced",
+            data=json.dumps({
+                "metadata": {
+                    "name": "entity:gocdb.ni4os.eu:generic.tcp.connect",
+                    "namespace": "tenant1"
+                },
+                "expire_on_resolve": True,
+                "check": "generic.tcp.connect",
+                "subscription": "entity:gocdb.ni4os.eu"
+            }),
+            headers={
+                "Authorization": "Key t0k3n",
+                "Content-Type": "application/json"
+            }
+        )
+
+    @patch("argo_scg.session.Session.get")
+    @patch("argo_scg.session.Session.post")
+    def test_create_silencing_entry_with_error_with_message(
+            self, mock_post, mock_get
+    ):
+        mock_post.return_value = MockResponse(
+            {"message": "There has been an error"}, status_code=400
+        )
+        mock_get.side_effect = mock_sensu_object_request(
+            events=mock_events
+        )
+        with self.assertRaises(SensuException) as context:
+            self.sensu.create_silencing_entry(
+                check="generic.tcp.connect",
+                entity="gocdb.ni4os.eu",
+                namespace="tenant1"
+            )
+        mock_post.assert_called_once_with(
+            "https://mock.url.com/api/core/v2/namespaces/tenant1/silenced",
+            data=json.dumps({
+                "metadata": {
+                    "name": "entity:gocdb.ni4os.eu:generic.tcp.connect",
+                    "namespace": "tenant1"
+                },
                 "expire_on_resolve": True,
                 "check": "generic.tcp.connect",
                 "subscription": "entity:gocdb.ni4os.eu"
@@ -9979,14 +10842,14 @@ class SensuSilencingEntryTests(unittest.TestCase):
             "There has been an error"
         )
 
-    @patch("argo_scg.sensu.Sensu._get_events")
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.get")
+    @patch("argo_scg.session.Session.post")
     def test_create_silencing_entry_with_error_without_message(
-            self, mock_post, mock_get_events
+            self, mock_post, mock_get
     ):
         mock_post.return_value = MockResponse(None, status_code=400)
-        mock_get_events.return_value = MockResponse(
-            mock_events, status_code=200
+        mock_get.side_effect = mock_sensu_object_request(
+            events=mock_events
         )
         with self.assertRaises(SensuException) as context:
             self.sensu.create_silencing_entry(
@@ -10016,14 +10879,14 @@ class SensuSilencingEntryTests(unittest.TestCase):
             "generic.tcp.connect create error: 400 BAD REQUEST"
         )
 
-    @patch("argo_scg.sensu.Sensu._get_events")
-    @patch("requests.post")
+    @patch("argo_scg.session.Session.get")
+    @patch("argo_scg.session.Session.post")
     def test_create_silencing_entry_if_nonexisting_event(
-            self, mock_post, mock_get_events
+            self, mock_post, mock_get
     ):
         mock_post.side_effect = mock_post_response
-        mock_get_events.return_value = MockResponse(
-            mock_events, status_code=200
+        mock_get.side_effect = mock_sensu_object_request(
+            events=mock_events
         )
         with self.assertRaises(SensuException) as context:
             self.sensu.create_silencing_entry(
@@ -10039,7 +10902,7 @@ class SensuSilencingEntryTests(unittest.TestCase):
             "generic.http.connect: Silencing entry not created"
         )
 
-    @patch("argo_scg.sensu.requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_silenced_entries(self, mock_get):
         mock_get.side_effect = mock_sensu_request
         silenced_entries = self.sensu._get_silenced_entries(namespace="tenant1")
@@ -10049,7 +10912,7 @@ class SensuSilencingEntryTests(unittest.TestCase):
         )
         self.assertEqual(silenced_entries, mock_silenced)
 
-    @patch("argo_scg.sensu.requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_silenced_entries_with_error_with_message(self, mock_get):
         mock_get.side_effect = mock_sensu_request_not_ok_with_msg
         with self.assertRaises(SensuException) as context:
@@ -10064,7 +10927,7 @@ class SensuSilencingEntryTests(unittest.TestCase):
             "400 BAD REQUEST: Something went wrong."
         )
 
-    @patch("argo_scg.sensu.requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_silenced_entries_with_error_without_message(self, mock_get):
         mock_get.side_effect = mock_sensu_request_not_ok_without_msg
         with self.assertRaises(SensuException) as context:
@@ -10079,7 +10942,7 @@ class SensuSilencingEntryTests(unittest.TestCase):
             "400 BAD REQUEST"
         )
 
-    @patch("argo_scg.sensu.requests.delete")
+    @patch("argo_scg.session.Session.delete")
     @patch("argo_scg.sensu.Sensu._get_silenced_entries")
     def test_delete_silenced_entry(self, mock_silenced_entries, mock_delete):
         mock_silenced_entries.return_value = mock_silenced
@@ -10095,7 +10958,7 @@ class SensuSilencingEntryTests(unittest.TestCase):
             headers={"Authorization": "Key t0k3n"}
         )
 
-    @patch("argo_scg.sensu.requests.delete")
+    @patch("argo_scg.session.Session.delete")
     @patch("argo_scg.sensu.Sensu._get_silenced_entries")
     def test_delete_silenced_entry_with_only_entity_given(
             self, mock_silenced_entries, mock_delete
@@ -10120,7 +10983,7 @@ class SensuSilencingEntryTests(unittest.TestCase):
             )
         ], any_order=True)
 
-    @patch("argo_scg.sensu.requests.delete")
+    @patch("argo_scg.session.Session.delete")
     @patch("argo_scg.sensu.Sensu._get_silenced_entries")
     def test_delete_silenced_entry_with_only_check_given(
             self, mock_silenced_entries, mock_delete
@@ -10145,7 +11008,7 @@ class SensuSilencingEntryTests(unittest.TestCase):
             )
         ], any_order=True)
 
-    @patch("argo_scg.sensu.requests.delete")
+    @patch("argo_scg.session.Session.delete")
     @patch("argo_scg.sensu.Sensu._get_silenced_entries")
     def test_delete_silenced_entry_with_error_with_message(
             self, mock_silenced_entries, mock_delete
@@ -10178,7 +11041,7 @@ class SensuSilencingEntryTests(unittest.TestCase):
             "not removed"
         )
 
-    @patch("argo_scg.sensu.requests.delete")
+    @patch("argo_scg.session.Session.delete")
     @patch("argo_scg.sensu.Sensu._get_silenced_entries")
     def test_delete_silenced_entry_with_multiple_errors_with_message(
             self, mock_silenced_entries, mock_delete
@@ -10214,7 +11077,7 @@ class SensuSilencingEntryTests(unittest.TestCase):
             "not removed"
         )
 
-    @patch("argo_scg.sensu.requests.delete")
+    @patch("argo_scg.session.Session.delete")
     @patch("argo_scg.sensu.Sensu._get_silenced_entries")
     def test_delete_silenced_entry_with_error_without_message(
             self, mock_silenced_entries, mock_delete
@@ -10246,7 +11109,7 @@ class SensuSilencingEntryTests(unittest.TestCase):
             "(400 BAD REQUEST) not removed"
         )
 
-    @patch("argo_scg.sensu.requests.delete")
+    @patch("argo_scg.session.Session.delete")
     @patch("argo_scg.sensu.Sensu._get_silenced_entries")
     def test_delete_silenced_entry_with_multiple_errors_without_message(
             self, mock_silenced_entries, mock_delete
@@ -10279,6 +11142,524 @@ class SensuSilencingEntryTests(unittest.TestCase):
             "(400 BAD REQUEST) not removed"
         )
 
+    @patch("argo_scg.session.Session.delete")
+    @patch("argo_scg.sensu.Sensu._get_silenced_entries")
+    def test_delete_silenced_entries(self, mock_silenced_entries, mock_delete):
+        mock_silenced_entries.return_value = mock_silenced
+        mock_delete.side_effect = mock_delete_response
+        self.sensu._delete_silenced_entries(
+            entities=["hostname1.example.com"],
+            checks=["generic.http.connect"],
+            events=[("hostname2.example.com", "generic.tcp.connect")],
+            namespace="tenant1"
+        )
+        mock_silenced_entries.assert_called_once_with(namespace="tenant1")
+        self.assertEqual(mock_delete.call_count, 4)
+        mock_delete.assert_has_calls([
+            call(
+                "https://mock.url.com/api/core/v2/namespaces/tenant1/silenced/"
+                "entity:hostname1.example.com:generic.tcp.connect",
+                headers={"Authorization": "Key t0k3n"}
+            ),
+            call(
+                "https://mock.url.com/api/core/v2/namespaces/tenant1/silenced/"
+                "entity:hostname2.example.com:generic.http.connect",
+                headers={"Authorization": "Key t0k3n"}
+            ),
+            call(
+                "https://mock.url.com/api/core/v2/namespaces/tenant1/silenced/"
+                "entity:hostname2.example.com:generic.tcp.connect",
+                headers={"Authorization": "Key t0k3n"}
+            ),
+            call(
+                "https://mock.url.com/api/core/v2/namespaces/tenant1/silenced/"
+                "entity:hostname1.example.com:generic.certificate.validity",
+                headers={"Authorization": "Key t0k3n"}
+            )
+        ], any_order=True)
+
+    @patch("argo_scg.session.Session.delete")
+    @patch("argo_scg.sensu.Sensu._get_silenced_entries")
+    def test_delete_silenced_entries_without_matches(
+            self, mock_silenced_entries, mock_delete
+    ):
+        mock_silenced_entries.return_value = mock_silenced
+        self.sensu._delete_silenced_entries(
+            entities=["hostname3.example.com"],
+            events=[("hostname1.example.com", "generic.http.connect")],
+            namespace="tenant1"
+        )
+        mock_silenced_entries.assert_called_once_with(namespace="tenant1")
+        self.assertFalse(mock_delete.called)
+
+    @patch("argo_scg.session.Session.delete")
+    @patch("argo_scg.sensu.Sensu._get_silenced_entries")
+    def test_delete_silenced_entries_with_nothing_deleted(
+            self, mock_silenced_entries, mock_delete
+    ):
+        self.sensu._delete_silenced_entries(
+            entities=[], checks=[], namespace="tenant1"
+        )
+        self.assertFalse(mock_silenced_entries.called)
+        self.assertFalse(mock_delete.called)
+
+    @patch("argo_scg.session.Session.delete")
+    @patch("argo_scg.sensu.Sensu._get_silenced_entries")
+    def test_delete_silenced_entries_with_multiple_errors(
+            self, mock_silenced_entries, mock_delete
+    ):
+        def delete_response(*args, **kwargs):
+            if args[0].endswith("generic.tcp.connect"):
+                return MockResponse(
+                    {"message": "Something went wrong"}, status_code=400
+                )
+
+            return MockResponse(None, status_code=204)
+
+        self.sensu.concurrency = 4
+        mock_silenced_entries.return_value = mock_silenced
+        mock_delete.side_effect = delete_response
+        with self.assertRaises(SCGWarnException) as context:
+            self.sensu._delete_silenced_entries(
+                entities=["hostname1.example.com", "hostname2.example.com"],
+                namespace="tenant1"
+            )
+        self.assertEqual(mock_delete.call_count, 4)
+        self.assertEqual(
+            context.exception.__str__(),
+            "Silenced entries "
+            "entity:hostname1.example.com:generic.tcp.connect "
+            "(400 BAD REQUEST: Something went wrong), "
+            "entity:hostname2.example.com:generic.tcp.connect "
+            "(400 BAD REQUEST: Something went wrong) not removed"
+        )
+
+
+class SensuSnapshotTests(unittest.TestCase):
+    def setUp(self):
+        self.sensu = Sensu(
+            url="https://sensu.mock.com:8080",
+            token="t0k3n",
+            namespaces={
+                "default": ["default"],
+                "tenant1": ["TENANT1"]
+            }
+        )
+
+    @patch("argo_scg.session.Session.get")
+    def test_collections_fetched_once(self, mock_get):
+        mock_get.side_effect = mock_sensu_request
+        self.assertEqual(
+            self.sensu._get_checks(namespace="tenant1"), mock_checks
+        )
+        self.assertEqual(
+            self.sensu._get_checks(namespace="tenant1"), mock_checks
+        )
+        self.sensu._get_entities(namespace="tenant1")
+        self.sensu._get_proxy_entities(namespace="tenant1")
+        self.sensu._get_agents(namespace="tenant1")
+        self.sensu.get_agents(namespace="tenant1")
+        self.assertTrue(
+            self.sensu.is_entity_agent(
+                entity="sensu-agent1", namespace="tenant1"
+            )
+        )
+        self.sensu._get_checks(namespace="default")
+        self.assertEqual(mock_get.call_count, 3)
+        mock_get.assert_has_calls([
+            call(
+                "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
+                "checks",
+                headers={
+                    "Authorization": "Key t0k3n",
+                    "Content-Type": "application/json"
+                }
+            ),
+            call(
+                "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
+                "entities",
+                headers={
+                    "Authorization": "Key t0k3n",
+                    "Content-Type": "application/json"
+                }
+            ),
+            call(
+                "https://sensu.mock.com:8080/api/core/v2/namespaces/default/"
+                "checks",
+                headers={
+                    "Authorization": "Key t0k3n",
+                    "Content-Type": "application/json"
+                }
+            )
+        ])
+
+    @patch("argo_scg.session.Session.get")
+    def test_invalidate_snapshot(self, mock_get):
+        mock_get.side_effect = mock_sensu_request
+        self.sensu._get_checks(namespace="tenant1")
+        self.sensu._get_checks(namespace="default")
+        self.sensu.invalidate_snapshot(namespace="tenant1")
+        self.sensu._get_checks(namespace="tenant1")
+        self.sensu._get_checks(namespace="default")
+        self.assertEqual(mock_get.call_count, 3)
+        self.sensu.invalidate_snapshot()
+        self.sensu._get_checks(namespace="tenant1")
+        self.sensu._get_checks(namespace="default")
+        self.assertEqual(mock_get.call_count, 5)
+
+    @patch("argo_scg.session.Session.get")
+    def test_failed_fetch_not_stored(self, mock_get):
+        mock_get.side_effect = [
+            MockResponse(None, status_code=400),
+            MockResponse(mock_checks, status_code=200)
+        ]
+        with self.assertRaises(SensuException):
+            with self.assertLogs(LOGNAME):
+                self.sensu._get_checks(namespace="tenant1")
+
+        self.assertEqual(
+            self.sensu._get_checks(namespace="tenant1"), mock_checks
+        )
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("argo_scg.sensu.Sensu._delete_silenced_entry")
+    @patch("argo_scg.session.Session.delete")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.session.Session.get")
+    def test_snapshot_updated_after_writes(
+            self, mock_get, mock_put, mock_delete, mock_delete_silenced
+    ):
+        mock_get.side_effect = mock_sensu_request
+        mock_put.side_effect = mock_post_response
+        mock_delete.side_effect = mock_delete_response
+        check = {
+            "command": "/usr/lib64/nagios/plugins/check_tcp -H argo.ni4os.eu "
+                       "-t 120 -p 443",
+            "subscriptions": ["entity:sensu-agent1"],
+            "handlers": [],
+            "interval": 86400,
+            "timeout": 900,
+            "publish": False,
+            "metadata": {
+                "name": "adhoc-check",
+                "namespace": "tenant1"
+            },
+            "round_robin": False
+        }
+        self.sensu._get_checks(namespace="tenant1")
+        self.sensu.put_check(check=check, namespace="tenant1")
+        self.sensu.delete_check(
+            check="generic.tcp.connect", namespace="tenant1"
+        )
+        self.assertEqual(
+            [c["metadata"]["name"] for c in self.sensu._get_checks(
+                namespace="tenant1"
+            )], [
+                "generic.http.ar-argoui-ni4os",
+                "generic.http.status-argoui-ni4os",
+                "sensu.cpu.usage",
+                "sensu.memory.usage",
+                "adhoc-check"
+            ]
+        )
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.session.Session.get")
+    def test_failed_write_not_stored(self, mock_get, mock_put):
+        mock_get.side_effect = mock_sensu_request
+        mock_put.side_effect = mock_post_response_not_ok_without_msg
+        check = copy.deepcopy(mock_checks[0])
+        check["interval"] = 3600
+        self.sensu._get_checks(namespace="tenant1")
+        with self.assertRaises(SensuException):
+            self.sensu.put_check(check=check, namespace="tenant1")
+
+        self.assertEqual(
+            self.sensu._get_checks(namespace="tenant1"), mock_checks
+        )
+
+    @patch("argo_scg.session.Session.put")
+    def test_write_before_fetch_not_stored(self, mock_put):
+        mock_put.side_effect = mock_post_response
+        self.sensu.put_check(check=mock_checks[0], namespace="tenant1")
+        self.assertIsNone(self.sensu._snapshot.get("tenant1", "checks"))
+
+    def test_patch(self):
+        self.sensu._snapshot.load("tenant1", "entities", mock_entities)
+        self.sensu._snapshot.patch(
+            "tenant1", "entities", "sensu-agent1", {
+                "subscriptions": ["entity:sensu-agent1"],
+                "metadata": {"labels": {"hostname": "sensu-agent1"}}
+            }
+        )
+        agent = [
+            e for e in self.sensu._get_entities(namespace="tenant1") if
+            e["metadata"]["name"] == "sensu-agent1"
+        ][0]
+        self.assertEqual(agent["subscriptions"], ["entity:sensu-agent1"])
+        self.assertEqual(agent["metadata"]["name"], "sensu-agent1")
+        self.assertEqual(
+            agent["metadata"]["labels"]["hostname"], "sensu-agent1"
+        )
+        self.assertNotEqual(
+            mock_entities[3]["subscriptions"], ["entity:sensu-agent1"]
+        )
+
+
+class SensuPaginationTests(unittest.TestCase):
+    def setUp(self):
+        self.sensu = Sensu(
+            url="https://sensu.mock.com:8080",
+            token="t0k3n",
+            namespaces={
+                "default": ["default"],
+                "tenant1": ["TENANT1"]
+            },
+            page_size=2
+        )
+        self.url = \
+            "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
+        self.headers = {
+            "Authorization": "Key t0k3n",
+            "Content-Type": "application/json"
+        }
+
+    @patch("argo_scg.session.Session.get")
+    def test_get_entities_in_pages(self, mock_get):
+        mock_get.side_effect = [
+            MockResponse(
+                mock_entities[:2], status_code=200,
+                headers={"Sensu-Continue": "abc"}
+            ),
+            MockResponse(
+                mock_entities[2:4], status_code=200,
+                headers={"Sensu-Continue": "def"}
+            ),
+            MockResponse(mock_entities[4:], status_code=200)
+        ]
+        self.assertEqual(
+            self.sensu._get_entities(namespace="tenant1"), mock_entities
+        )
+        self.assertEqual(
+            self.sensu._get_proxy_entities(namespace="tenant1"),
+            mock_entities[:3]
+        )
+        self.assertEqual(
+            self.sensu._get_agents(namespace="tenant1"), mock_entities[3:]
+        )
+        self.assertEqual(mock_get.call_count, 3)
+        mock_get.assert_has_calls([
+            call(
+                f"{self.url}entities", headers=self.headers,
+                params={"limit": 2}
+            ),
+            call(
+                f"{self.url}entities", headers=self.headers,
+                params={"limit": 2, "continue": "abc"}
+            ),
+            call(
+                f"{self.url}entities", headers=self.headers,
+                params={"limit": 2, "continue": "def"}
+            )
+        ])
+
+    @patch("argo_scg.session.Session.get")
+    def test_get_checks_with_error_in_page(self, mock_get):
+        mock_get.side_effect = [
+            MockResponse(
+                mock_checks[:2], status_code=200,
+                headers={"Sensu-Continue": "abc"}
+            ),
+            MockResponse(
+                {"message": "Something went wrong"}, status_code=500
+            ),
+            MockResponse(mock_checks, status_code=200)
+        ]
+        with self.assertRaises(SensuException) as context:
+            with self.assertLogs(LOGNAME) as log:
+                self.sensu._get_checks(namespace="tenant1")
+
+        self.assertEqual(
+            context.exception.__str__(),
+            "Sensu error: tenant1: Checks fetch error: 500 BAD REQUEST: "
+            "Something went wrong"
+        )
+        self.assertEqual(
+            log.output, [
+                f"ERROR:{LOGNAME}:tenant1: Checks fetch error: "
+                f"500 BAD REQUEST: Something went wrong"
+            ]
+        )
+        self.assertEqual(
+            self.sensu._get_checks(namespace="tenant1"), mock_checks
+        )
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(
+            mock_get.call_args_list[2],
+            call(
+                f"{self.url}checks", headers=self.headers, params={"limit": 2}
+            )
+        )
+
+    @patch("argo_scg.session.Session.get")
+    def test_get_single_event(self, mock_get):
+        mock_get.side_effect = mock_sensu_object_request(events=mock_events)
+        self.assertEqual(
+            self.sensu.get_event_output(
+                entity="gocdb.ni4os.eu", check="generic.tcp.connect",
+                namespace="tenant1"
+            ),
+            mock_events[1]["check"]["output"]
+        )
+        # single objects are not fetched in pages
+        mock_get.assert_called_once_with(
+            f"{self.url}events/gocdb.ni4os.eu/generic.tcp.connect",
+            headers=self.headers
+        )
+
+
+class SensuSelectorTests(unittest.TestCase):
+    def setUp(self):
+        self.sensu = Sensu(
+            url="https://sensu.mock.com:8080",
+            token="t0k3n",
+            namespaces={
+                "default": ["default"],
+                "tenant1": ["TENANT1"]
+            }
+        )
+        self.url = \
+            "https://sensu.mock.com:8080/api/core/v2/namespaces/tenant1/"
+        self.headers = {
+            "Authorization": "Key t0k3n",
+            "Content-Type": "application/json"
+        }
+
+    @patch("argo_scg.session.Session.get")
+    def test_fetch_events_for_checks(self, mock_get):
+        # objects are filtered also if the selector is ignored by the server
+        mock_get.return_value = MockResponse(mock_events, status_code=200)
+        self.assertEqual(
+            self.sensu._fetch_events(
+                namespace="tenant1", checks={
+                    "generic.tcp.connect", "generic.http.ar-argoui-ni4os"
+                }
+            ),
+            mock_events[:2]
+        )
+        self.assertEqual(
+            self.sensu._fetch_events(
+                namespace="tenant1", checks={"generic.tcp.connect"}
+            ),
+            [mock_events[1]]
+        )
+        mock_get.assert_has_calls([
+            call(
+                f"{self.url}events", headers=self.headers, params={
+                    "fieldSelector": "event.check.name in "
+                                     "[generic.http.ar-argoui-ni4os,"
+                                     "generic.tcp.connect]"
+                }
+            ),
+            call(
+                f"{self.url}events", headers=self.headers, params={
+                    "fieldSelector": "event.check.name in "
+                                     "[generic.tcp.connect]"
+                }
+            )
+        ])
+
+    @patch("argo_scg.session.Session.get")
+    def test_fetch_events_for_too_many_checks(self, mock_get):
+        mock_get.return_value = MockResponse(mock_events, status_code=200)
+        checks = {
+            f"check{i}" for i in range(SELECTOR_MAX_VALUES)
+        }.union({"generic.tcp.connect"})
+        self.assertEqual(
+            self.sensu._fetch_events(namespace="tenant1", checks=checks),
+            [mock_events[1]]
+        )
+        mock_get.assert_called_once_with(
+            f"{self.url}events", headers=self.headers
+        )
+
+    @patch("argo_scg.session.Session.get")
+    def test_entities_of_class_fetched_once(self, mock_get):
+        mock_get.return_value = MockResponse(mock_entities, status_code=200)
+        self.assertEqual(
+            self.sensu._get_proxy_entities(namespace="tenant1"),
+            mock_entities[:3]
+        )
+        self.assertEqual(
+            self.sensu._get_agents(namespace="tenant1"), mock_entities[3:]
+        )
+        self.assertEqual(
+            self.sensu._get_entities(namespace="tenant1"), mock_entities
+        )
+        mock_get.assert_called_once_with(
+            f"{self.url}entities", headers=self.headers
+        )
+
+    @patch("argo_scg.session.Session.get")
+    def test_entities_of_service_type_not_kept_in_snapshot(self, mock_get):
+        entities = copy.deepcopy(mock_entities)
+        entities[1]["metadata"]["labels"]["service"] = "argo.webui"
+        mock_get.side_effect = [
+            MockResponse(entities[1:2], status_code=200),
+            MockResponse(entities, status_code=200)
+        ]
+        self.assertEqual(
+            list(self.sensu._iter_entities(
+                namespace="tenant1", service_type="argo.webui"
+            )),
+            entities[1:2]
+        )
+        self.assertEqual(
+            self.sensu._get_entities(namespace="tenant1"), entities
+        )
+        self.assertEqual(
+            self.sensu._get_proxy_entities(namespace="tenant1"),
+            entities[:3]
+        )
+        self.assertEqual(mock_get.call_count, 2)
+        mock_get.assert_has_calls([
+            call(
+                f"{self.url}entities", headers=self.headers, params={
+                    "labelSelector": "service == argo.webui"
+                }
+            ),
+            call(f"{self.url}entities", headers=self.headers)
+        ])
+
+    @patch("argo_scg.session.Session.delete")
+    @patch("argo_scg.session.Session.patch")
+    @patch("argo_scg.session.Session.post")
+    @patch("argo_scg.session.Session.put")
+    @patch("argo_scg.session.Session.get")
+    def test_entities_fetched_once_per_sync(
+            self, mock_get, mock_put, mock_post, mock_patch, mock_delete
+    ):
+        mock_get.side_effect = mock_sensu_request
+        mock_put.side_effect = mock_post_response
+        mock_post.side_effect = mock_post_response
+        mock_patch.side_effect = mock_post_response
+        mock_delete.side_effect = mock_delete_response
+        with self.assertLogs(LOGNAME):
+            self.sensu.invalidate_snapshot(namespace="tenant1")
+            self.sensu.get_agents(namespace="tenant1")
+            self.sensu.handle_checks(checks=mock_checks, namespace="tenant1")
+            self.sensu.add_cpu_check(namespace="tenant1")
+            self.sensu.add_memory_check(namespace="tenant1")
+            self.sensu.handle_proxy_entities(
+                entities=mock_entities[:2], namespace="tenant1"
+            )
+            self.sensu.handle_agents(namespace="tenant1")
+
+        self.assertEqual([
+            item for item in mock_get.call_args_list
+            if item[0][0].endswith("entities")
+        ], [call(f"{self.url}entities", headers=self.headers)])
 
 class SensuCtlTests(unittest.TestCase):
     def setUp(self):
@@ -10548,6 +11929,11 @@ class SensuCtlTests(unittest.TestCase):
         mock_subprocess.return_value = \
             json.dumps(mock_events_ctl).encode("utf-8")
         events = self.sensuctl.filter_events(agent=True)
+        mock_subprocess.assert_called_once_with([
+            "sensuctl", "event", "list", "--format", "json", "--namespace",
+            "default", "--field-selector",
+            "event.entity.entity_class == agent"
+        ])
         self.assertEqual(
             events, [
                 "Entity                           "
@@ -10596,6 +11982,10 @@ class SensuCtlTests(unittest.TestCase):
         mock_subprocess.return_value = \
             json.dumps(mock_events_ctl).encode("utf-8")
         events = self.sensuctl.filter_events(status=1)
+        mock_subprocess.assert_called_once_with([
+            "sensuctl", "event", "list", "--format", "json", "--namespace",
+            "default", "--field-selector", "event.check.status == 1"
+        ])
         self.assertEqual(
             events, [
                 "Entity    Metric    Status    Executed             Output",
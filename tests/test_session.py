@@ -0,0 +1,117 @@
+import unittest
+from unittest.mock import patch
+
+import requests
+from argo_scg.session import Session, RequestStats, configure_session, \
+    get_session, _get_endpoint
+
+from utils import MockResponse
+
+
+class EndpointTests(unittest.TestCase):
+    def test_get_endpoint(self):
+        self.assertEqual(
+            _get_endpoint(
+                "get", "https://poem.mock.url/api/v2/metrics?format=json"
+            ),
+            "GET poem.mock.url/api/v2/metrics"
+        )
+
+    def test_get_endpoint_sensu_collection(self):
+        self.assertEqual(
+            _get_endpoint(
+                "get",
+                "https://sensu.mock.url:8080/api/core/v2/namespaces/tenant1/"
+                "checks"
+            ),
+            "GET sensu.mock.url:8080/api/core/v2/namespaces/tenant1/checks"
+        )
+
+    def test_get_endpoint_sensu_object(self):
+        self.assertEqual(
+            _get_endpoint(
+                "put",
+                "https://sensu.mock.url:8080/api/core/v2/namespaces/tenant1/"
+                "entities/argo.ni4os.eu~ARGO.WebUI"
+            ),
+            "PUT sensu.mock.url:8080/api/core/v2/namespaces/tenant1/entities/"
+            "{name}"
+        )
+        self.assertEqual(
+            _get_endpoint(
+                "delete",
+                "https://sensu.mock.url:8080/api/core/v2/namespaces/tenant1/"
+                "events/sensu-agent1/generic.tcp.connect"
+            ),
+            "DELETE sensu.mock.url:8080/api/core/v2/namespaces/tenant1/events/"
+            "{name}"
+        )
+
+
+class RequestStatsTests(unittest.TestCase):
+    def test_stats(self):
+        stats = RequestStats()
+        stats.add("GET sensu/checks", 0.5)
+        stats.add("PUT sensu/checks/{name}", 1.5)
+        stats.add("GET sensu/checks", 0.25)
+        self.assertEqual(
+            stats.get(), {
+                "PUT sensu/checks/{name}": {"count": 1, "time": 1.5},
+                "GET sensu/checks": {"count": 2, "time": 0.75}
+            }
+        )
+        self.assertEqual(
+            list(stats.get().keys()),
+            ["PUT sensu/checks/{name}", "GET sensu/checks"]
+        )
+        stats.reset()
+        self.assertEqual(stats.get(), {})
+
+
+class SessionTests(unittest.TestCase):
+    def test_adapter_configuration(self):
+        session = Session(
+            pool_size=20, timeout=30, retries=5, backoff_factor=1
+        )
+        adapter = session.get_adapter("https://sensu.mock.url")
+        self.assertEqual(adapter._pool_maxsize, 20)
+        self.assertEqual(adapter._pool_connections, 20)
+        self.assertEqual(adapter.max_retries.total, 5)
+        self.assertEqual(adapter.max_retries.backoff_factor, 1)
+        self.assertEqual(
+            sorted(adapter.max_retries.status_forcelist),
+            [429, 500, 502, 503, 504]
+        )
+        self.assertIs(adapter, session.get_adapter("http://sensu.mock.url"))
+
+    @patch("requests.Session.request")
+    def test_request(self, mock_request):
+        mock_request.return_value = MockResponse(None, status_code=200)
+        session = Session(timeout=30)
+        session.get("https://poem.mock.url/api/v2/metrics")
+        session.get("https://poem.mock.url/api/v2/metrics", timeout=5)
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(mock_request.call_args_list[0][1]["timeout"], 30)
+        self.assertEqual(mock_request.call_args_list[1][1]["timeout"], 5)
+        self.assertEqual(
+            session.stats.get()["GET poem.mock.url/api/v2/metrics"]["count"],
+            2
+        )
+
+    @patch("requests.Session.request")
+    def test_request_with_exception(self, mock_request):
+        mock_request.side_effect = requests.exceptions.ConnectionError
+        session = Session()
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            session.get("https://poem.mock.url/api/v2/metrics")
+
+        self.assertEqual(
+            session.stats.get()["GET poem.mock.url/api/v2/metrics"]["count"],
+            1
+        )
+
+    def test_shared_session(self):
+        session = configure_session(pool_size=5, timeout=10)
+        self.assertIs(get_session(), session)
+        self.assertEqual(session.timeout, 10)
+        self.assertIsNot(configure_session(), session)
@@ -0,0 +1,231 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from argo_scg.metric import MetricSpec
+from argo_scg.state import State, get_digest
+
+LOGNAME = "argo-scg.state"
+DUMMY_LOG = [f"INFO:{LOGNAME}:dummy"]
+
+output = {
+    "checks": [{
+        "command": "/usr/lib64/nagios/plugins/check_tcp "
+                   "-H {{ .labels.hostname }} -t 120 -p 443",
+        "subscriptions": ["argo.test"],
+        "handlers": [],
+        "interval": 300,
+        "timeout": 900,
+        "publish": True,
+        "metadata": {
+            "name": "generic.tcp.connect",
+            "namespace": "default",
+            "annotations": {"attempts": "3"},
+            "labels": {"tenants": "TENANT1"}
+        },
+        "round_robin": False
+    }],
+    "entities": [],
+    "internal_services": "argo.test",
+    "metric_overrides": [],
+    "attribute_overrides": []
+}
+
+
+def _log_dummy():
+    logger = logging.getLogger(LOGNAME)
+    logger.info("dummy")
+
+
+class DigestTests(unittest.TestCase):
+    def test_digest_independent_of_key_order(self):
+        self.assertEqual(
+            get_digest({"metrics": [1, 2], "topology": {"a": 1, "b": 2}}),
+            get_digest({"topology": {"b": 2, "a": 1}, "metrics": [1, 2]})
+        )
+
+    def test_digest_changes_with_data(self):
+        self.assertNotEqual(
+            get_digest({"metrics": [1, 2]}), get_digest({"metrics": [2, 1]})
+        )
+
+
+    def test_digest_with_metric_specs(self):
+        configuration = {
+            "tags": ["network", "tcp"],
+            "probe": "check_tcp",
+            "config": {"interval": "5", "maxCheckAttempts": "3"},
+            "flags": {"OBSESS": "1"},
+            "dependency": {},
+            "attribute": {},
+            "parameter": {"-p": "443"},
+            "file_parameter": {},
+            "file_attribute": {},
+            "parent": "",
+            "docurl": ""
+        }
+        self.assertEqual(
+            get_digest({"metrics": {
+                "generic.tcp.connect": MetricSpec(
+                    "generic.tcp.connect", configuration
+                )
+            }}),
+            get_digest({"metrics": {
+                "generic.tcp.connect": MetricSpec(
+                    "generic.tcp.connect", dict(configuration)
+                )
+            }})
+        )
+        with self.assertRaises(TypeError):
+            get_digest({"metrics": {object()}})
+
+
+class StateTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.state = State(directory=os.path.join(self.directory, "state"))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_get_nonexisting_state(self):
+        with self.assertLogs(LOGNAME) as log:
+            _log_dummy()
+            self.assertIsNone(self.state.get(tenant="TENANT1", digest="abc"))
+
+        self.assertEqual(log.output, DUMMY_LOG)
+
+    def test_store_and_get(self):
+        self.state.store(tenant="TENANT1", digest="abc", output=output)
+        self.assertEqual(
+            self.state.get(tenant="TENANT1", digest="abc"), output
+        )
+        self.assertIsNone(self.state.get(tenant="TENANT2", digest="abc"))
+        self.assertEqual(
+            os.listdir(os.path.join(self.directory, "state")),
+            ["TENANT1.json"]
+        )
+
+    def test_get_with_different_digest(self):
+        self.state.store(tenant="TENANT1", digest="abc", output=output)
+        self.assertIsNone(self.state.get(tenant="TENANT1", digest="def"))
+
+    def test_store_overwrites_state(self):
+        self.state.store(tenant="TENANT1", digest="abc", output=output)
+        self.state.store(tenant="TENANT1", digest="def", output={})
+        self.assertIsNone(self.state.get(tenant="TENANT1", digest="abc"))
+        self.assertEqual(self.state.get(tenant="TENANT1", digest="def"), {})
+
+    def test_get_corrupted_state(self):
+        os.makedirs(self.state.directory)
+        with open(os.path.join(self.state.directory, "TENANT1.json"), "w") \
+                as f:
+            f.write('{"digest": "abc", "output": ')
+
+        with self.assertLogs(LOGNAME) as log:
+            self.assertIsNone(self.state.get(tenant="TENANT1", digest="abc"))
+
+        self.assertEqual(len(log.output), 1)
+        self.assertTrue(
+            log.output[0].startswith(
+                f"WARNING:{LOGNAME}:TENANT1: Error reading stored state: "
+            )
+        )
+
+    def test_store_with_error(self):
+        with open(self.state.directory, "w") as f:
+            f.write("")
+
+        with self.assertLogs(LOGNAME) as log:
+            self.state.store(tenant="TENANT1", digest="abc", output=output)
+
+        self.assertEqual(len(log.output), 1)
+        self.assertTrue(
+            log.output[0].startswith(
+                f"WARNING:{LOGNAME}:TENANT1: Error storing state: "
+            )
+        )
+
+    def test_stored_file_content(self):
+        self.state.store(tenant="TENANT1", digest="abc", output=output)
+        with open(os.path.join(self.state.directory, "TENANT1.json")) as f:
+            self.assertEqual(
+                json.load(f), {"digest": "abc", "output": output}
+            )
+
+    def test_writer_with_streamed_output(self):
+        writer = self.state.writer(tenant="TENANT1", digest="abc")
+        checks = iter(output["checks"])
+        spooled = writer.spool({
+            "checks": checks,
+            "entities": iter(output["entities"]),
+            "internal_services": output["internal_services"],
+            "metric_overrides": output["metric_overrides"],
+            "attribute_overrides": output["attribute_overrides"]
+        })
+        self.assertEqual(list(checks), [])
+        self.assertEqual(list(spooled["checks"]), output["checks"])
+        self.assertIsNone(self.state.get(tenant="TENANT1", digest="abc"))
+        writer.commit()
+        self.assertEqual(
+            self.state.get(tenant="TENANT1", digest="abc"), output
+        )
+        self.assertEqual(
+            os.listdir(self.state.directory), ["TENANT1.json"]
+        )
+
+    def test_writer_closed_without_commit(self):
+        self.state.store(tenant="TENANT1", digest="abc", output=output)
+        writer = self.state.writer(tenant="TENANT1", digest="def")
+        spooled = writer.spool({
+            "checks": iter(output["checks"]), "entities": iter([])
+        })
+        next(spooled["checks"])
+        writer.close()
+        self.assertIsNone(self.state.get(tenant="TENANT1", digest="def"))
+        self.assertEqual(
+            self.state.get(tenant="TENANT1", digest="abc"), output
+        )
+        self.assertEqual(
+            os.listdir(self.state.directory), ["TENANT1.json"]
+        )
+
+    def test_writer_with_generation_error(self):
+        def generate():
+            yield output["checks"][0]
+            raise ValueError("Generation error")
+
+        self.state.store(tenant="TENANT1", digest="abc", output=output)
+        writer = self.state.writer(tenant="TENANT1", digest="def")
+        with self.assertRaises(ValueError) as context:
+            writer.spool({"checks": generate()})
+
+        writer.close()
+        self.assertEqual(context.exception.__str__(), "Generation error")
+        self.assertIsNone(self.state.get(tenant="TENANT1", digest="def"))
+        self.assertEqual(
+            self.state.get(tenant="TENANT1", digest="abc"), output
+        )
+        self.assertEqual(
+            os.listdir(self.state.directory), ["TENANT1.json"]
+        )
+
+    def test_writer_with_error(self):
+        with open(self.state.directory, "w") as f:
+            f.write("")
+
+        writer = self.state.writer(tenant="TENANT1", digest="abc")
+        with self.assertLogs(LOGNAME) as log:
+            spooled = writer.spool({"checks": iter(output["checks"])})
+            self.assertEqual(list(spooled["checks"]), output["checks"])
+            writer.commit()
+
+        self.assertEqual(len(log.output), 1)
+        self.assertTrue(
+            log.output[0].startswith(
+                f"WARNING:{LOGNAME}:TENANT1: Error storing state: "
+            )
+        )
@@ -406,7 +406,7 @@ class WebApiTests(unittest.TestCase):
         self.endpoints[5]["ngi"] = "GROUPNAME2"
         self.endpoints[6]["ngi"] = "GROUPNAME1"
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_metric_profiles(self, mock_request):
         mock_request.side_effect = mock_webapi_requests
         with self.assertLogs(self.logname) as log:
@@ -415,7 +415,7 @@ class WebApiTests(unittest.TestCase):
         self.assertEqual(data, mock_metric_profiles)
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_error_fetching_metricprofiles_with_msg(self, mock_get):
         mock_get.side_effect = mock_webapi_metricprofile_error_with_msg
         with self.assertRaises(WebApiException) as context:
@@ -435,7 +435,7 @@ class WebApiTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_error_fetching_metricprofiles_without_msg(self, mock_get):
         mock_get.side_effect = mock_webapi_metricprofile_error_without_msg
         with self.assertRaises(WebApiException) as context:
@@ -453,7 +453,7 @@ class WebApiTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_topology(self, mock_request):
         mock_request.side_effect = mock_webapi_requests
         with self.assertLogs(self.logname) as log:
@@ -462,7 +462,40 @@ class WebApiTests(unittest.TestCase):
         self.assertEqual(topology, self.endpoints)
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.get")
+    @patch("argo_scg.webapi.WebApi._get_topology_groups")
+    @patch("argo_scg.webapi.WebApi._get_topology_endpoints")
+    def test_get_topology_with_duplicated_and_missing_groups(
+            self, mock_endpoints, mock_groups
+    ):
+        mock_endpoints.return_value = [
+            {"group": "SITE1", "hostname": "host1.example.com"},
+            {"group": "SITE2", "hostname": "host2.example.com"},
+            {"group": "SITE3", "hostname": "host3.example.com"}
+        ]
+        mock_groups.return_value = [
+            {"group": "NGI1", "subgroup": "SITE1"},
+            {"group": "NGI2", "subgroup": "SITE2"},
+            {"group": "NGI3", "subgroup": "SITE1"}
+        ]
+        self.assertEqual(
+            self.webapi.get_topology(), [
+                {"group": "SITE1", "hostname": "host1.example.com",
+                 "ngi": "NGI1"},
+                {"group": "SITE2", "hostname": "host2.example.com",
+                 "ngi": "NGI2"},
+                {"group": "SITE3", "hostname": "host3.example.com", "ngi": ""}
+            ]
+        )
+        self.assertEqual(
+            self.webapi_filtered_groups.get_topology(), [
+                {"group": "SITE1", "hostname": "host1.example.com",
+                 "ngi": "NGI1"},
+                {"group": "SITE2", "hostname": "host2.example.com",
+                 "ngi": "NGI2"}
+            ]
+        )
+
+    @patch("argo_scg.session.Session.get")
     def test_error_fetching_topology_with_msg(self, mock_get):
         mock_get.side_effect = mock_webapi_requests_endpoints_error_with_msg
         with self.assertRaises(WebApiException) as context:
@@ -481,7 +514,7 @@ class WebApiTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_error_fetching_topology_without_msg(self, mock_get):
         mock_get.side_effect = mock_webapi_requests_endpoints_error_without_msg
         with self.assertRaises(WebApiException) as context:
@@ -499,7 +532,7 @@ class WebApiTests(unittest.TestCase):
             ]
         )
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_topology_with_groups_filter(self, mock_get):
         mock_get.side_effect = mock_webapi_requests
         with self.assertLogs(self.logname) as log:
@@ -532,7 +565,7 @@ class WebApiTests(unittest.TestCase):
         )
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_topology_with_endpoints_filter(self, mock_get):
         mock_get.side_effect = mock_webapi_requests
         with self.assertLogs(self.logname) as log:
@@ -560,7 +593,7 @@ class WebApiTests(unittest.TestCase):
         self.assertEqual(topology, self.endpoints[1:])
         self.assertEqual(log.output, DUMMY_LOG)
 
-    @patch("requests.get")
+    @patch("argo_scg.session.Session.get")
     def test_get_topology_with_groups_and_endpoints_filter(self, mock_get):
         mock_get.side_effect = mock_webapi_requests
         with self.assertLogs(self.logname) as log:
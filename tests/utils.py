@@ -1,12 +1,20 @@
+import json
+
+
 class MockResponse:
-    def __init__(self, data, status_code):
+    def __init__(self, data, status_code, headers=None):
         self.data = data
         self.status_code = status_code
+        self.headers = headers if headers else dict()
         self.reason = "BAD REQUEST"
         self.ok = False
         if str(status_code).startswith("2"):
             self.ok = True
             self.reason = "OK"
 
+    @property
+    def text(self):
+        return json.dumps(self.data)
+
     def json(self):
         return self.data